@@ -6,6 +6,9 @@ from setuptools import (
 )
 
 extras_require = {
+    'async': [
+        "aiohttp>=3.5.2,<4",
+    ],
     'tester': [
         "eth-tester[py-evm]==v0.2.0-beta.2",
         "py-geth>=2.2.0,<3",
@@ -51,6 +54,7 @@ extras_require = {
 }
 
 extras_require['dev'] = (
+    extras_require['async'] +
     extras_require['tester'] +
     extras_require['linter'] +
     extras_require['docs'] +
@@ -69,6 +73,7 @@ setup(
     include_package_data=True,
     install_requires=[
         "content-hash>=1.0.0,<2.0.0",
+        "contextvars>=2.4,<3;python_version<'3.7'",
         "eth-abi>=2.0.0b6,<3.0.0",
         "eth-account>=0.4.0,<0.5.0",
         "eth-hash[pycryptodome]>=0.2.0,<1.0.0",
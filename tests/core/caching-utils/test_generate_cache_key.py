@@ -1,14 +1,19 @@
+import pytest
 import random
 
 from eth_utils import (
     to_dict,
 )
+from hexbytes import (
+    HexBytes,
+)
 from hypothesis import (
     given,
     strategies as st,
 )
 
 from web3._utils.caching import (
+    generate_cache_digest,
     generate_cache_key,
 )
 
@@ -22,14 +27,22 @@ def shuffle_dict(_dict):
 
 
 def extend_fn(children):
-    lists_st = st.lists(children)
-    dicts_st = st.dictionaries(st.text(), children)
+    lists_st = st.lists(children, max_size=4)
+    dicts_st = st.dictionaries(st.text(max_size=8), children, max_size=4)
     return lists_st | dicts_st
 
 
 all_st = st.recursive(
-    st.none() | st.integers() | st.booleans() | st.floats() | st.text() | st.binary(),
+    (
+        st.none() |
+        st.integers() |
+        st.booleans() |
+        st.floats() |
+        st.text(max_size=16) |
+        st.binary(max_size=16)
+    ),
     extend_fn,
+    max_leaves=10,
 )
 
 
@@ -49,3 +62,28 @@ def test_key_generation_is_deterministic(value):
     left_key = generate_cache_key(left)
     right_key = generate_cache_key(right)
     assert left_key == right_key
+    # keys are looked up in dict caches
+    assert hash(left_key) == hash(right_key)
+    assert generate_cache_digest(left) == generate_cache_digest(right)
+
+
+@pytest.mark.parametrize(
+    'left,right',
+    (
+        (1, True),
+        (0, False),
+        (1, 1.0),
+        (1, '1'),
+        ('0x01', b'\x01'),
+        ([1, 2], [2, 1]),
+        ([['a', 1]], {'a': 1}),
+    ),
+)
+def test_different_values_have_different_keys(left, right):
+    assert generate_cache_key(left) != generate_cache_key(right)
+    assert generate_cache_digest(left) != generate_cache_digest(right)
+
+
+def test_subclasses_have_the_keys_of_their_base_types():
+    assert generate_cache_key([HexBytes(b'\x01')]) == generate_cache_key([b'\x01'])
+    assert generate_cache_digest([HexBytes(b'\x01')]) == generate_cache_digest([b'\x01'])
@@ -0,0 +1,93 @@
+import pytest
+import threading
+import time
+
+from web3._utils.caching import (
+    ShardedCache,
+)
+
+
+@pytest.mark.parametrize('shard_count', (1, 4))
+def test_sharded_cache(shard_count):
+    cache = ShardedCache(dict, shard_count)
+    for key in range(10):
+        cache[('key', key)] = key
+
+    assert len(cache) == 10
+    assert sorted(cache) == [('key', key) for key in range(10)]
+    assert ('key', 3) in cache
+    assert cache[('key', 3)] == 3
+
+    del cache[('key', 3)]
+    assert ('key', 3) not in cache
+    assert cache.get(('key', 3)) is None
+    with pytest.raises(KeyError):
+        cache[('key', 3)]
+    with pytest.raises(KeyError):
+        del cache[('key', 3)]
+    assert len(cache) == 9
+
+
+def test_sharded_cache_makes_each_shard_with_the_cache_class():
+    shards = []
+
+    def cache_class():
+        shards.append({})
+        return shards[-1]
+
+    cache = ShardedCache(cache_class, 4)
+    for key in range(100):
+        cache[key] = key
+
+    assert len(shards) == 4
+    assert sum(len(shard) for shard in shards) == 100
+    assert all(shards)
+
+
+def test_sharded_cache_rejects_no_shards():
+    with pytest.raises(ValueError):
+        ShardedCache(dict, 0)
+
+
+class SlowDict(dict):
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        time.sleep(0.001)
+        return value
+
+
+def test_sharded_cache_pops_expired_entries_once():
+    cache = ShardedCache(SlowDict, 1)
+    for _ in range(20):
+        cache['key'] = 'value'
+        barrier = threading.Barrier(8)
+        popped = []
+        errors = []
+
+        def pop():
+            barrier.wait()
+            try:
+                popped.append(cache.pop('key', None))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=pop) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert sorted(popped, key=str) == [None] * 7 + ['value']
+
+
+def test_sharded_cache_get_pop_and_setdefault():
+    cache = ShardedCache(dict, 4)
+    assert cache.setdefault('key', 1) == 1
+    assert cache.setdefault('key', 2) == 1
+    assert cache.get('key') == 1
+    assert cache.get('missing', 3) == 3
+    assert cache.pop('key') == 1
+    assert cache.pop('key', None) is None
+    with pytest.raises(KeyError):
+        cache.pop('key')
@@ -0,0 +1,190 @@
+import asyncio
+import pytest
+import threading
+
+from web3 import Web3
+from web3.providers import (
+    BaseProvider,
+)
+
+
+def make_response(index, method, params):
+    return {'jsonrpc': '2.0', 'id': index, 'result': '{0}:{1}'.format(method, params[0])}
+
+
+class RecordingProvider(BaseProvider):
+    def __init__(self):
+        self.requests = []
+        self.batches = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        return make_response(0, method, params)
+
+    def make_batch_request(self, requests):
+        self.batches.append(requests)
+        return [
+            make_response(index, method, params)
+            for index, (method, params) in enumerate(requests)
+        ]
+
+
+class AsyncRecordingProvider(RecordingProvider):
+    async def make_request(self, method, params):
+        return super().make_request(method, params)
+
+    async def make_batch_request(self, requests):
+        return super().make_batch_request(requests)
+
+
+class AsyncUnbatchedProvider(BaseProvider):
+    """
+    An async provider inheriting the synchronous batch request of BaseProvider.
+    """
+    def __init__(self):
+        self.requests = []
+
+    async def make_request(self, method, params):
+        self.requests.append((method, params))
+        await asyncio.sleep(0.01)
+        if params[0] < 0:
+            raise ValueError("negative")
+        return make_response(0, method, params)
+
+
+def tag_middleware(make_request, web3):
+    def middleware(method, params):
+        return dict(make_request(method, params), tagged=True)
+    return middleware
+
+
+def run_in_threads(fn, count):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def target(index):
+        barrier.wait()
+        results[index] = fn(index)
+
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.fixture
+def provider():
+    return RecordingProvider()
+
+
+@pytest.fixture
+def w3(provider):
+    w3 = Web3(provider, middlewares=[])
+    w3.manager.enable_micro_batching(max_wait=0.5)
+    return w3
+
+
+def test_concurrent_requests_are_batched(w3, provider):
+    results = run_in_threads(
+        lambda index: w3.manager.request_blocking('test_method', [index]), 8,
+    )
+
+    assert results == ['test_method:{0}'.format(index) for index in range(8)]
+    assert provider.requests == []
+    assert len(provider.batches) == 1
+    assert sorted(params[0] for _, params in provider.batches[0]) == list(range(8))
+
+
+def test_full_batches_are_sent_without_waiting(provider):
+    w3 = Web3(provider, middlewares=[])
+    w3.manager.enable_micro_batching(max_wait=60, max_batch_size=4)
+
+    results = run_in_threads(
+        lambda index: w3.manager.request_blocking('test_method', [index]), 8,
+    )
+
+    assert results == ['test_method:{0}'.format(index) for index in range(8)]
+    assert [len(batch) for batch in provider.batches] == [4, 4]
+
+
+def test_lone_request_is_sent_on_its_own(w3, provider):
+    assert w3.manager.request_blocking('test_method', [1]) == 'test_method:1'
+    assert provider.requests == [('test_method', [1])]
+    assert provider.batches == []
+
+
+def test_middlewares_run_for_each_request(provider):
+    w3 = Web3(provider, middlewares=[tag_middleware])
+    w3.manager.enable_micro_batching(max_wait=0.5)
+
+    responses = run_in_threads(
+        lambda index: w3.manager._make_request('test_method', [index]), 3,
+    )
+    assert all(response['tagged'] for response in responses)
+    assert len(provider.batches) == 1
+
+
+def test_batch_errors_are_raised_in_every_caller(w3, provider):
+    def make_batch_request(requests):
+        raise ConnectionError('node is down')
+    provider.make_batch_request = make_batch_request
+
+    def request(index):
+        try:
+            w3.manager.request_blocking('test_method', [index])
+        except ConnectionError as exc:
+            return exc
+
+    results = run_in_threads(request, 3)
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+def test_disable_micro_batching(w3, provider):
+    assert w3.manager.micro_batching
+    w3.manager.disable_micro_batching()
+    assert not w3.manager.micro_batching
+
+    run_in_threads(lambda index: w3.manager.request_blocking('test_method', [index]), 3)
+    assert len(provider.requests) == 3
+    assert provider.batches == []
+
+
+@pytest.mark.parametrize('kwargs', ({'max_wait': -1}, {'max_batch_size': 0}))
+def test_invalid_settings(w3, kwargs):
+    with pytest.raises(ValueError):
+        w3.manager.enable_micro_batching(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_coroutine_requests_are_batched():
+    provider = AsyncRecordingProvider()
+    w3 = Web3(provider, middlewares=[])
+    w3.manager.enable_micro_batching(max_wait=0.01, max_batch_size=5)
+
+    results = await asyncio.gather(*(
+        w3.manager.coro_request('test_method', [index]) for index in range(8)
+    ))
+
+    assert results == ['test_method:{0}'.format(index) for index in range(8)]
+    assert [len(batch) for batch in provider.batches] == [5, 3]
+
+    assert await w3.manager.coro_request('test_method', [1]) == 'test_method:1'
+    assert provider.requests == [('test_method', [1])]
+
+
+@pytest.mark.asyncio
+async def test_coroutine_requests_without_async_batch_request():
+    provider = AsyncUnbatchedProvider()
+    w3 = Web3(provider, middlewares=[])
+    w3.manager.enable_micro_batching(max_wait=0.01, max_batch_size=5)
+
+    results = await asyncio.gather(*(
+        w3.manager.coro_request('test_method', [index]) for index in (0, 1, -1, 2)
+    ), return_exceptions=True)
+
+    assert results[:2] == ['test_method:0', 'test_method:1']
+    assert isinstance(results[2], ValueError)
+    assert results[3] == 'test_method:2'
+    assert sorted(params[0] for _, params in provider.requests) == [-1, 0, 1, 2]
@@ -0,0 +1,183 @@
+import asyncio
+import pytest
+import time
+
+from web3 import Web3
+from web3._utils.profiling import (
+    PROVIDER_LAYER,
+    MiddlewareProfiler,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+
+class SlowProvider(BaseProvider):
+    def make_request(self, method, params):
+        time.sleep(0.02)
+        if method == 'fail':
+            raise ConnectionError('node is down')
+        return {'jsonrpc': '2.0', 'id': 0, 'result': '0x1'}
+
+
+class AsyncSlowProvider(BaseProvider):
+    async def make_request(self, method, params):
+        await asyncio.sleep(0.02)
+        return {'jsonrpc': '2.0', 'id': 0, 'result': '0x1'}
+
+
+def sleeping_middleware(delay):
+    def middleware_factory(make_request, web3):
+        def middleware(method, params):
+            time.sleep(delay)
+            return make_request(method, params)
+        return middleware
+    return middleware_factory
+
+
+def passthrough_middleware(make_request, web3):
+    def middleware(method, params):
+        return make_request(method, params)
+    return middleware
+
+
+def async_sleeping_middleware(make_request, web3):
+    async def middleware(method, params):
+        await asyncio.sleep(0.01)
+        return await make_request(method, params)
+    return middleware
+
+
+@pytest.fixture
+def w3():
+    return Web3(SlowProvider(), middlewares=[
+        (sleeping_middleware(0.01), 'outer'),
+        (sleeping_middleware(0.03), 'inner'),
+    ])
+
+
+def test_profiling_is_off_by_default(w3):
+    assert w3.manager.profiler is None
+    assert w3.manager.request_blocking('eth_chainId', []) == '0x1'
+
+
+def test_layers_are_timed_per_method(w3):
+    profiler = w3.manager.enable_middleware_profiling()
+    for _ in range(2):
+        w3.manager.request_blocking('eth_chainId', [])
+    w3.manager.request_blocking('net_version', [])
+
+    snapshot = profiler.snapshot()
+    assert set(snapshot) == {'eth_chainId', 'net_version'}
+
+    chain_id = snapshot['eth_chainId']
+    assert set(chain_id) == {'outer', 'inner', PROVIDER_LAYER}
+    assert all(layer['calls'] == 2 for layer in chain_id.values())
+
+    outer, inner, provider = chain_id['outer'], chain_id['inner'], chain_id[PROVIDER_LAYER]
+    assert outer['inclusive'] > inner['inclusive'] > provider['inclusive']
+    assert outer['exclusive'] >= 0.02
+    assert inner['exclusive'] >= 0.06
+    assert inner['exclusive'] > outer['exclusive']
+    assert provider['exclusive'] == provider['inclusive'] >= 0.04
+    assert outer['inclusive'] == pytest.approx(
+        outer['exclusive'] + inner['exclusive'] + provider['exclusive']
+    )
+
+
+def test_errors_are_timed(w3):
+    profiler = w3.manager.enable_middleware_profiling()
+    with pytest.raises(ConnectionError):
+        w3.manager.request_blocking('fail', [])
+    assert profiler.snapshot()['fail'][PROVIDER_LAYER]['calls'] == 1
+
+
+def test_unnamed_and_provider_middlewares():
+    provider = SlowProvider()
+    provider.middlewares = [passthrough_middleware]
+    w3 = Web3(provider, middlewares=[sleeping_middleware(0)])
+    profiler = w3.manager.enable_middleware_profiling()
+    w3.manager.request_blocking('eth_chainId', [])
+
+    assert set(profiler.snapshot()['eth_chainId']) == {
+        'middleware_factory', 'passthrough_middleware', PROVIDER_LAYER,
+    }
+
+
+def test_most_expensive_layers():
+    # the slow layer sleeps ten times as long as the provider, and sleeps never
+    # end early, so it ranks first however busy the machine is
+    w3 = Web3(SlowProvider(), middlewares=[
+        (passthrough_middleware, 'fast'),
+        (sleeping_middleware(0.2), 'slow'),
+    ])
+    profiler = w3.manager.enable_middleware_profiling()
+    w3.manager.request_blocking('eth_chainId', [])
+    w3.manager.request_blocking('net_version', [])
+
+    layers = profiler.most_expensive()
+    assert layers[0][0] == 'slow'
+    assert {layer for layer, _ in layers} == {'slow', PROVIDER_LAYER, 'fast'}
+    exclusive_times = [stats['exclusive'] for _, stats in layers]
+    assert exclusive_times == sorted(exclusive_times, reverse=True)
+    assert all(stats['calls'] == 2 for _, stats in layers)
+    assert [layer for layer, _ in profiler.most_expensive(limit=1, method='net_version')] == [
+        'slow'
+    ]
+
+    report = profiler.report(limit=2).splitlines()
+    assert report[0].split()[:2] == ['layer', 'calls']
+    assert [line.split()[0] for line in report[2:]] == [layer for layer, _ in layers[:2]]
+    assert report[2].split()[0] == 'slow'
+
+
+def test_nested_requests_are_not_counted_twice():
+    def nested_middleware(make_request, web3):
+        def middleware(method, params):
+            if method == 'outer':
+                web3.manager.request_blocking('inner', [])
+            return make_request(method, params)
+        return middleware
+
+    w3 = Web3(SlowProvider(), middlewares=[(nested_middleware, 'nested')])
+    profiler = w3.manager.enable_middleware_profiling()
+    w3.manager.request_blocking('outer', [])
+
+    snapshot = profiler.snapshot()
+    assert snapshot['inner']['nested']['calls'] == 1
+    assert snapshot['outer']['nested']['exclusive'] < snapshot['inner'][PROVIDER_LAYER]['exclusive']
+
+
+def test_disable_middleware_profiling(w3):
+    profiler = w3.manager.enable_middleware_profiling()
+    w3.manager.disable_middleware_profiling()
+    w3.manager.request_blocking('eth_chainId', [])
+    assert profiler.snapshot() == {}
+
+
+def test_profiling_with_metrics(w3):
+    profiler = w3.manager.enable_middleware_profiling(MiddlewareProfiler())
+    metrics = w3.manager.enable_metrics()
+    w3.manager.request_blocking('eth_chainId', [])
+
+    assert profiler.snapshot()['eth_chainId'][PROVIDER_LAYER]['calls'] == 1
+    assert metrics.snapshot()['eth_chainId']['requests'] == 1
+
+    profiler.reset()
+    assert profiler.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_coroutine_layers_are_timed():
+    w3 = Web3(AsyncSlowProvider(), middlewares=[
+        (async_sleeping_middleware, 'sleeping'),
+        (passthrough_middleware, 'passthrough'),
+    ])
+    profiler = w3.manager.enable_middleware_profiling()
+    await asyncio.gather(*(w3.manager.coro_request('eth_chainId', []) for _ in range(3)))
+
+    chain_id = profiler.snapshot()['eth_chainId']
+    assert chain_id['sleeping']['calls'] == 3
+    assert chain_id['sleeping']['exclusive'] >= 0.03
+    assert chain_id['passthrough']['exclusive'] < chain_id['sleeping']['exclusive']
+    assert chain_id[PROVIDER_LAYER]['exclusive'] >= 0.06
@@ -0,0 +1,184 @@
+import asyncio
+import pytest
+
+from web3 import Web3
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.middleware import (
+    construct_latest_block_based_cache_middleware,
+    get_raw_middlewares,
+    pythonic_middleware,
+    record_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+BLOCK = {
+    'hash': '0x' + '11' * 32,
+    'miner': '0x' + '22' * 20,
+    'number': '0x7b',
+    'transactions': [],
+    'uncles': [],
+}
+
+
+class RecordingProvider(BaseProvider):
+    def __init__(self):
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        return {'jsonrpc': '2.0', 'id': 0, 'result': dict(BLOCK)}
+
+
+class AsyncRecordingProvider(RecordingProvider):
+    async def make_request(self, method, params):
+        return super().make_request(method, params)
+
+
+@pytest.fixture
+def w3():
+    return Web3(RecordingProvider())
+
+
+def test_raw_results_skip_result_formatting(w3):
+    with w3.raw_results():
+        assert w3.manager.returning_raw_results
+        block = w3.eth.getBlock(123)
+
+    assert type(block) is dict
+    assert block == BLOCK
+    # requests are still formatted
+    assert w3.provider.requests[-1] == ('eth_getBlockByNumber', ['0x7b', False])
+
+    assert not w3.manager.returning_raw_results
+    block = w3.eth.getBlock(123)
+    assert isinstance(block, AttributeDict)
+    assert block.number == 123
+
+
+def test_raw_results_are_scoped_to_the_manager(w3):
+    other_w3 = Web3(RecordingProvider())
+    with w3.raw_results():
+        assert isinstance(other_w3.eth.getBlock(123), AttributeDict)
+
+
+def test_raw_results_do_not_share_pipelines_between_managers(w3):
+    built = []
+
+    def counting_middleware(make_request, w3):
+        def middleware(method, params):
+            middleware.requests += 1
+            return make_request(method, params)
+        middleware.requests = 0
+        built.append((w3, middleware))
+        return middleware
+
+    w3_a = Web3(w3.provider, middlewares=[counting_middleware])
+    w3_b = Web3(w3.provider, middlewares=[counting_middleware])
+    for _ in range(2):
+        for each_w3 in (w3_a, w3_b):
+            with each_w3.raw_results():
+                each_w3.manager.request_blocking('eth_getBlockByNumber', ['0x7b', False])
+
+    assert w3_a.manager._request_funcs.keys() == w3_b.manager._request_funcs.keys()
+    # each manager built its pipeline once, rather than replacing the other's
+    assert [(built_w3, middleware.requests) for built_w3, middleware in built] == [
+        (w3_a, 2), (w3_b, 2),
+    ]
+
+
+class ChainProvider(BaseProvider):
+    def make_request(self, method, params):
+        if method == 'eth_call':
+            result = '0x' + '00' * 31 + '2a'
+        elif method == 'eth_getBlockByNumber':
+            result = dict(BLOCK, timestamp='0x5e000000')
+            if params[0] != 'latest':
+                result['number'] = params[0]
+        else:
+            result = '0x1'
+        return {'jsonrpc': '2.0', 'id': 0, 'result': result}
+
+
+def test_raw_results_only_apply_to_the_call_made():
+    w3 = Web3(ChainProvider())
+    w3.middleware_onion.add(construct_latest_block_based_cache_middleware(
+        cache_class=dict,
+        rpc_whitelist={'eth_getBalance', 'eth_call'},
+    ))
+    contract = w3.eth.contract(address='0x' + '33' * 20, abi=[{
+        'constant': True,
+        'inputs': [],
+        'name': 'answer',
+        'outputs': [{'name': '', 'type': 'uint256'}],
+        'payable': False,
+        'stateMutability': 'view',
+        'type': 'function',
+    }])
+
+    with w3.raw_results():
+        # the middleware gets the latest block with formatted results
+        assert w3.eth.getBalance('0x' + '22' * 20) == '0x1'
+        # contract calls decode the formatted return value
+        assert contract.functions.answer().call() == 42
+        assert w3.eth.getBlock('latest')['number'] == '0x7b'
+
+    # and the block it keeps stays formatted for the requests after
+    assert w3.eth.getBalance('0x' + '22' * 20) == 1
+    assert w3.eth.getBlock('latest')['number'] == 123
+
+
+def test_raw_results_with_metrics_and_profiling(w3):
+    w3.manager.enable_metrics()
+    profiler = w3.manager.enable_middleware_profiling()
+    with w3.raw_results():
+        assert type(w3.eth.getBlock(123)) is dict
+    assert 'attrdict' not in profiler.snapshot()['eth_getBlockByNumber']
+
+    assert isinstance(w3.eth.getBlock(123), AttributeDict)
+    assert 'attrdict' in profiler.snapshot()['eth_getBlockByNumber']
+
+
+def test_raw_results_in_batches(w3):
+    with w3.raw_results():
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.getBlock, 123)
+            batch.add(w3.eth.getBlock, 124)
+            blocks = batch.execute()
+    assert blocks == [BLOCK, BLOCK]
+    assert all(type(block) is dict for block in blocks)
+
+
+def test_raw_results_in_coroutines():
+    def async_attrdict_middleware(make_request, w3):
+        async def middleware(method, params):
+            response = await make_request(method, params)
+            return dict(response, result=AttributeDict.recursive(response['result']))
+        return middleware
+    async_attrdict_middleware.raw_middleware = None
+
+    w3 = Web3(AsyncRecordingProvider(), middlewares=[async_attrdict_middleware])
+
+    async def get_blocks():
+        with w3.raw_results():
+            raw = await w3.manager.coro_request('eth_getBlockByNumber', ['0x7b', False])
+        formatted = await w3.manager.coro_request('eth_getBlockByNumber', ['0x7b', False])
+        return raw, formatted
+
+    raw, formatted = asyncio.get_event_loop().run_until_complete(get_blocks())
+    assert type(raw) is dict
+    assert isinstance(formatted, AttributeDict)
+
+
+def test_get_raw_middlewares():
+    def custom_middleware(make_request, w3):
+        return make_request
+
+    raw_middlewares = get_raw_middlewares([
+        record_middleware, pythonic_middleware, custom_middleware,
+    ])
+    assert raw_middlewares[0] is not pythonic_middleware
+    assert raw_middlewares[1:] == [custom_middleware]
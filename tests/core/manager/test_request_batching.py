@@ -0,0 +1,149 @@
+import json
+import pytest
+
+from web3 import Web3
+from web3.providers import (
+    BaseProvider,
+    JSONBaseProvider,
+)
+
+
+class BatchRecordingProvider(BaseProvider):
+    def __init__(self):
+        self.batches = []
+
+    def make_request(self, method, params):
+        raise AssertionError("Requests inside a batch must go through make_batch_request")
+
+    def make_batch_request(self, requests):
+        self.batches.append(requests)
+        return [
+            {'jsonrpc': '2.0', 'id': index, 'result': '{0}:{1}'.format(method, params[0])}
+            if params else
+            {'jsonrpc': '2.0', 'id': index, 'error': {'code': -32000, 'message': 'no params'}}
+            for index, (method, params) in enumerate(requests)
+        ]
+
+
+def tag_middleware(make_request, web3):
+    def middleware(method, params):
+        response = make_request(method, params)
+        if 'result' in response:
+            return dict(response, result=response['result'] + '|tagged')
+        return response
+    return middleware
+
+
+@pytest.fixture
+def provider():
+    return BatchRecordingProvider()
+
+
+@pytest.fixture
+def w3(provider):
+    return Web3(provider, middlewares=[tag_middleware])
+
+
+def test_batch_sends_requests_in_one_round_trip(w3, provider):
+    with w3.batch_requests() as batch:
+        for value in range(5):
+            batch.add(w3.manager.request_blocking, 'test_method', [value])
+        results = batch.execute()
+
+    assert len(provider.batches) == 1
+    assert sorted(params[0] for _, params in provider.batches[0]) == list(range(5))
+    assert results == ['test_method:{0}|tagged'.format(value) for value in range(5)]
+
+
+def test_batch_calls_making_several_requests(w3, provider):
+    def two_requests(value):
+        first = w3.manager.request_blocking('first', [value])
+        return first, w3.manager.request_blocking('second', [value])
+
+    with w3.batch_requests() as batch:
+        batch.add(two_requests, 1)
+        batch.add(two_requests, 2)
+        results = batch.execute()
+
+    assert len(provider.batches) == 2
+    assert results == [
+        ('first:1|tagged', 'second:1|tagged'),
+        ('first:2|tagged', 'second:2|tagged'),
+    ]
+
+
+def test_batch_reraises_errors(w3, provider):
+    with w3.batch_requests() as batch:
+        batch.add(w3.manager.request_blocking, 'test_method', [1])
+        batch.add(w3.manager.request_blocking, 'test_method', [])
+        with pytest.raises(ValueError, match='no params'):
+            batch.execute()
+
+    assert len(provider.batches) == 1
+
+
+def test_batches_share_the_request_pipeline(provider):
+    builds = []
+
+    def counting_middleware(make_request, web3):
+        builds.append(make_request)
+        return make_request
+
+    w3 = Web3(provider, middlewares=[counting_middleware])
+    metrics = w3.manager.enable_metrics()
+    for _ in range(2):
+        with w3.batch_requests() as batch:
+            batch.add(w3.manager.request_blocking, 'test_method', [1])
+            batch.add(w3.manager.request_blocking, 'test_method', [2])
+            batch.execute()
+
+    assert len(provider.batches) == 2
+    assert len(builds) == 1
+    assert metrics.snapshot()['test_method']['requests'] == 4
+
+
+def test_batch_responses_without_id_are_rejected():
+    with pytest.raises(ValueError, match='Invalid Request'):
+        JSONBaseProvider().decode_batch_rpc_response(
+            b'[{"jsonrpc": "2.0", "id": 0, "result": "a"}, {"jsonrpc": "2.0", "id": null, "error": {"code": -32600, "message": "Invalid Request"}}]'  # noqa: E501
+        )
+
+
+def test_empty_batch_makes_no_requests(w3, provider):
+    with w3.batch_requests() as batch:
+        assert batch.execute() == []
+    assert provider.batches == []
+
+
+def test_requests_outside_of_batch_are_unaffected(w3):
+    w3.provider.make_request = lambda method, params: {'result': 'single'}
+    assert w3.manager.request_blocking('test_method', []) == 'single|tagged'
+
+
+def test_base_provider_batch_falls_back_to_single_requests():
+    class EchoProvider(BaseProvider):
+        def make_request(self, method, params):
+            return {'result': method}
+
+    responses = EchoProvider().make_batch_request([('a', []), ('b', [])])
+    assert responses == [{'result': 'a'}, {'result': 'b'}]
+
+
+def test_json_provider_batch_encoding_and_decoding():
+    provider = JSONBaseProvider()
+    encoded = json.loads(provider.encode_batch_rpc_request([('a', [1]), ('b', None)]))
+    assert encoded == [
+        {'jsonrpc': '2.0', 'method': 'a', 'params': [1], 'id': 0},
+        {'jsonrpc': '2.0', 'method': 'b', 'params': [], 'id': 1},
+    ]
+
+    raw_response = b'[{"jsonrpc": "2.0", "id": 1, "result": "b"}, {"jsonrpc": "2.0", "id": 0, "result": "a"}]'  # noqa: E501
+    assert provider.decode_batch_rpc_response(raw_response) == [
+        {'jsonrpc': '2.0', 'id': 0, 'result': 'a'},
+        {'jsonrpc': '2.0', 'id': 1, 'result': 'b'},
+    ]
+
+    with pytest.raises(ValueError, match='Invalid Request'):
+        provider.decode_batch_rpc_response(
+            b'{"jsonrpc": "2.0", "id": null, "error": {"code": -32600, "message": "Invalid Request"}}'  # noqa: E501
+        )
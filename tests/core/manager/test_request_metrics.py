@@ -0,0 +1,209 @@
+import asyncio
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import json
+import pytest
+import time
+
+from web3 import Web3
+from web3._utils.metrics import (
+    LatencyHistogram,
+    MetricsRegistry,
+)
+from web3.providers import (
+    JSONBaseProvider,
+)
+
+
+class EchoProvider(JSONBaseProvider):
+    delay = 0.02
+
+    def make_request(self, method, params):
+        request = self.encode_rpc_request(method, params)
+        time.sleep(self.delay)
+        if method == 'fail':
+            raise ConnectionError('node is down')
+        if method == 'error':
+            response = {'jsonrpc': '2.0', 'id': 0, 'error': {'code': -1, 'message': 'bad'}}
+        else:
+            response = {'jsonrpc': '2.0', 'id': 0, 'result': 'x' * 100}
+        assert len(request) > 0
+        return self.decode_rpc_response(json.dumps(response).encode())
+
+
+class AsyncEchoProvider(JSONBaseProvider):
+    async def make_request(self, method, params):
+        self.encode_rpc_request(method, params)
+        await asyncio.sleep(0.01)
+        return self.decode_rpc_response(b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}')
+
+
+def slow_middleware(make_request, web3):
+    def middleware(method, params):
+        time.sleep(0.02)
+        return make_request(method, params)
+    return middleware
+
+
+@pytest.fixture
+def w3():
+    return Web3(EchoProvider(), middlewares=[slow_middleware])
+
+
+def test_metrics_are_off_by_default(w3):
+    assert w3.manager.metrics is None
+    w3.manager.request_blocking('eth_chainId', [])
+
+
+def test_metrics_per_method(w3):
+    metrics = w3.manager.enable_metrics()
+    for _ in range(3):
+        w3.manager.request_blocking('eth_chainId', [])
+    with pytest.raises(ValueError):
+        w3.manager.request_blocking('error', [])
+    with pytest.raises(ConnectionError):
+        w3.manager.request_blocking('fail', [])
+
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {'eth_chainId', 'error', 'fail'}
+
+    chain_id = snapshot['eth_chainId']
+    assert chain_id['requests'] == 3
+    assert chain_id['errors'] == 0
+    assert chain_id['bytes_sent'] == 3 * len(
+        w3.provider.encode_rpc_request('eth_chainId', [])
+    )
+    assert chain_id['bytes_received'] == 3 * len(
+        json.dumps({'jsonrpc': '2.0', 'id': 0, 'result': 'x' * 100})
+    )
+
+    latency = chain_id['latency']
+    assert latency['count'] == 3
+    assert latency['min'] >= 0.04
+    assert latency['buckets'][float('inf')] == 3
+    assert chain_id['provider_latency']['min'] >= 0.02
+    assert chain_id['middleware_latency']['min'] >= 0.02
+    assert chain_id['provider_latency']['max'] < latency['min']
+
+    assert snapshot['error']['requests'] == snapshot['error']['errors'] == 1
+    assert snapshot['fail']['requests'] == snapshot['fail']['errors'] == 1
+
+
+def test_metrics_exporters(w3):
+    samples = []
+    metrics = w3.manager.enable_metrics(MetricsRegistry(exporters=[samples.append]))
+    w3.manager.request_blocking('eth_chainId', [])
+
+    sample, = samples
+    assert sample.method == 'eth_chainId'
+    assert sample.error is False
+    assert sample.duration > sample.provider_duration > 0
+    assert sample.bytes_sent > 0
+
+    metrics.remove_exporter(samples.append)
+    w3.manager.request_blocking('eth_chainId', [])
+    assert len(samples) == 1
+
+
+def test_failing_exporters_do_not_replace_the_response(w3, caplog):
+    def failing_exporter(sample):
+        raise RuntimeError('exporter is down')
+
+    w3.manager.enable_metrics(MetricsRegistry(exporters=[failing_exporter]))
+    assert w3.manager.request_blocking('eth_chainId', []) == 'x' * 100
+    with pytest.raises(ConnectionError):
+        w3.manager.request_blocking('fail', [])
+
+    failures = [record for record in caplog.records if record.exc_info]
+    assert len(failures) == 2
+    assert all(record.exc_info[0] is RuntimeError for record in failures)
+
+
+def test_nested_requests_are_measured_separately():
+    def nested_middleware(make_request, web3):
+        def middleware(method, params):
+            if method == 'outer':
+                web3.manager.request_blocking('inner', [])
+            return make_request(method, params)
+        return middleware
+
+    w3 = Web3(EchoProvider(), middlewares=[nested_middleware])
+    metrics = w3.manager.enable_metrics()
+    w3.manager.request_blocking('outer', [])
+
+    snapshot = metrics.snapshot()
+    assert snapshot['outer']['bytes_sent'] == len(w3.provider.encode_rpc_request('outer', []))
+    assert snapshot['inner']['requests'] == 1
+    assert snapshot['outer']['latency']['min'] > snapshot['inner']['latency']['max']
+
+
+def test_disable_metrics(w3):
+    metrics = w3.manager.enable_metrics()
+    w3.manager.disable_metrics()
+    w3.manager.request_blocking('eth_chainId', [])
+    assert metrics.snapshot() == {}
+
+
+def test_metrics_with_micro_batching(w3):
+    metrics = w3.manager.enable_metrics()
+    w3.manager.enable_micro_batching(max_wait=0)
+    w3.manager.request_blocking('eth_chainId', [])
+    assert metrics.snapshot()['eth_chainId']['provider_latency']['count'] == 1
+
+
+class BatchEchoProvider(EchoProvider):
+    def make_batch_request(self, requests):
+        self.encode_rpc_request('batch', [])
+        return self.decode_rpc_response(json.dumps([
+            {'jsonrpc': '2.0', 'id': index, 'result': 'x' * 100}
+            for index, _ in enumerate(requests)
+        ]).encode())
+
+
+def test_micro_batch_bytes_are_split_among_its_requests():
+    w3 = Web3(BatchEchoProvider(), middlewares=[])
+    samples = []
+    w3.manager.enable_metrics().add_exporter(samples.append)
+    w3.manager.enable_micro_batching(max_wait=5, max_batch_size=4)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: w3.manager.request_blocking('eth_chainId', []), range(4)))
+
+    batch_response = json.dumps([
+        {'jsonrpc': '2.0', 'id': index, 'result': 'x' * 100} for index in range(4)
+    ])
+    assert sorted(sample.bytes_received for sample in samples)[:3] == [
+        len(batch_response) // 4
+    ] * 3
+    assert sum(sample.bytes_received for sample in samples) == len(batch_response)
+    assert all(sample.bytes_sent > 0 for sample in samples)
+
+
+@pytest.mark.asyncio
+async def test_coroutine_request_metrics():
+    w3 = Web3(AsyncEchoProvider(), middlewares=[])
+    metrics = w3.manager.enable_metrics()
+    await asyncio.gather(*(w3.manager.coro_request('eth_chainId', []) for _ in range(5)))
+
+    chain_id = metrics.snapshot()['eth_chainId']
+    assert chain_id['requests'] == 5
+    assert chain_id['provider_latency']['count'] == 5
+    assert chain_id['bytes_sent'] == 5 * len(
+        w3.provider.encode_rpc_request('eth_chainId', [])
+    )
+    assert chain_id['bytes_received'] == 5 * len(b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}')
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 2):
+        histogram.observe(value)
+
+    assert histogram.snapshot() == {
+        'count': 4,
+        'sum': 2.65,
+        'min': 0.05,
+        'max': 2,
+        'buckets': {0.1: 2, 1: 3, float('inf'): 4},
+    }
@@ -0,0 +1,177 @@
+import collections
+import pytest
+import threading
+
+from web3 import Web3
+from web3.middleware import (
+    construct_finalized_block_cache_middleware,
+    construct_result_generator_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+def _block_hash(block_number, fork=0):
+    return '0x' + '{0:032x}{1:032x}'.format(fork, block_number)
+
+
+class Chain:
+    def __init__(self, head):
+        self.head = head
+        self.hashes = {block_number: _block_hash(block_number) for block_number in range(head + 1)}
+        self.calls = collections.Counter()
+
+    def reorg(self, block_number, fork):
+        for number in range(block_number, self.head + 1):
+            self.hashes[number] = _block_hash(number, fork)
+
+    def get_block_by_number(self, method, params):
+        self.calls[method] += 1
+        if params[0] in {'latest', 'pending'}:
+            block_number = self.head
+        else:
+            block_number = int(params[0], 16)
+        return {'number': hex(block_number), 'hash': self.hashes[block_number]}
+
+    def get_transaction_receipt(self, method, params):
+        self.calls[method] += 1
+        block_number = int(params[0], 16)
+        return {
+            'blockNumber': hex(block_number),
+            'blockHash': self.hashes[block_number],
+            'transactionHash': params[0],
+        }
+
+    def get_logs(self, method, params):
+        self.calls[method] += 1
+        from_block = int(params[0]['fromBlock'], 16)
+        to_block = int(params[0]['toBlock'], 16)
+        return [
+            {'blockNumber': hex(block_number), 'blockHash': self.hashes[block_number]}
+            for block_number in range(from_block, to_block + 1)
+        ]
+
+
+@pytest.fixture
+def chain():
+    return Chain(head=100)
+
+
+@pytest.fixture
+def head_refresh_seconds():
+    return 60
+
+
+@pytest.fixture
+def w3(chain, head_refresh_seconds):
+    w3 = Web3(provider=BaseProvider(), middlewares=[])
+    w3.middleware_onion.add(construct_result_generator_middleware({
+        'eth_blockNumber': lambda method, params: hex(chain.head),
+        'eth_getBlockByNumber': chain.get_block_by_number,
+        'eth_getTransactionReceipt': chain.get_transaction_receipt,
+        'eth_getLogs': chain.get_logs,
+    }))
+    w3.middleware_onion.add(construct_finalized_block_cache_middleware(
+        cache_class=dict,
+        confirmations=10,
+        head_refresh_seconds=head_refresh_seconds,
+    ))
+    return w3
+
+
+def get_block(w3, block_number):
+    return w3.manager.request_blocking('eth_getBlockByNumber', [hex(block_number), False])
+
+
+def test_finalized_block_cache_caches_final_blocks(w3, chain):
+    assert get_block(w3, 90) == get_block(w3, 90)
+    assert chain.calls['eth_getBlockByNumber'] == 1
+
+    get_block(w3, 91)
+    get_block(w3, 91)
+    assert chain.calls['eth_getBlockByNumber'] == 3
+
+
+@pytest.mark.parametrize('block_identifier', ('latest', 'pending'))
+def test_finalized_block_cache_skips_block_tags(w3, chain, block_identifier):
+    w3.manager.request_blocking('eth_getBlockByNumber', [block_identifier, False])
+    w3.manager.request_blocking('eth_getBlockByNumber', [block_identifier, False])
+    assert chain.calls['eth_getBlockByNumber'] == 2
+
+
+def test_finalized_block_cache_caches_receipts_and_logs_once_final(w3, chain):
+    for _ in range(2):
+        w3.manager.request_blocking('eth_getTransactionReceipt', ['0x50'])
+        w3.manager.request_blocking('eth_getTransactionReceipt', ['0x5f'])
+        w3.manager.request_blocking('eth_getLogs', [{'fromBlock': '0x50', 'toBlock': '0x5a'}])
+        w3.manager.request_blocking('eth_getLogs', [{'fromBlock': '0x50', 'toBlock': '0x5b'}])
+    assert chain.calls['eth_getTransactionReceipt'] == 3
+    assert chain.calls['eth_getLogs'] == 3
+
+
+@pytest.mark.parametrize('head_refresh_seconds', (0,))
+def test_finalized_block_cache_drops_blocks_changed_by_a_reorg(w3, chain):
+    get_block(w3, 80)
+    get_block(w3, 85)
+    w3.manager.request_blocking('eth_getLogs', [{'fromBlock': '0x46', 'toBlock': '0x52'}])
+
+    chain.reorg(82, fork=1)
+    w3.manager.request_blocking('eth_getTransactionReceipt', ['0x5a'])
+
+    assert get_block(w3, 80)['hash'] == _block_hash(80)
+    assert get_block(w3, 85)['hash'] == _block_hash(85, fork=1)
+    logs = w3.manager.request_blocking('eth_getLogs', [{'fromBlock': '0x46', 'toBlock': '0x52'}])
+    assert logs[-1]['blockHash'] == _block_hash(82, fork=1)
+    assert chain.calls['eth_getLogs'] == 2
+
+
+def test_finalized_block_cache_drops_blocks_changed_by_a_reorg_seen_in_a_response(w3, chain):
+    get_block(w3, 80)
+    get_block(w3, 85)
+
+    chain.reorg(85, fork=1)
+    w3.manager.request_blocking('eth_getTransactionReceipt', ['0x55'])
+
+    assert get_block(w3, 85)['hash'] == _block_hash(85, fork=1)
+    assert get_block(w3, 80)['hash'] == _block_hash(80)
+
+
+def test_finalized_block_cache_refreshes_the_head_without_blocking_hits(chain):
+    refreshing = threading.Event()
+    refreshed = threading.Event()
+
+    def block_number(method, params):
+        chain.calls[method] += 1
+        if chain.calls[method] > 1:
+            refreshing.set()
+            assert refreshed.wait(5)
+        return hex(chain.head)
+
+    w3 = Web3(provider=BaseProvider(), middlewares=[])
+    w3.middleware_onion.add(construct_result_generator_middleware({
+        'eth_blockNumber': block_number,
+        'eth_getBlockByNumber': chain.get_block_by_number,
+    }))
+    w3.middleware_onion.add(construct_finalized_block_cache_middleware(
+        cache_class=dict,
+        confirmations=10,
+        head_refresh_seconds=0,
+    ))
+    get_block(w3, 80)
+
+    refresher = threading.Thread(target=get_block, args=(w3, 81))
+    refresher.start()
+    assert refreshing.wait(5)
+    try:
+        # cached responses and the last head are used while the head is refreshed
+        get_block(w3, 80)
+        get_block(w3, 82)
+        get_block(w3, 82)
+    finally:
+        refreshed.set()
+        refresher.join()
+
+    assert chain.calls['eth_blockNumber'] == 2
+    # blocks 80, 81 and 82, and block 80 again to check it is still canonical
+    assert chain.calls['eth_getBlockByNumber'] == 4
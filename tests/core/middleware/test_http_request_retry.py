@@ -1,9 +1,16 @@
+from email.utils import (
+    formatdate,
+)
 import pytest
+import time
 from unittest.mock import (
     Mock,
     patch,
 )
 
+from requests import (
+    Response,
+)
 from requests.exceptions import (
     ConnectionError,
     HTTPError,
@@ -12,9 +19,16 @@ from requests.exceptions import (
 )
 
 import web3
+from web3.middleware import (
+    exception_retry_request,
+)
 from web3.middleware.exception_retry_request import (
+    RetryBudget,
     check_if_retry_on_failure,
+    construct_exception_retry_middleware,
     exception_retry_middleware,
+    get_retry_after,
+    http_retry_request_middleware,
 )
 from web3.providers import (
     HTTPProvider,
@@ -82,3 +96,125 @@ def test_check_with_all_middlewares(make_post_request_mock):
     with pytest.raises(ConnectionError):
         w3.eth.blockNumber()
     assert make_post_request_mock.call_count == 5
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(exception_retry_request.time, 'sleep', sleeps.append)
+    return sleeps
+
+
+def make_http_error(status_code, retry_after=None):
+    response = Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return HTTPError(response=response)
+
+
+def test_retries_back_off_with_jitter(sleeps):
+    make_request = Mock(side_effect=ConnectionError)
+    middleware = exception_retry_middleware(
+        make_request, Mock(), (ConnectionError,), 5, backoff_factor=0.5, max_backoff=2,
+    )
+    with pytest.raises(ConnectionError):
+        middleware('eth_getBalance', [])
+
+    assert make_request.call_count == 5
+    assert len(sleeps) == 4
+    for attempt, delay in enumerate(sleeps):
+        assert 0 <= delay <= min(2, 0.5 * 2 ** attempt)
+
+
+@pytest.mark.parametrize(
+    'error, expected',
+    (
+        (ConnectionError(), None),
+        (make_http_error(500, '5'), None),
+        (make_http_error(429), None),
+        (make_http_error(429, '5'), 5),
+        (make_http_error(503, '0'), 0),
+        (make_http_error(503, 'soon'), None),
+        (make_http_error(503, 'Wed, 21 Oct 2015 07:28:00 GMT'), 0),
+    ),
+)
+def test_get_retry_after(error, expected):
+    assert get_retry_after(error) == expected
+
+
+def test_get_retry_after_http_date():
+    retry_at = formatdate(time.time() + 60, usegmt=True)
+    assert 55 < get_retry_after(make_http_error(429, retry_at)) <= 60
+
+
+def test_retry_after_is_respected(sleeps):
+    make_request = Mock(side_effect=[make_http_error(429, '3'), {'result': '0x1'}])
+    middleware = exception_retry_middleware(make_request, Mock(), (HTTPError,))
+    assert middleware('eth_getBalance', []) == {'result': '0x1'}
+    assert sleeps == [3]
+
+
+def test_long_retry_after_is_not_waited_for(sleeps):
+    make_request = Mock(side_effect=make_http_error(503, '120'))
+    middleware = exception_retry_middleware(make_request, Mock(), (HTTPError,), max_retry_after=30)
+    with pytest.raises(HTTPError):
+        middleware('eth_getBalance', [])
+    assert make_request.call_count == 1
+    assert sleeps == []
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+    for _ in range(4):
+        budget.record_request()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+
+def test_retry_budget_window(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(exception_retry_request.time, 'monotonic', lambda: now[0])
+    budget = RetryBudget(ratio=0, min_retries=1, window=10)
+    assert budget.try_retry()
+    assert not budget.try_retry()
+    now[0] += 10
+    assert budget.try_retry()
+
+
+def test_exhausted_retry_budget_stops_retries(sleeps):
+    make_request = Mock(side_effect=ConnectionError)
+    budget = RetryBudget(ratio=0, min_retries=3)
+    setup = construct_exception_retry_middleware(retry_budget=budget)
+    middleware = setup(make_request, Mock())
+
+    with pytest.raises(ConnectionError):
+        middleware('eth_getBalance', [])
+    assert make_request.call_count == 4
+
+    make_request.reset_mock()
+    with pytest.raises(ConnectionError):
+        middleware('eth_getBalance', [])
+    assert make_request.call_count == 1
+
+
+def test_retry_budget_is_kept_per_provider(sleeps):
+    make_request = Mock(side_effect=ConnectionError)
+    web3 = Mock()
+    # the middlewares of a provider are built again when they change
+    builds = [http_retry_request_middleware(make_request, web3) for _ in range(2)]
+    for middleware in builds:
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                middleware('eth_getBalance', [])
+    # 6 requests, with 4 retries each until the 10 retries of the budget are used up
+    assert make_request.call_count == 6 + 10
+
+    make_request.reset_mock()
+    other_provider_middleware = http_retry_request_middleware(make_request, Mock())
+    with pytest.raises(ConnectionError):
+        other_provider_middleware('eth_getBalance', [])
+    assert make_request.call_count == 5
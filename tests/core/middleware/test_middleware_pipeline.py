@@ -0,0 +1,131 @@
+import pytest
+
+from web3 import Web3
+from web3.middleware import (
+    MiddlewarePipeline,
+    abi_middleware,
+    construct_formatting_middleware,
+    gas_price_strategy_middleware,
+    get_rpc_methods,
+    normalize_errors_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+class EchoProvider(BaseProvider):
+    def make_request(self, method, params):
+        return {'jsonrpc': '2.0', 'id': 0, 'result': params}
+
+
+def tagging_middleware(tag, rpc_methods=None):
+    def middleware_factory(make_request, web3):
+        def middleware(method, params):
+            return make_request(method, params + [tag])
+        if rpc_methods is not None:
+            middleware.rpc_methods = rpc_methods
+        return middleware
+    return middleware_factory
+
+
+def provider_request(method, params):
+    return {'result': params}
+
+
+def test_pipeline_skips_layers_for_other_methods():
+    pipeline = MiddlewarePipeline(
+        [
+            tagging_middleware('a'),
+            tagging_middleware('b', {'eth_call'}),
+            tagging_middleware('c', {'eth_call', 'eth_chainId'}),
+            tagging_middleware('d'),
+        ],
+        None,
+        provider_request,
+    )
+
+    assert pipeline('eth_call', [])['result'] == ['a', 'b', 'c', 'd']
+    assert pipeline('eth_chainId', [])['result'] == ['a', 'c', 'd']
+    assert pipeline('net_version', [])['result'] == ['a', 'd']
+    assert len(pipeline.get_layers('net_version')) == 3
+    assert pipeline.get_layers('eth_chainId')[-1] is provider_request
+
+
+def test_pipeline_routes_by_the_method_a_layer_passes_on():
+    def rename_middleware(make_request, web3):
+        def middleware(method, params):
+            return make_request('eth_call', params)
+        return middleware
+
+    pipeline = MiddlewarePipeline(
+        [rename_middleware, tagging_middleware('b', {'eth_call'})],
+        None,
+        provider_request,
+    )
+    assert pipeline('net_version', [])['result'] == ['b']
+
+
+def test_pipeline_builds_each_middleware_once():
+    built = []
+
+    def counting_middleware(make_request, web3):
+        built.append(web3)
+        return make_request
+
+    pipeline = MiddlewarePipeline(
+        [counting_middleware, tagging_middleware('b', {'eth_call'})], 'w3', provider_request,
+    )
+    pipeline('eth_call', [])
+    pipeline('net_version', [])
+    assert built == ['w3']
+
+
+def test_built_in_middlewares_declare_their_methods():
+    assert get_rpc_methods(gas_price_strategy_middleware(None, None)) == {'eth_sendTransaction'}
+    assert get_rpc_methods(normalize_errors_middleware(None, None)) == {
+        'eth_getTransactionReceipt'
+    }
+    assert 'eth_chainId' not in get_rpc_methods(abi_middleware(None, None))
+
+    formatting_middleware = construct_formatting_middleware(
+        request_formatters={'eth_call': str},
+        result_formatters={'eth_chainId': int},
+        error_formatters={'eth_getCode': str},
+    )
+    assert get_rpc_methods(formatting_middleware(None, None)) == {
+        'eth_call', 'eth_chainId', 'eth_getCode',
+    }
+
+
+@pytest.fixture
+def w3():
+    return Web3(EchoProvider(), middlewares=[
+        (tagging_middleware('a', {'eth_call'}), 'a'),
+        (tagging_middleware('b'), 'b'),
+    ])
+
+
+def test_manager_uses_the_method_pipelines(w3):
+    assert w3.manager.request_blocking('eth_call', []) == ['a', 'b']
+    assert w3.manager.request_blocking('eth_chainId', []) == ['b']
+
+
+def test_pipeline_is_rebuilt_when_middlewares_change(w3):
+    request_func = w3.provider.request_func(w3, w3.middleware_onion)
+    assert w3.provider.request_func(w3, w3.middleware_onion) is request_func
+
+    w3.middleware_onion.add(tagging_middleware('c', {'eth_chainId'}), 'c')
+    assert w3.manager.request_blocking('eth_chainId', []) == ['c', 'b']
+
+    w3.middleware_onion.replace('c', tagging_middleware('d', {'eth_chainId'}))
+    assert w3.manager.request_blocking('eth_chainId', []) == ['d', 'b']
+
+    w3.middleware_onion.remove('b')
+    assert w3.manager.request_blocking('eth_chainId', []) == ['d']
+
+    w3.provider.middlewares = [tagging_middleware('e', {'eth_chainId'})]
+    assert w3.manager.request_blocking('eth_chainId', []) == ['d', 'e']
+
+    w3.middleware_onion.clear()
+    assert w3.manager.request_blocking('eth_chainId', []) == ['e']
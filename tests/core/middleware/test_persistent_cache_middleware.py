@@ -0,0 +1,144 @@
+import functools
+import itertools
+import pytest
+
+from web3 import Web3
+from web3.middleware import (
+    SQLiteCache,
+    construct_persistent_cache_middleware,
+    construct_result_generator_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+BLOCK_HASH = '0x' + '11' * 32
+
+
+@pytest.fixture
+def counter():
+    return itertools.count()
+
+
+@pytest.fixture
+def result_generator_middleware(counter):
+    def count(method, params):
+        return next(counter)
+
+    return construct_result_generator_middleware({
+        'eth_chainId': lambda *_: '0x1',
+        'eth_blockNumber': lambda *_: '0x64',
+        'eth_getBlockByHash': count,
+        'eth_getBalance': count,
+        'eth_getTransactionReceipt': lambda method, params: {
+            'blockNumber': params[0], 'count': next(counter),
+        },
+        'eth_getTransactionCount': count,
+    })
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'cache.sqlite')
+
+
+def make_w3(result_generator_middleware, cache_path, **kwargs):
+    w3 = Web3(provider=BaseProvider(), middlewares=[])
+    w3.middleware_onion.add(result_generator_middleware)
+    w3.middleware_onion.add(construct_persistent_cache_middleware(
+        cache_class=functools.partial(SQLiteCache, cache_path),
+        finality_depth=10,
+        **kwargs
+    ))
+    return w3
+
+
+@pytest.fixture
+def w3(result_generator_middleware, cache_path):
+    return make_w3(result_generator_middleware, cache_path)
+
+
+def test_persistent_cache_caches_blocks_by_hash(w3):
+    result = w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False])
+    assert w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False]) == result
+    assert w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, True]) != result
+
+
+@pytest.mark.parametrize(
+    'block_identifier,cached',
+    (
+        ('latest', False),
+        ('pending', False),
+        ('earliest', True),
+        ('0x5a', True),
+        ('0x5b', False),
+        ({'blockHash': BLOCK_HASH}, True),
+    ),
+)
+def test_persistent_cache_caches_state_at_final_blocks(w3, block_identifier, cached):
+    params = ['0x' + '22' * 20, block_identifier]
+    result = w3.manager.request_blocking('eth_getBalance', params)
+    assert (w3.manager.request_blocking('eth_getBalance', params) == result) is cached
+
+
+@pytest.mark.parametrize(
+    'block_number,cached',
+    (('0x5a', True), ('0x5b', False), (None, False)),
+)
+def test_persistent_cache_caches_receipts_in_final_blocks(w3, block_number, cached):
+    result = w3.manager.request_blocking('eth_getTransactionReceipt', [block_number])
+    second_result = w3.manager.request_blocking('eth_getTransactionReceipt', [block_number])
+    assert (second_result == result) is cached
+
+
+def test_persistent_cache_survives_restarts(result_generator_middleware, cache_path, counter):
+    w3 = make_w3(result_generator_middleware, cache_path)
+    result = w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False])
+
+    restarted_w3 = make_w3(result_generator_middleware, cache_path)
+    restarted_result = restarted_w3.manager.request_blocking(
+        'eth_getBlockByHash', [BLOCK_HASH, False]
+    )
+    assert restarted_result == result
+
+
+def test_persistent_cache_keys_include_the_chain_id(cache_path, result_generator_middleware):
+    w3 = make_w3(result_generator_middleware, cache_path)
+    result = w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False])
+
+    other_chain_w3 = make_w3(construct_result_generator_middleware({
+        'eth_chainId': lambda *_: '0x2',
+        'eth_getBlockByHash': lambda *_: 'other chain',
+    }), cache_path)
+    assert other_chain_w3.manager.request_blocking(
+        'eth_getBlockByHash', [BLOCK_HASH, False]
+    ) == 'other chain'
+    assert w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False]) == result
+
+
+def test_persistent_cache_skips_methods_not_whitelisted(result_generator_middleware, cache_path):
+    w3 = make_w3(result_generator_middleware, cache_path, rpc_whitelist={'eth_getBalance'})
+    result = w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False])
+    assert w3.manager.request_blocking('eth_getBlockByHash', [BLOCK_HASH, False]) != result
+
+
+def test_sqlite_cache(cache_path):
+    cache = SQLiteCache(cache_path, table='responses')
+    cache['a'] = {'result': [1, '0x2']}
+    assert cache['a'] == {'result': [1, '0x2']}
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert list(cache) == ['a']
+    assert len(cache) == 1
+
+    del cache['a']
+    assert 'a' not in cache
+    with pytest.raises(KeyError):
+        cache['a']
+    with pytest.raises(KeyError):
+        del cache['a']
+
+
+def test_sqlite_cache_rejects_bad_table_names(cache_path):
+    with pytest.raises(ValueError):
+        SQLiteCache(cache_path, table='responses; DROP TABLE responses')
@@ -0,0 +1,216 @@
+import pytest
+
+from web3 import Web3
+from web3._utils.method_formatters import (
+    FUSED_RESULT_FORMATTERS,
+    LAZY_RESULT_FORMATTERS,
+    PYTHONIC_RESULT_FORMATTERS,
+)
+from web3.datastructures import (
+    AttributeDict,
+    LazyAttributeDict,
+)
+from web3.middleware import (
+    attrdict_middleware,
+    lazy_pythonic_middleware,
+)
+from web3.middleware.pythonic import (
+    is_wrapped_by_attrdict,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+BLOCK_HASH = '0x' + '11' * 32
+TRANSACTION = {
+    'blockHash': BLOCK_HASH,
+    'blockNumber': '0x1',
+    'from': '0x' + '22' * 20,
+    'gas': '0x5208',
+    'gasPrice': '0x3b9aca00',
+    'hash': '0x' + '33' * 32,
+    'input': '0x',
+    'nonce': '0x0',
+    'r': '0x' + '44' * 32,
+    's': '0x' + '55' * 32,
+    'to': '0x' + '66' * 20,
+    'transactionIndex': '0x0',
+    'v': '0x1b',
+    'value': '0xde0b6b3a7640000',
+}
+BLOCK = {
+    'difficulty': '0x20000',
+    'extraData': '0x',
+    'gasLimit': '0x98bc2b',
+    'gasUsed': '0x5208',
+    'hash': BLOCK_HASH,
+    'logsBloom': '0x' + '00' * 256,
+    'miner': '0x' + '77' * 20,
+    'nonce': '0x' + '00' * 8,
+    'number': '0x1',
+    'parentHash': '0x' + '88' * 32,
+    'sha3Uncles': '0x' + '99' * 32,
+    'size': '0x200',
+    'stateRoot': '0x' + 'aa' * 32,
+    'timestamp': '0x5e0be0ff',
+    'totalDifficulty': '0x40000',
+    'transactions': [TRANSACTION],
+    'transactionsRoot': '0x' + 'bb' * 32,
+    'uncles': [],
+}
+RECEIPT = {
+    'blockHash': BLOCK_HASH,
+    'blockNumber': '0x1',
+    'contractAddress': None,
+    'cumulativeGasUsed': '0x5208',
+    'gasUsed': '0x5208',
+    'logs': [{
+        'address': '0x' + 'cc' * 20,
+        'blockHash': BLOCK_HASH,
+        'blockNumber': '0x1',
+        'data': '0x',
+        'logIndex': '0x0',
+        'topics': ['0x' + 'dd' * 32],
+        'transactionHash': TRANSACTION['hash'],
+        'transactionIndex': '0x0',
+    }],
+    'status': '0x1',
+    'transactionHash': TRANSACTION['hash'],
+    'transactionIndex': '0x0',
+}
+PROOF = {
+    'address': '0x' + 'cc' * 20,
+    'accountProof': ['0x' + 'ee' * 32],
+    'balance': '0x0',
+    'codeHash': '0x' + 'ff' * 32,
+    'nonce': '0x0',
+    'storageHash': '0x' + '12' * 32,
+    'storageProof': [{'key': '0x0', 'value': '0x1', 'proof': ['0x' + '34' * 32]}],
+}
+
+
+def assert_same_types(actual, expected):
+    assert type(actual) is type(expected)
+    if isinstance(expected, dict):
+        for key in expected:
+            assert_same_types(actual[key], expected[key])
+    elif isinstance(expected, (list, tuple)):
+        for actual_item, expected_item in zip(actual, expected):
+            assert_same_types(actual_item, expected_item)
+
+
+def chained_formatter(method):
+    def formatter(result):
+        formatted = PYTHONIC_RESULT_FORMATTERS[method](result)
+        if isinstance(formatted, dict):
+            return AttributeDict.recursive(formatted)
+        return formatted
+    return formatter
+
+
+RESULTS = (
+    ('eth_getBlockByNumber', BLOCK),
+    ('eth_getBlockByHash', dict(BLOCK, transactions=[TRANSACTION['hash']])),
+    ('eth_getBlockByHash', None),
+    ('eth_getTransactionByHash', TRANSACTION),
+    ('eth_getTransactionReceipt', RECEIPT),
+    ('eth_getTransactionReceipt', None),
+    ('eth_getProof', PROOF),
+    ('eth_signTransaction', {'raw': '0x1234', 'tx': TRANSACTION}),
+    ('eth_syncing', False),
+    ('eth_syncing', {'currentBlock': '0x1', 'highestBlock': '0x2', 'startingBlock': '0x0'}),
+    ('eth_getLogs', RECEIPT['logs']),
+    ('eth_blockNumber', '0x1'),
+)
+
+
+@pytest.mark.parametrize('method,result', RESULTS)
+def test_fused_formatters_match_chained_formatters(method, result):
+    expected = chained_formatter(method)(result)
+    actual = FUSED_RESULT_FORMATTERS[method](result)
+
+    assert actual == expected
+    assert_same_types(actual, expected)
+
+
+@pytest.mark.parametrize('method,result', RESULTS)
+def test_lazy_formatters_match_chained_formatters(method, result):
+    expected = chained_formatter(method)(result)
+    actual = LAZY_RESULT_FORMATTERS[method](result)
+
+    assert actual == expected
+    assert isinstance(actual, type(expected))
+
+
+def test_lazy_formatters_format_fields_on_access():
+    block = LAZY_RESULT_FORMATTERS['eth_getBlockByNumber'](BLOCK)
+    assert isinstance(block, LazyAttributeDict)
+    assert 'number' not in vars(block)
+
+    assert block.number == 1
+    assert 'number' in vars(block)
+    assert 'miner' not in vars(block)
+
+    transaction = block.transactions[0]
+    assert isinstance(transaction, LazyAttributeDict)
+    assert transaction.to == '0x' + '66' * 20
+    assert 'value' not in vars(transaction)
+    assert block.transactions[0] is transaction
+
+
+def test_lazy_formatters_name_the_field_that_fails():
+    block = LAZY_RESULT_FORMATTERS['eth_getBlockByNumber'](dict(BLOCK, number='not-hex'))
+    assert block.miner == '0x' + '77' * 20
+    with pytest.raises(ValueError, match="'number'"):
+        block.number
+
+
+def test_fused_formatters_name_the_field_that_fails():
+    with pytest.raises(ValueError, match="'number'"):
+        FUSED_RESULT_FORMATTERS['eth_getBlockByNumber'](dict(BLOCK, number='not-hex'))
+
+
+class BlockProvider(BaseProvider):
+    def make_request(self, method, params):
+        return {'jsonrpc': '2.0', 'id': 0, 'result': BLOCK}
+
+
+def test_default_stack_returns_attrdicts():
+    w3 = Web3(BlockProvider())
+    assert is_wrapped_by_attrdict(w3)
+    block = w3.eth.getBlock('latest', full_transactions=True)
+
+    assert isinstance(block, AttributeDict)
+    assert isinstance(block.transactions[0], AttributeDict)
+    assert block.transactions[0].value == 10 ** 18
+
+
+def test_results_are_plain_dicts_without_attrdict_middleware():
+    w3 = Web3(BlockProvider())
+    w3.middleware_onion.remove('attrdict')
+    block = w3.eth.getBlock('latest', full_transactions=True)
+
+    assert type(block) is dict
+    assert type(block['transactions'][0]) is dict
+    assert block['transactions'][0]['value'] == 10 ** 18
+
+
+def test_attrdict_is_not_fused_when_not_adjacent():
+    w3 = Web3(BlockProvider())
+    w3.middleware_onion.remove('attrdict')
+    w3.middleware_onion.add(attrdict_middleware, 'attrdict')
+    assert not is_wrapped_by_attrdict(w3)
+
+    block = w3.eth.getBlock('latest', full_transactions=True)
+    assert isinstance(block, AttributeDict)
+    assert isinstance(block.transactions[0], AttributeDict)
+
+
+def test_lazy_pythonic_middleware():
+    w3 = Web3(BlockProvider())
+    w3.middleware_onion.replace('pythonic', lazy_pythonic_middleware)
+    block = w3.eth.getBlock('latest', full_transactions=True)
+
+    assert isinstance(block, LazyAttributeDict)
+    assert block.transactions[0].value == 10 ** 18
+    assert block == FUSED_RESULT_FORMATTERS['eth_getBlockByNumber'](BLOCK)
@@ -0,0 +1,191 @@
+import pytest
+import threading
+import time
+from unittest.mock import (
+    Mock,
+)
+
+from web3.middleware import (
+    construct_rate_limit_middleware,
+    rate_limit,
+)
+from web3.middleware.rate_limit import (
+    AdaptiveConcurrencyLimit,
+    TokenBucket,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Mock(now=1000.0, sleeps=[])
+
+    def sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(rate_limit.time, 'monotonic', lambda: clock.now)
+    monkeypatch.setattr(rate_limit.time, 'sleep', sleep)
+    return clock
+
+
+def test_token_bucket_allows_bursts(clock):
+    bucket = TokenBucket(rate=10, capacity=5)
+    for _ in range(5):
+        assert bucket.take() == 0
+    assert bucket.take() == pytest.approx(0.1)
+    assert bucket.take() == pytest.approx(0.2)
+
+
+def test_token_bucket_refills(clock):
+    bucket = TokenBucket(rate=10, capacity=5)
+    assert bucket.take(5) == 0
+    clock.now += 0.25
+    assert bucket.take(2) == 0
+    assert bucket.take() == pytest.approx(0.05)
+
+
+def test_token_bucket_caps_cost_at_capacity(clock):
+    bucket = TokenBucket(rate=1, capacity=2)
+    assert bucket.take(10) == 0
+    assert bucket.take(10) == pytest.approx(2)
+
+
+def test_token_bucket_rejects_bad_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_rate_limit_middleware_charges_method_costs(clock):
+    make_request = Mock(return_value={'result': '0x1'})
+    setup = construct_rate_limit_middleware(
+        requests_per_second=10, burst=10, method_costs={'eth_getLogs': 5},
+    )
+    middleware = setup(make_request, None)
+
+    for _ in range(5):
+        middleware('eth_blockNumber', [])
+    middleware('eth_getLogs', [])
+    assert clock.sleeps == []
+
+    middleware('eth_getLogs', [])
+    assert clock.sleeps == [pytest.approx(0.5)]
+    assert make_request.call_count == 7
+
+
+def test_rate_limit_is_shared_between_providers(clock):
+    setup = construct_rate_limit_middleware(requests_per_second=1, burst=1)
+    setup(Mock(), None)('eth_blockNumber', [])
+    setup(Mock(), None)('eth_blockNumber', [])
+    assert clock.sleeps == [pytest.approx(1)]
+
+
+def test_concurrency_limit_grows_additively():
+    limit = AdaptiveConcurrencyLimit(initial_limit=2, max_limit=4)
+    for _ in range(3):
+        limit.acquire()
+        limit.release(latency=0, failed=False)
+    assert limit.limit == 3
+    for _ in range(50):
+        limit.acquire()
+        limit.release(latency=0, failed=False)
+    assert limit.limit == 4
+
+
+def test_concurrency_limit_shrinks_on_errors_and_latency(clock):
+    limit = AdaptiveConcurrencyLimit(initial_limit=16, latency_target=1, cooldown=1)
+    limit.acquire()
+    limit.release(latency=0.1, failed=True)
+    assert limit.limit == 8
+
+    # one decrease per cooldown
+    limit.acquire()
+    limit.release(latency=0.1, failed=True)
+    assert limit.limit == 8
+
+    clock.now += 1
+    limit.acquire()
+    limit.release(latency=2, failed=False)
+    assert limit.limit == 4
+
+    for _ in range(5):
+        clock.now += 1
+        limit.acquire()
+        limit.release(latency=0.1, failed=True)
+    assert limit.limit == 1
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    (
+        {'min_limit': 0},
+        {'initial_limit': 200},
+        {'min_limit': 5, 'initial_limit': 2},
+        {'backoff': 1},
+    ),
+)
+def test_concurrency_limit_rejects_bad_settings(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimit(**kwargs)
+
+
+def test_concurrency_limit_middleware_caps_requests_in_flight():
+    concurrency_limit = AdaptiveConcurrencyLimit(initial_limit=2, max_limit=2)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def make_request(method, params):
+        with lock:
+            in_flight.append(method)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(method)
+        return {'result': '0x1'}
+
+    setup = construct_rate_limit_middleware(concurrency_limit=concurrency_limit)
+    middleware = setup(make_request, None)
+    threads = [
+        threading.Thread(target=middleware, args=('eth_blockNumber', []))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    assert concurrency_limit.in_flight == 0
+
+
+def test_concurrency_limit_middleware_counts_exceptions_as_failures():
+    concurrency_limit = AdaptiveConcurrencyLimit(initial_limit=4)
+    setup = construct_rate_limit_middleware(concurrency_limit=concurrency_limit)
+    middleware = setup(Mock(side_effect=ConnectionError), None)
+
+    with pytest.raises(ConnectionError):
+        middleware('eth_blockNumber', [])
+    assert concurrency_limit.limit == 2
+    assert concurrency_limit.in_flight == 0
+
+
+def test_concurrency_limit_middleware_counts_error_responses_as_failures():
+    concurrency_limit = AdaptiveConcurrencyLimit(initial_limit=4)
+    setup = construct_rate_limit_middleware(concurrency_limit=concurrency_limit)
+    middleware = setup(Mock(return_value={'error': {'code': -32005, 'message': 'busy'}}), None)
+
+    assert 'error' in middleware('eth_blockNumber', [])
+    assert concurrency_limit.limit == 2
+    assert concurrency_limit.in_flight == 0
+
+
+def test_concurrency_limit_middleware_failure_predicate():
+    concurrency_limit = AdaptiveConcurrencyLimit(initial_limit=4)
+    setup = construct_rate_limit_middleware(
+        concurrency_limit=concurrency_limit,
+        is_failure=lambda response: response.get('error', {}).get('code') == -32005,
+    )
+    middleware = setup(Mock(return_value={'error': {'code': 3, 'message': 'reverted'}}), None)
+
+    middleware('eth_call', [])
+    assert concurrency_limit.limit == 4
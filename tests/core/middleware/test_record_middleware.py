@@ -0,0 +1,77 @@
+import pytest
+
+from web3 import Web3
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.middleware import (
+    construct_fixture_middleware,
+    record_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.records import (
+    BlockRecord,
+    LogRecord,
+    ReceiptRecord,
+)
+
+
+class DummyProvider(BaseProvider):
+    def make_request(self, method, params):
+        raise NotImplementedError("Cannot make request for {0}:{1}".format(
+            method,
+            params,
+        ))
+
+
+LOG = {
+    'address': '0x' + 'cc' * 20,
+    'blockHash': '0x' + '11' * 32,
+    'blockNumber': '0x1',
+    'data': '0x',
+    'logIndex': '0x0',
+    'topics': ['0x' + 'dd' * 32],
+    'transactionHash': '0x' + '33' * 32,
+    'transactionIndex': '0x0',
+}
+
+
+@pytest.fixture
+def w3():
+    w3 = Web3(DummyProvider())
+    w3.middleware_onion.replace('attrdict', record_middleware)
+    w3.middleware_onion.inject(construct_fixture_middleware({
+        'eth_getBlockByNumber': {'number': '0x1', 'transactions': [], 'uncles': []},
+        'eth_getTransactionReceipt': {'status': '0x1', 'logs': [LOG]},
+        'eth_getLogs': [LOG],
+        'eth_syncing': {'currentBlock': '0x1'},
+        'eth_getTransactionByHash': None,
+    }), 'fixture', layer=0)
+    return w3
+
+
+def test_record_middleware_converts_known_results(w3):
+    block = w3.eth.getBlock(1)
+    assert isinstance(block, BlockRecord)
+    assert block.number == 1
+
+    receipt = w3.eth.getTransactionReceipt('0x' + '33' * 32)
+    assert isinstance(receipt, ReceiptRecord)
+    assert isinstance(receipt.logs[0], LogRecord)
+    assert receipt.logs[0].logIndex == 0
+
+    logs = w3.eth.getLogs({})
+    assert isinstance(logs[0], LogRecord)
+    assert logs[0].blockNumber == 1
+
+
+def test_record_middleware_converts_other_dicts_to_attrdicts(w3):
+    syncing = w3.eth.syncing
+    assert isinstance(syncing, AttributeDict)
+    assert syncing.currentBlock == 1
+
+
+def test_record_middleware_passes_null_results(w3):
+    assert w3.manager.request_blocking('eth_getTransactionByHash', ['0x' + '33' * 32]) is None
@@ -0,0 +1,181 @@
+import asyncio
+import pytest
+import threading
+import time
+from unittest.mock import (
+    Mock,
+)
+
+from web3 import Web3
+from web3.middleware import (
+    construct_request_coalescing_middleware,
+    request_coalescing_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+class BlockingProvider(BaseProvider):
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def make_request(self, method, params):
+        self.calls.append((method, params))
+        self.release.wait(5)
+        if method == 'eth_getBalance':
+            raise ConnectionError('node is down')
+        return {'jsonrpc': '2.0', 'id': len(self.calls), 'result': '0x1'}
+
+
+class CoroutineProvider(BaseProvider):
+    def __init__(self):
+        self.calls = []
+
+    async def make_request(self, method, params):
+        self.calls.append((method, params))
+        await asyncio.sleep(0.01)
+        if method == 'eth_getBalance':
+            raise ConnectionError('node is down')
+        return {'jsonrpc': '2.0', 'id': len(self.calls), 'result': '0x1'}
+
+
+def build_middleware(provider, middleware=request_coalescing_middleware):
+    return middleware(provider.make_request, Mock(provider=provider))
+
+
+def run_in_threads(fn, count):
+    results = []
+
+    def target():
+        try:
+            results.append(fn())
+        except Exception as exc:
+            results.append(exc)
+
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    # give every thread time to reach the middleware
+    time.sleep(0.1)
+    return threads, results
+
+
+def test_identical_requests_share_one_round_trip():
+    provider = BlockingProvider()
+    middleware = build_middleware(provider)
+
+    threads, results = run_in_threads(lambda: middleware('eth_chainId', []), 8)
+    provider.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(provider.calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_later_requests_are_made_again():
+    provider = BlockingProvider()
+    provider.release.set()
+    middleware = build_middleware(provider)
+
+    first = middleware('eth_blockNumber', [])
+    second = middleware('eth_blockNumber', [])
+    assert first['id'] == 1
+    assert second['id'] == 2
+
+
+def test_errors_are_shared():
+    provider = BlockingProvider()
+    middleware = build_middleware(provider)
+
+    threads, results = run_in_threads(lambda: middleware('eth_getBalance', ['0x0', 'latest']), 4)
+    provider.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(provider.calls) == 1
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+@pytest.mark.parametrize(
+    'method, params',
+    (
+        ('eth_sendRawTransaction', ['0x00']),
+        ('eth_getFilterChanges', ['0x1']),
+        # params that cannot be turned into a key
+        ('eth_call', [object()]),
+    ),
+)
+def test_requests_that_are_not_coalesced(method, params):
+    provider = BlockingProvider()
+    provider.release.set()
+    middleware = build_middleware(provider)
+
+    middleware(method, params)
+    middleware(method, params)
+    assert len(provider.calls) == 2
+
+
+def test_custom_whitelist():
+    provider = BlockingProvider()
+    middleware = build_middleware(
+        provider, construct_request_coalescing_middleware(rpc_whitelist={'net_version'}),
+    )
+
+    threads, results = run_in_threads(lambda: middleware('eth_chainId', []), 3)
+    provider.release.set()
+    for thread in threads:
+        thread.join()
+    assert len(provider.calls) == 3
+
+
+def test_with_web3():
+    provider = BlockingProvider()
+    provider.release.set()
+    w3 = Web3(provider, middlewares=[request_coalescing_middleware])
+    assert w3.manager.request_blocking('eth_chainId', []) == '0x1'
+
+
+@pytest.mark.asyncio
+async def test_identical_coroutine_requests_share_one_round_trip():
+    provider = CoroutineProvider()
+    middleware = build_middleware(provider)
+
+    responses = await asyncio.gather(*(
+        middleware('eth_getBlockByNumber', ['latest', False]) for _ in range(8)
+    ))
+    assert len(provider.calls) == 1
+    assert all(response is responses[0] for response in responses)
+
+    await middleware('eth_getBlockByNumber', ['latest', False])
+    assert len(provider.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_coroutine_errors_are_shared():
+    provider = CoroutineProvider()
+    middleware = build_middleware(provider)
+
+    results = await asyncio.gather(
+        *(middleware('eth_getBalance', ['0x0', 'latest']) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert len(provider.calls) == 1
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    provider = CoroutineProvider()
+    middleware = build_middleware(provider)
+
+    first = asyncio.ensure_future(middleware('eth_chainId', []))
+    second = asyncio.ensure_future(middleware('eth_chainId', []))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second)['result'] == '0x1'
+    assert len(provider.calls) == 1
@@ -1,5 +1,6 @@
 import itertools
 import pytest
+import threading
 import uuid
 
 from web3 import Web3
@@ -113,3 +114,43 @@ def test_simple_cache_middleware_does_not_cache_endpoints_not_in_whitelist(w3):
     result_b = w3.manager.request_blocking('not_whitelisted', [])
 
     assert result_a != result_b
+
+
+@pytest.mark.parametrize('shard_count', (1, 4))
+def test_simple_cache_middleware_serves_hits_while_another_request_is_made(
+    w3_base, shard_count
+):
+    w3 = w3_base
+    counter = itertools.count()
+    slow_request_started = threading.Event()
+    slow_request_released = threading.Event()
+
+    def result_cb(method, params):
+        next(counter)
+        if params == ['slow']:
+            slow_request_started.set()
+            slow_request_released.wait(5)
+        return params[0]
+
+    w3.middleware_onion.add(construct_result_generator_middleware({
+        'fake_endpoint': result_cb,
+    }))
+    w3.middleware_onion.add(construct_simple_cache_middleware(
+        cache_class=dict,
+        rpc_whitelist={'fake_endpoint'},
+        shard_count=shard_count,
+    ))
+
+    assert w3.manager.request_blocking('fake_endpoint', ['fast']) == 'fast'
+    thread = threading.Thread(
+        target=w3.manager.request_blocking, args=('fake_endpoint', ['slow']),
+    )
+    thread.start()
+    try:
+        assert slow_request_started.wait(5)
+        assert w3.manager.request_blocking('fake_endpoint', ['fast']) == 'fast'
+    finally:
+        slow_request_released.set()
+        thread.join()
+
+    assert next(counter) == 2
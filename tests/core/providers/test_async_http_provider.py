@@ -0,0 +1,159 @@
+import asyncio
+import json
+import pytest
+
+from aiohttp import (
+    web,
+)
+
+from tests.utils import (
+    get_open_port,
+)
+from web3 import Web3
+from web3.providers.async_rpc import (
+    AsyncHTTPProvider,
+)
+from web3.version import (
+    AsyncVersion,
+)
+
+
+@pytest.fixture
+async def jsonrpc_server():
+    max_concurrent = 0
+    in_flight = 0
+
+    async def handle(request):
+        nonlocal in_flight, max_concurrent
+        in_flight += 1
+        max_concurrent = max(max_concurrent, in_flight)
+        try:
+            rpc_request = await request.json()
+            await asyncio.sleep(0.01)
+            if isinstance(rpc_request, list):
+                # batch responses may come back in any order
+                return web.json_response([
+                    {'jsonrpc': '2.0', 'id': item['id'], 'result': item['params'][0]}
+                    for item in reversed(rpc_request)
+                ])
+            return web.json_response({
+                'jsonrpc': '2.0',
+                'id': rpc_request['id'],
+                'result': 'result for {0}'.format(rpc_request['method']),
+            })
+        finally:
+            in_flight -= 1
+
+    app = web.Application()
+    app.router.add_post('/', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = get_open_port()
+    site = web.TCPSite(runner, '127.0.0.1', port)
+    await site.start()
+
+    server = type('Server', (), {})()
+    server.endpoint_uri = 'http://127.0.0.1:{0}'.format(port)
+    server.max_concurrent = lambda: max_concurrent
+    try:
+        yield server
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_async_http_provider_make_request(jsonrpc_server):
+    provider = AsyncHTTPProvider(jsonrpc_server.endpoint_uri)
+    try:
+        response = await provider.make_request('web3_clientVersion', [])
+        assert response['result'] == 'result for web3_clientVersion'
+        assert await provider.isConnected() is True
+    finally:
+        await provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_async_http_provider_make_batch_request(jsonrpc_server):
+    provider = AsyncHTTPProvider(jsonrpc_server.endpoint_uri)
+    try:
+        responses = await provider.make_batch_request([
+            ('eth_getBalance', [value]) for value in range(3)
+        ])
+        assert [response['result'] for response in responses] == [0, 1, 2]
+    finally:
+        await provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_async_http_provider_concurrent_requests_share_bounded_pool(jsonrpc_server):
+    provider = AsyncHTTPProvider(jsonrpc_server.endpoint_uri, pool_size=4)
+    try:
+        responses = await asyncio.gather(*(
+            provider.make_request('eth_blockNumber', []) for _ in range(20)
+        ))
+        session = await provider.get_session()
+        assert session.connector.limit == 4
+    finally:
+        await provider.disconnect()
+
+    assert [response['result'] for response in responses] == ['result for eth_blockNumber'] * 20
+    assert 1 < jsonrpc_server.max_concurrent() <= 4
+
+
+@pytest.mark.asyncio
+async def test_async_http_provider_with_async_module(jsonrpc_server):
+    provider = AsyncHTTPProvider(jsonrpc_server.endpoint_uri)
+    w3 = Web3(provider, middlewares=[], modules={'async_version': (AsyncVersion,)})
+    try:
+        assert await w3.async_version.node == 'result for web3_clientVersion'
+    finally:
+        await provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_async_http_provider_not_connected():
+    provider = AsyncHTTPProvider('http://127.0.0.1:{0}'.format(get_open_port()))
+    try:
+        assert await provider.isConnected() is False
+    finally:
+        await provider.disconnect()
+
+
+def test_async_http_provider_request_kwargs():
+    provider = AsyncHTTPProvider(request_kwargs={'headers': {'X-Test': '1'}})
+    assert provider.get_request_kwargs() == {'headers': {'X-Test': '1'}}
+    assert json.loads(provider.encode_rpc_request('eth_chainId', []))['method'] == 'eth_chainId'
+
+
+def test_async_http_provider_closes_sessions_of_closed_loops():
+    provider = AsyncHTTPProvider()
+
+    first_loop = asyncio.new_event_loop()
+    first_session = first_loop.run_until_complete(provider.get_session())
+    first_loop.close()
+
+    second_loop = asyncio.new_event_loop()
+    try:
+        second_session = second_loop.run_until_complete(provider.get_session())
+        assert second_session is not first_session
+        assert first_session.closed
+        assert second_loop.run_until_complete(provider.get_session()) is second_session
+    finally:
+        second_loop.run_until_complete(provider.disconnect())
+        second_loop.close()
+    assert second_session.closed
+
+
+def test_async_http_provider_disconnect_closes_every_loop():
+    provider = AsyncHTTPProvider()
+    loops = [asyncio.new_event_loop() for _ in range(2)]
+    try:
+        sessions = [loop.run_until_complete(provider.get_session()) for loop in loops]
+        assert sessions[0] is not sessions[1]
+        assert loops[0].run_until_complete(provider.get_session()) is sessions[0]
+
+        loops[1].run_until_complete(provider.disconnect())
+        assert all(session.closed for session in sessions)
+    finally:
+        for loop in loops:
+            loop.close()
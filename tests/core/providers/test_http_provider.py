@@ -0,0 +1,139 @@
+from http.server import (
+    BaseHTTPRequestHandler,
+    HTTPServer,
+)
+import json
+import pytest
+from socketserver import (
+    ThreadingMixIn,
+)
+from threading import (
+    Thread,
+)
+
+from web3 import Web3
+from web3.providers.rpc import (
+    HTTPProvider,
+)
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def answer_request(request):
+    if request['method'] == 'unreadable':
+        return {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'Invalid'}}
+    return {'jsonrpc': '2.0', 'id': request['id'], 'result': request['method']}
+
+
+class JSONRPCHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if isinstance(request, list):
+            # batches are answered out of order
+            response = [answer_request(item) for item in reversed(request)]
+        else:
+            response = answer_request(request)
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def endpoint_uri(open_port):
+    server = ThreadingHTTPServer(('127.0.0.1', int(open_port)), JSONRPCHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield 'http://127.0.0.1:{0}'.format(open_port)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_provider_reuses_connections(endpoint_uri):
+    provider = HTTPProvider(endpoint_uri)
+    w3 = Web3(provider)
+    try:
+        for _ in range(5):
+            assert w3.manager.request_blocking('web3_clientVersion', []) == 'web3_clientVersion'
+    finally:
+        provider.disconnect()
+
+    assert provider.get_connection_stats() == {
+        'requests': 5,
+        'connections_opened': 1,
+        'connections_reused': 4,
+    }
+
+
+def test_http_provider_without_keep_alive(endpoint_uri):
+    provider = HTTPProvider(endpoint_uri, keep_alive=False)
+    try:
+        for _ in range(3):
+            provider.make_request('web3_clientVersion', [])
+    finally:
+        provider.disconnect()
+
+    assert provider.get_connection_stats() == {
+        'requests': 3,
+        'connections_opened': 3,
+        'connections_reused': 0,
+    }
+
+
+def test_http_provider_pool_settings():
+    provider = HTTPProvider('http://127.0.0.1:8545', pool_size=4)
+    adapter = provider.session.get_adapter(provider.endpoint_uri)
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block is False
+
+    provider = HTTPProvider('https://127.0.0.1:8545', pool_size=4, max_connections=16)
+    adapter = provider.session.get_adapter(provider.endpoint_uri)
+    # up to 16 connections are open at once, and 4 of them are kept once idle
+    assert adapter._pool_maxsize == 16
+    assert adapter._pool_block is True
+    assert adapter.max_idle_connections == 4
+
+    with pytest.raises(ValueError):
+        HTTPProvider(pool_size=4, max_connections=2)
+
+
+def test_http_provider_keeps_pool_size_idle_connections():
+    provider = HTTPProvider('http://127.0.0.1:8545', pool_size=4, max_connections=16)
+    adapter = provider.session.get_adapter(provider.endpoint_uri)
+    pool = adapter.poolmanager.connection_from_url(provider.endpoint_uri)
+
+    connections = [pool._get_conn() for _ in range(16)]
+    for connection in connections:
+        pool._put_conn(connection)
+
+    idle_connections = [pooled for pooled in pool.pool.queue if pooled is not None]
+    assert len(idle_connections) == 4
+    assert pool.pool.qsize() == 16
+    # the connections closed to keep the pool small can be opened again
+    assert len([pool._get_conn(timeout=0.1) for _ in range(16)]) == 16
+
+
+def test_http_providers_do_not_share_sessions():
+    assert HTTPProvider().session is not HTTPProvider().session
+
+
+def test_http_provider_batch_request(endpoint_uri):
+    provider = HTTPProvider(endpoint_uri)
+    try:
+        responses = provider.make_batch_request([('a', []), ('b', []), ('c', [])])
+        assert [response['result'] for response in responses] == ['a', 'b', 'c']
+
+        with pytest.raises(ValueError, match='Invalid'):
+            provider.make_batch_request([('a', []), ('unreadable', [])])
+    finally:
+        provider.disconnect()
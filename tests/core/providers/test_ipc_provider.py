@@ -1,3 +1,7 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import json
 import os
 import pathlib
 import pytest
@@ -9,6 +13,7 @@ from threading import (
 import time
 import uuid
 
+from web3 import Web3
 from web3.auto.gethdev import (
     w3,
 )
@@ -17,6 +22,7 @@ from web3.middleware import (
 )
 from web3.providers.ipc import (
     IPCProvider,
+    JSONFramer,
 )
 
 
@@ -83,7 +89,61 @@ def test_sync_waits_for_full_result(jsonrpc_ipc_pipe_path, serve_empty_result):
     provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3)
     result = provider.make_request("method", [])
     assert result == {'id': 1, 'result': {}}
-    provider._socket.sock.close()
+    provider.disconnect()
+
+
+@pytest.fixture
+def serve_large_result(simple_ipc_server):
+    result = ['0x' + 'ab' * 1000 + ' "}]' + str(index) for index in range(2000)]
+    response = json.dumps({'id': 1, 'result': result}).encode()
+
+    def reply():
+        connection, client_address = simple_ipc_server.accept()
+        try:
+            connection.recv(1024)
+            for start in range(0, len(response), 1000):
+                connection.sendall(response[start:start + 1000])
+        finally:
+            connection.close()
+            simple_ipc_server.close()
+
+    thd = Thread(target=reply, daemon=True)
+    thd.start()
+
+    try:
+        yield result
+    finally:
+        thd.join()
+
+
+def test_sync_reads_large_result(jsonrpc_ipc_pipe_path, serve_large_result):
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3, recv_size=512)
+    result = provider.make_request("method", [])
+    assert result == {'id': 1, 'result': serve_large_result}
+    provider.disconnect()
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 7, 64, 1024))
+def test_json_framer_splits_messages(chunk_size):
+    messages = [
+        {'id': 1, 'result': {}},
+        [{'id': 2, 'result': '0x' + '00' * 64}, {'id': 3, 'result': None}],
+        {'id': 4, 'result': 'brackets {[ and "quotes\\" in ]} strings'},
+        {'id': 5, 'error': {'code': -32000, 'message': 'escaped \\\\'}},
+    ]
+    stream = b'\n'.join(json.dumps(message).encode() for message in messages)
+
+    framer = JSONFramer()
+    received = []
+    for start in range(0, len(stream), chunk_size):
+        framer.feed(stream[start:start + chunk_size])
+        message = framer.pop_message()
+        while message is not None:
+            received.append(json.loads(message))
+            message = framer.pop_message()
+
+    assert received == messages
+    assert framer.buffer.strip() == b''
 
 
 def test_web3_auto_gethdev():
@@ -95,3 +155,169 @@ def test_web3_auto_gethdev():
     block = w3.eth.getBlock('latest')
     assert 'extraData' not in block
     assert block.proofOfAuthorityData == b'\xff' * 33
+
+
+def serve_jsonrpc(server, handle_connection):
+    def accept():
+        while True:
+            try:
+                connection, client_address = server.accept()
+            except OSError:
+                return
+            Thread(target=handle_connection, args=(connection,), daemon=True).start()
+
+    Thread(target=accept, daemon=True).start()
+
+
+def read_requests(connection, framer):
+    while True:
+        message = framer.pop_message()
+        if message is not None:
+            return json.loads(message)
+        chunk = connection.recv(1024)
+        if not chunk:
+            return None
+        framer.feed(chunk)
+
+
+def test_socket_pool_serves_threads_concurrently(jsonrpc_ipc_pipe_path, simple_ipc_server):
+    in_flight = []
+    max_in_flight = []
+    connections = []
+
+    def slow_echo(connection):
+        connections.append(connection)
+        framer = JSONFramer()
+        with connection:
+            while True:
+                request = read_requests(connection, framer)
+                if request is None:
+                    return
+                in_flight.append(request['id'])
+                max_in_flight.append(len(in_flight))
+                time.sleep(0.1)
+                in_flight.remove(request['id'])
+                connection.sendall(json.dumps({
+                    'jsonrpc': '2.0', 'id': request['id'], 'result': request['params'][0],
+                }).encode())
+
+    simple_ipc_server.listen(4)
+    serve_jsonrpc(simple_ipc_server, slow_echo)
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3, pool_size=4)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(
+                lambda value: provider.make_request('test_method', [value]),
+                range(8),
+            ))
+        open_sockets = {
+            sock.sock for sock in provider._socket_pool.sockets if sock.sock is not None
+        }
+    finally:
+        provider.disconnect()
+
+    assert [response['result'] for response in responses] == list(range(8))
+    assert 1 < max(max_in_flight) <= 4
+    # the pool kept its sockets open between requests
+    assert 1 < len(open_sockets) <= 4
+    assert len(connections) == len(open_sockets)
+    assert all(sock.sock is None for sock in provider._socket_pool.sockets)
+
+
+def test_pipelined_requests_are_matched_by_id(jsonrpc_ipc_pipe_path, simple_ipc_server):
+    def reversing_server(connection):
+        # answer every group of three requests in reverse order
+        framer = JSONFramer()
+        with connection:
+            while True:
+                requests = [read_requests(connection, framer) for _ in range(3)]
+                if None in requests:
+                    return
+                for request in reversed(requests):
+                    connection.sendall(json.dumps({
+                        'jsonrpc': '2.0', 'id': request['id'], 'result': request['params'][0],
+                    }).encode())
+
+    serve_jsonrpc(simple_ipc_server, reversing_server)
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3, pipeline=True)
+    try:
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            responses = list(executor.map(
+                lambda value: provider.make_request('test_method', [value]),
+                range(6),
+            ))
+    finally:
+        provider.disconnect()
+
+    assert [response['result'] for response in responses] == list(range(6))
+
+
+def test_pipelined_request_metrics_count_received_bytes(jsonrpc_ipc_pipe_path, simple_ipc_server):
+    def echo_server(connection):
+        framer = JSONFramer()
+        with connection:
+            while True:
+                request = read_requests(connection, framer)
+                if request is None:
+                    return
+                connection.sendall(json.dumps({
+                    'jsonrpc': '2.0', 'id': request['id'], 'result': 'x' * 100,
+                }).encode())
+
+    serve_jsonrpc(simple_ipc_server, echo_server)
+    w3 = Web3(
+        IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3, pipeline=True),
+        middlewares=[],
+    )
+    samples = []
+    w3.manager.enable_metrics().add_exporter(samples.append)
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: w3.manager.request_blocking('test_method', []), range(3)))
+    finally:
+        w3.provider.disconnect()
+
+    assert len(samples) == 3
+    # the responses are read in the reader thread of the socket, not the request
+    assert all(sample.bytes_received > 100 for sample in samples)
+
+
+@pytest.mark.parametrize('pipeline', (False, True))
+def test_ipc_provider_batch_request(jsonrpc_ipc_pipe_path, simple_ipc_server, pipeline):
+    def batch_server(connection):
+        framer = JSONFramer()
+        with connection:
+            while True:
+                requests = read_requests(connection, framer)
+                if requests is None:
+                    return
+                # batches are answered out of order
+                connection.sendall(json.dumps([
+                    {'jsonrpc': '2.0', 'id': request['id'], 'result': request['method']}
+                    for request in reversed(requests)
+                ]).encode())
+
+    serve_jsonrpc(simple_ipc_server, batch_server)
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3, pipeline=pipeline)
+    try:
+        responses = provider.make_batch_request([('a', []), ('b', []), ('c', [])])
+    finally:
+        provider.disconnect()
+
+    assert [response['result'] for response in responses] == ['a', 'b', 'c']
+
+
+def test_pipelined_requests_fail_when_socket_closes(jsonrpc_ipc_pipe_path, simple_ipc_server):
+    def closing_server(connection):
+        connection.recv(1024)
+        connection.close()
+
+    serve_jsonrpc(simple_ipc_server, closing_server)
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3, pipeline=True)
+    with pytest.raises(ConnectionError):
+        provider.make_request('test_method', [])
+
+
+def test_ipc_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        IPCProvider('/tmp/nothing.ipc', pool_size=0)
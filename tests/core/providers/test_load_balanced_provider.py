@@ -0,0 +1,307 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import logging
+import pytest
+import random
+import threading
+import time
+
+from web3 import Web3
+from web3.exceptions import (
+    CannotHandleRequest,
+)
+from web3.providers import (
+    BaseProvider,
+    LoadBalancedProvider,
+)
+from web3.providers.load_balancing import (
+    check_if_hedge_allowed,
+    percentile,
+)
+
+
+class StubProvider(BaseProvider):
+    def __init__(self, name, fail=False, delay=0):
+        self.name = name
+        self.fail = fail
+        self.delay = delay
+        self.connected = True
+        self.requests = []
+
+    def __str__(self):
+        return self.name
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError('{0} is down'.format(self.name))
+        return {'jsonrpc': '2.0', 'id': 0, 'result': self.name}
+
+    def isConnected(self):
+        return self.connected
+
+
+@pytest.fixture
+def stubs():
+    return [StubProvider('a'), StubProvider('b'), StubProvider('c')]
+
+
+def make_provider(providers, **kwargs):
+    kwargs.setdefault('health_check_interval', None)
+    return LoadBalancedProvider(providers, **kwargs)
+
+
+def test_round_robin(stubs):
+    w3 = Web3(make_provider(stubs))
+    results = [w3.manager.request_blocking('web3_clientVersion', []) for _ in range(6)]
+    assert results == ['a', 'b', 'c', 'a', 'b', 'c']
+
+
+def test_fails_over_and_ejects_endpoint(stubs):
+    stubs[0].fail = True
+    provider = make_provider(stubs, max_failures=2)
+
+    results = [provider.make_request('web3_clientVersion', [])['result'] for _ in range(6)]
+    # 'a' is tried on the first and fourth requests, then ejected
+    assert results == ['b', 'b', 'c', 'b', 'b', 'c']
+    assert len(stubs[0].requests) == 2
+    assert provider.healthy_providers == stubs[1:]
+
+
+def test_ejected_endpoints_are_a_last_resort(stubs):
+    provider = make_provider(stubs[:2], max_failures=1)
+    stubs[0].fail = True
+    provider.make_request('web3_clientVersion', [])
+    assert provider.healthy_providers == [stubs[1]]
+
+    stubs[0].fail = False
+    stubs[1].fail = True
+    assert provider.make_request('web3_clientVersion', [])['result'] == 'a'
+    assert provider.healthy_providers == [stubs[0]]
+
+
+def test_all_endpoints_failing(stubs):
+    for stub in stubs:
+        stub.fail = True
+    provider = make_provider(stubs)
+
+    with pytest.raises(CannotHandleRequest) as excinfo:
+        provider.make_request('web3_clientVersion', [])
+    assert isinstance(excinfo.value.__cause__, ConnectionError)
+    assert all(len(stub.requests) == 1 for stub in stubs)
+
+
+def test_request_errors_do_not_fail_over(stubs):
+    def make_request(method, params):
+        raise ValueError('bad params')
+    stubs[0].make_request = make_request
+    provider = make_provider(stubs)
+
+    with pytest.raises(ValueError):
+        provider.make_request('eth_call', [])
+    assert stubs[1].requests == []
+
+
+def test_health_check(stubs):
+    provider = make_provider(stubs)
+    stubs[1].connected = False
+    provider.check_health()
+    assert provider.healthy_providers == [stubs[0], stubs[2]]
+
+    stubs[1].connected = True
+    provider.check_health()
+    assert provider.healthy_providers == stubs
+
+
+def test_background_health_check(stubs):
+    stubs[2].connected = False
+    provider = LoadBalancedProvider(stubs, health_check_interval=60)
+    try:
+        # the checks start with the first request
+        assert provider._health_checker is None
+        assert provider.healthy_providers == stubs
+        provider.make_request('web3_clientVersion', [])
+        provider._health_checker.join(0.5)
+        assert provider.healthy_providers == stubs[:2]
+    finally:
+        provider.disconnect()
+    provider._health_checker.join(1)
+    assert not provider._health_checker.is_alive()
+
+
+def test_requests_go_through_the_middlewares_of_each_provider(stubs):
+    def tag_middleware(make_request, web3):
+        def middleware(method, params):
+            response = make_request(method, params)
+            return dict(response, result=response['result'] + '|tagged')
+        return middleware
+
+    stubs[1].middlewares = [tag_middleware]
+    w3 = Web3(make_provider(stubs), middlewares=[])
+    results = [w3.manager.request_blocking('web3_clientVersion', []) for _ in range(3)]
+    assert results == ['a', 'b|tagged', 'c']
+
+
+def test_latency_strategy_prefers_faster_endpoints(stubs):
+    provider = make_provider(stubs, strategy='latency')
+    # keep the latencies fixed
+    provider.latency_smoothing = 0
+    for endpoint, latency in zip(provider.endpoints, (0.01, 0.02, 0.04)):
+        endpoint.latency = latency
+
+    random.seed(0)
+    for _ in range(300):
+        provider.make_request('web3_clientVersion', [])
+    counts = [len(stub.requests) for stub in stubs]
+    assert counts[0] > counts[1] > counts[2]
+
+
+def test_latency_strategy_fails_over_fastest_first(stubs):
+    provider = make_provider(stubs, strategy='latency')
+    for endpoint, latency in zip(provider.endpoints, (1.0, 0.1, 0.001)):
+        endpoint.latency = latency
+    stubs[2].fail = True
+    stubs[1].fail = True
+
+    for _ in range(5):
+        assert provider.make_request('web3_clientVersion', [])['result'] == 'a'
+
+
+def test_batch_requests_fail_over(stubs):
+    stubs[0].fail = True
+    provider = make_provider(stubs)
+    responses = provider.make_batch_request([('web3_clientVersion', []), ('net_version', [])])
+    assert [response['result'] for response in responses] == ['b', 'b']
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    (
+        {'providers': []},
+        {'strategy': 'random'},
+        {'max_failures': 0},
+        {'hedge': True, 'hedge_workers': 0},
+    ),
+)
+def test_invalid_settings(stubs, kwargs):
+    kwargs.setdefault('providers', stubs)
+    with pytest.raises(ValueError):
+        make_provider(**kwargs)
+
+
+@pytest.fixture
+def hedged_provider(stubs):
+    provider = make_provider(stubs, hedge=True, hedge_delay=0.05)
+    yield provider
+    provider.disconnect()
+
+
+def test_hedged_request_takes_first_answer(stubs, hedged_provider):
+    stubs[0].delay = 2
+    start = time.monotonic()
+    assert hedged_provider.make_request('eth_blockNumber', [])['result'] == 'b'
+    assert time.monotonic() - start < 1
+    assert stubs[0].requests == stubs[1].requests == ['eth_blockNumber']
+
+
+def test_fast_requests_are_not_hedged(stubs, hedged_provider):
+    assert hedged_provider.make_request('eth_blockNumber', [])['result'] == 'a'
+    assert stubs[1].requests == []
+
+
+def test_hedged_request_fails_over(stubs, hedged_provider):
+    stubs[0].fail = True
+    assert hedged_provider.make_request('eth_getBalance', [])['result'] == 'b'
+    assert stubs[2].requests == []
+
+
+def test_hedged_request_all_endpoints_failing(stubs, hedged_provider):
+    for stub in stubs:
+        stub.fail = True
+    with pytest.raises(CannotHandleRequest):
+        hedged_provider.make_request('eth_getBalance', [])
+    assert all(len(stub.requests) == 1 for stub in stubs)
+
+
+def test_state_changing_requests_are_not_hedged(stubs, hedged_provider):
+    stubs[0].delay = 0.2
+    assert hedged_provider.make_request('eth_sendRawTransaction', [])['result'] == 'a'
+    assert stubs[1].requests == []
+
+
+@pytest.mark.parametrize('hedge_workers', (4, 64))
+def test_concurrent_requests_are_not_hedged_while_waiting(stubs, hedge_workers, caplog):
+    lock = threading.Lock()
+    in_flight = [0]
+    peak_in_flight = [0]
+
+    def counting(make_request):
+        def counting_make_request(method, params):
+            with lock:
+                in_flight[0] += 1
+                peak_in_flight[0] = max(peak_in_flight[0], in_flight[0])
+            try:
+                return make_request(method, params)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+        return counting_make_request
+
+    for stub in stubs:
+        stub.delay = 0.05
+        stub.make_request = counting(stub.make_request)
+    provider = make_provider(stubs, hedge=True, hedge_delay=0.5, hedge_workers=hedge_workers)
+    caplog.set_level(logging.DEBUG, logger=provider.logger.name)
+    try:
+        with ThreadPoolExecutor(64) as executor:
+            results = list(executor.map(
+                lambda _: provider.make_request('eth_blockNumber', []),
+                range(256),
+            ))
+    finally:
+        provider.disconnect()
+
+    assert len(results) == 256
+    # no request was hedged, so round robin sent each endpoint a third of them
+    assert not [record for record in caplog.records if record.msg.startswith('Hedging')]
+    assert sorted(len(stub.requests) for stub in stubs) == [85, 85, 86]
+    # the requests were not limited to the hedge workers
+    assert peak_in_flight[0] > 4
+
+
+def test_hedge_delay_follows_latency_percentile(stubs):
+    provider = make_provider(stubs, hedge=True)
+    try:
+        assert provider.get_hedge_delay('eth_call') == provider.default_hedge_delay
+        for _ in range(provider.hedge_min_samples):
+            provider.make_request('eth_call', [])
+        assert provider.get_hedge_delay('eth_call') < provider.default_hedge_delay
+        assert provider.get_hedge_delay('eth_getLogs') == provider.default_hedge_delay
+    finally:
+        provider.disconnect()
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    random.shuffle(values)
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([0.5], 95) == 0.5
+
+
+@pytest.mark.parametrize(
+    'method, expected',
+    (
+        ('eth_call', True),
+        ('eth_getLogs', True),
+        ('net_version', True),
+        ('eth_sendRawTransaction', False),
+        ('eth_newFilter', False),
+        ('personal_listAccounts', False),
+        ('eth_sendTransaction', False),
+    ),
+)
+def test_check_if_hedge_allowed(method, expected):
+    assert check_if_hedge_allowed(method) is expected
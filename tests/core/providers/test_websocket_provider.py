@@ -1,4 +1,8 @@
 import asyncio
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import json
 import pytest
 import sys
 from threading import (
@@ -12,9 +16,11 @@ from tests.utils import (
 )
 from web3 import Web3
 from web3.exceptions import (
+    CannotHandleRequest,
     ValidationError,
 )
 from web3.providers.websocket import (
+    PersistentWebSocket,
     WebsocketProvider,
 )
 
@@ -69,3 +75,256 @@ def test_restricted_websocket_kwargs():
     re_exc_message = r'.*found: {0}*'.format(set(invalid_kwargs.keys()))
     with pytest.raises(ValidationError, match=re_exc_message):
         WebsocketProvider(websocket_kwargs=invalid_kwargs)
+
+
+@pytest.yield_fixture
+def start_reversing_websocket_server(open_port):
+    event_loop = asyncio.new_event_loop()
+
+    def run_server():
+        async def reversing_server(websocket, path):
+            # answer every group of three requests in reverse order
+            while True:
+                requests = [json.loads(await websocket.recv()) for _ in range(3)]
+                for request in reversed(requests):
+                    await websocket.send(json.dumps({
+                        'jsonrpc': '2.0',
+                        'id': request['id'],
+                        'result': request['params'][0],
+                    }))
+        server = websockets.serve(reversing_server, '127.0.0.1', open_port, loop=event_loop)
+        event_loop.run_until_complete(server)
+        event_loop.run_forever()
+
+    thd = Thread(target=run_server)
+    thd.start()
+    try:
+        yield
+    finally:
+        event_loop.call_soon_threadsafe(event_loop.stop)
+
+
+def test_websocket_provider_matches_responses_by_id(open_port, start_reversing_websocket_server):
+    event_loop = asyncio.new_event_loop()
+    endpoint_uri = 'ws://127.0.0.1:{}'.format(open_port)
+    event_loop.run_until_complete(wait_for_ws(endpoint_uri, event_loop))
+    provider = WebsocketProvider(endpoint_uri)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        responses = list(executor.map(
+            lambda value: provider.make_request('test_method', [value]),
+            range(6),
+        ))
+
+    assert [response['result'] for response in responses] == list(range(6))
+
+
+def test_websocket_provider_metrics_count_received_bytes(
+    open_port, start_reversing_websocket_server
+):
+    event_loop = asyncio.new_event_loop()
+    endpoint_uri = 'ws://127.0.0.1:{}'.format(open_port)
+    event_loop.run_until_complete(wait_for_ws(endpoint_uri, event_loop))
+    w3 = Web3(WebsocketProvider(endpoint_uri), middlewares=[])
+    samples = []
+    w3.manager.enable_metrics().add_exporter(samples.append)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(
+            lambda value: w3.manager.request_blocking('test_method', [value]),
+            range(3),
+        ))
+
+    assert len(samples) == 3
+    # the responses are read in the loop of the connection, not the request
+    assert all(sample.bytes_received > 0 for sample in samples)
+
+
+@pytest.yield_fixture
+def start_batch_websocket_server(open_port):
+    event_loop = asyncio.new_event_loop()
+
+    def run_server():
+        async def batch_server(websocket, path):
+            async for message in websocket:
+                # batches are answered out of order
+                await websocket.send(json.dumps([
+                    {'jsonrpc': '2.0', 'id': request['id'], 'result': request['method']}
+                    for request in reversed(json.loads(message))
+                ]))
+        server = websockets.serve(batch_server, '127.0.0.1', open_port, loop=event_loop)
+        event_loop.run_until_complete(server)
+        event_loop.run_forever()
+
+    thd = Thread(target=run_server)
+    thd.start()
+    try:
+        yield
+    finally:
+        event_loop.call_soon_threadsafe(event_loop.stop)
+
+
+def test_websocket_provider_batch_request(open_port, start_batch_websocket_server):
+    event_loop = asyncio.new_event_loop()
+    endpoint_uri = 'ws://127.0.0.1:{}'.format(open_port)
+    event_loop.run_until_complete(wait_for_ws(endpoint_uri, event_loop))
+    provider = WebsocketProvider(endpoint_uri)
+
+    responses = provider.make_batch_request([('a', []), ('b', []), ('c', [])])
+
+    assert [response['result'] for response in responses] == ['a', 'b', 'c']
+
+
+@pytest.yield_fixture
+def start_subscription_websocket_server(open_port):
+    event_loop = asyncio.new_event_loop()
+
+    def run_server():
+        async def subscription_server(websocket, path):
+            async for message in websocket:
+                request = json.loads(message)
+                if request['method'] == 'eth_subscribe':
+                    await websocket.send(json.dumps({
+                        'jsonrpc': '2.0', 'id': request['id'], 'result': '0xabc',
+                    }))
+                    for number in range(1, 4):
+                        await websocket.send(json.dumps({
+                            'jsonrpc': '2.0',
+                            'method': 'eth_subscription',
+                            'params': {
+                                'subscription': '0xabc',
+                                'result': {'number': hex(number), 'hash': '0x' + '11' * 32},
+                            },
+                        }))
+                else:
+                    await websocket.send(json.dumps({
+                        'jsonrpc': '2.0', 'id': request['id'], 'result': request['params'],
+                    }))
+        server = websockets.serve(subscription_server, '127.0.0.1', open_port, loop=event_loop)
+        event_loop.run_until_complete(server)
+        event_loop.run_forever()
+
+    thd = Thread(target=run_server)
+    thd.start()
+    try:
+        yield
+    finally:
+        event_loop.call_soon_threadsafe(event_loop.stop)
+
+
+@pytest.fixture()
+def subscription_w3(open_port, start_subscription_websocket_server):
+    event_loop = asyncio.new_event_loop()
+    endpoint_uri = 'ws://127.0.0.1:{}'.format(open_port)
+    event_loop.run_until_complete(wait_for_ws(endpoint_uri, event_loop))
+    return Web3(WebsocketProvider(endpoint_uri))
+
+
+def test_websocket_provider_subscription(subscription_w3):
+    with subscription_w3.eth.subscribe('newHeads') as subscription:
+        assert subscription.subscription_id == '0xabc'
+        heads = [subscription.get_next(timeout=5) for _ in range(2)]
+        # requests are still answered while notifications are pending
+        assert subscription_w3.manager.request_blocking('test_method', [1]) == [1]
+        heads.append(next(iter(subscription)))
+
+    assert [head.number for head in heads] == [1, 2, 3]
+    assert heads[0].hash == b'\x11' * 32
+
+    with pytest.raises(ValueError):
+        subscription.get_next(timeout=0.05)
+
+
+def test_websocket_provider_async_subscription(subscription_w3):
+    async def read_heads():
+        subscription = subscription_w3.eth.subscribe('newHeads')
+        async with subscription:
+            return [(await subscription.__anext__()).number for _ in range(3)]
+
+    assert asyncio.new_event_loop().run_until_complete(read_heads()) == [1, 2, 3]
+
+
+class ClosingWebSocket:
+    """
+    Yields the given messages, then fails as a dropped connection would.
+    """
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.messages:
+            return self.messages.pop(0)
+        raise websockets.ConnectionClosed(1006, 'connection dropped')
+
+    async def close(self):
+        pass
+
+
+def notification(subscription_id, number):
+    return {
+        'jsonrpc': '2.0',
+        'method': 'eth_subscription',
+        'params': {'subscription': subscription_id, 'result': number},
+    }
+
+
+def read_subscription(messages, subscription_queue_size=10):
+    """
+    Subscribes to ``0xabc`` on a connection receiving ``messages`` after the
+    subscription is made, then reads the subscription until it has failed twice.
+    """
+    event_loop = asyncio.new_event_loop()
+    conn = PersistentWebSocket('ws://test', event_loop, {}, lambda message: message,
+                               subscription_queue_size)
+    conn._pending_responses[1] = event_loop.create_future()
+    conn._subscribe_requests.add(1)
+    responses = [{'jsonrpc': '2.0', 'id': 1, 'result': '0xabc'}] + messages
+
+    async def read():
+        await conn._read_messages(ClosingWebSocket(responses))
+        received = []
+        for _ in range(len(messages) + 2):
+            try:
+                received.append(await conn.get_subscription_message('0xabc', 1))
+            except Exception as exc:
+                received.append(exc)
+        return received
+
+    return conn, event_loop.run_until_complete(read())
+
+
+def test_subscription_fails_after_disconnect():
+    conn, received = read_subscription([notification('0xabc', 1), notification('0xabc', 2)])
+
+    assert received[:2] == [1, 2]
+    assert isinstance(received[2], websockets.ConnectionClosed)
+    # later reads fail too, rather than wait for a notification that never comes
+    assert isinstance(received[3], websockets.ConnectionClosed)
+
+
+def test_notifications_of_unknown_subscriptions_are_dropped():
+    conn, received = read_subscription([notification('0xdef', 1), notification('0xabc', 2)])
+
+    assert received[0] == 2
+    assert set(conn._subscriptions) == {'0xabc'}
+    with pytest.raises(ValueError):
+        asyncio.new_event_loop().run_until_complete(conn.get_subscription_message('0xdef', 1))
+
+
+def test_subscription_queue_is_bounded():
+    conn, received = read_subscription(
+        [notification('0xabc', number) for number in range(5)], subscription_queue_size=3,
+    )
+
+    assert received[:3] == [0, 1, 2]
+    assert isinstance(received[3], OverflowError)
+    assert isinstance(received[4], OverflowError)
+
+
+def test_subscribe_requires_subscription_support():
+    w3 = Web3(Web3.HTTPProvider())
+    with pytest.raises(CannotHandleRequest):
+        w3.eth.subscribe('newHeads')
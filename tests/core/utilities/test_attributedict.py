@@ -1,7 +1,10 @@
+import copy
+import pickle
 import pytest
 
 from web3.datastructures import (
     AttributeDict,
+    LazyAttributeDict,
 )
 
 
@@ -105,3 +108,56 @@ def test_attributedict_set_in_recursive_dict():
     data = {'mydict': {'myset': {'found'}}}
     attrdict = AttributeDict.recursive(data)
     assert 'found' in attrdict.mydict.myset
+
+
+def counting_formatter(calls):
+    def formatter(value):
+        calls.append(value)
+        return value * 10
+    return formatter
+
+
+def test_lazy_attributedict_formats_values_once_on_access():
+    calls = []
+    container = LazyAttributeDict({'a': 1, 'b': 2}, {'a': counting_formatter(calls)})
+    assert isinstance(container, AttributeDict)
+    assert calls == []
+
+    assert container.a == 10
+    assert container['a'] == 10
+    assert container.b == 2
+    assert calls == [1]
+
+
+def test_lazy_attributedict_mapping_interface():
+    container = LazyAttributeDict({'a': 1, 'b': 2}, {}, str)
+    assert 'a' in container
+    assert 'c' not in container
+    assert list(container) == ['a', 'b']
+    assert len(container) == 2
+    assert container == {'a': '1', 'b': '2'}
+    assert AttributeDict({'a': '1', 'b': '2'}) == container
+    assert hash(container) == hash(AttributeDict({'a': '1', 'b': '2'}))
+    assert repr(container) == "LazyAttributeDict({'a': '1', 'b': '2'})"
+    with pytest.raises(AttributeError):
+        container.c
+    with pytest.raises(KeyError):
+        container['c']
+
+
+def test_lazy_attributedict_immutable():
+    container = LazyAttributeDict({'a': 1}, {})
+    with pytest.raises(TypeError):
+        container.a = 0
+    with pytest.raises(TypeError):
+        container['a'] = 0
+
+
+@pytest.mark.parametrize(
+    'copier',
+    (copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))),
+)
+def test_lazy_attributedict_copies_are_attributedicts(copier):
+    copied = copier(LazyAttributeDict({'a': 1}, {'a': str}))
+    assert type(copied) is AttributeDict
+    assert copied == {'a': '1'}
@@ -0,0 +1,87 @@
+import json
+import pytest
+
+from web3._utils import (
+    json_codecs,
+)
+from web3._utils.encoding import (
+    FriendlyJsonSerde,
+)
+from web3._utils.json_codecs import (
+    JSONCodec,
+    get_default_json_codec,
+)
+from web3.providers import (
+    JSONBaseProvider,
+)
+
+
+class RecordingCodec(JSONCodec):
+    name = 'recording'
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append('dumps')
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append(('loads', type(data)))
+        return super().loads(data)
+
+
+class SmallIntCodec(JSONCodec):
+    """
+    Like the fast codecs, refuses integers that do not fit in 64 bits.
+    """
+    def dumps(self, obj):
+        if any(isinstance(value, int) and value >= 2 ** 64 for value in obj['params']):
+            raise OverflowError("int too big to convert")
+        return super().dumps(obj)
+
+    def loads(self, data):
+        raise ValueError("Value is too big!")
+
+
+def test_provider_uses_its_codec_and_decodes_bytes():
+    provider = JSONBaseProvider()
+    codec = RecordingCodec()
+    provider.json_codec = codec
+
+    request = provider.encode_rpc_request('eth_blockNumber', [])
+    response = provider.decode_rpc_response(b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}')
+
+    assert json.loads(request)['method'] == 'eth_blockNumber'
+    assert response['result'] == '0x1'
+    assert codec.calls == ['dumps', ('loads', bytes)]
+    assert provider.json_codec is codec
+
+
+def test_codec_falls_back_to_stdlib():
+    provider = JSONBaseProvider()
+    provider.json_codec = SmallIntCodec()
+
+    request = provider.encode_rpc_request('evm_increaseTime', [2 ** 70])
+    assert json.loads(request)['params'] == [2 ** 70]
+
+    response = provider.decode_rpc_response(b'{"id": 0, "result": 1180591620717411303424}')
+    assert response['result'] == 2 ** 70
+
+
+def test_codec_fallback_keeps_friendly_decode_errors():
+    with pytest.raises(json.JSONDecodeError, match='Could not decode'):
+        FriendlyJsonSerde(SmallIntCodec()).json_decode(b'{"id": 0, "result": ')
+
+
+def test_default_codec_prefers_fast_codecs(monkeypatch):
+    class MissingCodec(JSONCodec):
+        @classmethod
+        def is_available(cls):
+            return False
+
+    monkeypatch.setattr(json_codecs, 'FAST_JSON_CODECS', (MissingCodec, RecordingCodec))
+    assert isinstance(get_default_json_codec(), RecordingCodec)
+
+    monkeypatch.setattr(json_codecs, 'FAST_JSON_CODECS', (MissingCodec,))
+    assert type(get_default_json_codec()) is JSONCodec
@@ -0,0 +1,110 @@
+import copy
+import pickle
+import pytest
+
+from hexbytes import (
+    HexBytes,
+)
+
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.records import (
+    BlockRecord,
+    LogRecord,
+    Record,
+    TransactionRecord,
+    make_record_type,
+)
+from web3.types import (
+    TxData,
+)
+
+LOG = {
+    'address': '0x' + 'cc' * 20,
+    'blockHash': HexBytes('0x' + '11' * 32),
+    'blockNumber': 1,
+    'data': '0x',
+    'logIndex': 0,
+    'topics': [HexBytes('0x' + 'dd' * 32)],
+}
+
+
+def test_record_access():
+    log = LogRecord(LOG)
+    assert log.address == log['address'] == LOG['address']
+    assert log.topics == LOG['topics']
+    assert len(log) == len(LOG)
+    assert list(log) == list(LOG)
+    assert 'removed' not in log
+    assert not hasattr(log, '__dict__')
+
+
+def test_record_missing_fields():
+    log = LogRecord(LOG)
+    with pytest.raises(AttributeError):
+        log.removed
+    with pytest.raises(KeyError):
+        log['removed']
+    with pytest.raises(KeyError):
+        log['keys']
+    assert log.get('removed') is None
+
+
+def test_record_keeps_keys_which_are_not_fields():
+    log = LogRecord(dict(LOG, extra={'a': 1}))
+    assert log.extra.a == 1
+    assert log['extra'] == {'a': 1}
+    assert isinstance(log.extra, AttributeDict)
+
+
+def test_record_immutable():
+    log = LogRecord(LOG)
+    with pytest.raises(TypeError):
+        log.address = '0x'
+    with pytest.raises(TypeError):
+        log['address'] = '0x'
+    with pytest.raises(TypeError):
+        del log.address
+
+
+def test_record_equality_and_hash():
+    log = LogRecord(dict(LOG, topics=tuple(LOG['topics'])))
+    reordered = LogRecord(dict(reversed(list(log.items()))))
+    assert log == reordered
+    assert hash(log) == hash(reordered)
+    assert LogRecord(LOG) == AttributeDict.recursive(LOG)
+    assert AttributeDict.recursive(LOG) == LogRecord(LOG)
+    assert LogRecord(LOG) != LogRecord(dict(LOG, logIndex=1))
+
+
+def test_record_nested_records():
+    transaction = {'hash': HexBytes('0x' + '33' * 32), 'from': '0x' + '22' * 20}
+    block = BlockRecord({'number': 1, 'transactions': [transaction]})
+    assert isinstance(block.transactions[0], TransactionRecord)
+    assert block.transactions[0]['from'] == transaction['from']
+
+    block = BlockRecord({'number': 1, 'transactions': [transaction['hash']]})
+    assert block.transactions == [transaction['hash']]
+
+
+@pytest.mark.parametrize(
+    'copier',
+    (copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))),
+)
+def test_record_copies(copier):
+    log = LogRecord(LOG)
+    copied = copier(log)
+    assert type(copied) is LogRecord
+    assert copied == log
+
+
+def test_make_record_type():
+    TransactionRecord = make_record_type('TransactionRecord', TxData)
+    assert issubclass(TransactionRecord, Record)
+    assert TransactionRecord({'from': '0x', 'value': 1})['value'] == 1
+
+
+def test_make_record_type_rejects_clashing_fields():
+    with pytest.raises(ValueError):
+        make_record_type('Bad', type('Bad', (), {'__annotations__': {'items': int}}))
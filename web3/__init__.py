@@ -9,6 +9,9 @@ from eth_account import (
 from web3.main import (
     Web3  # noqa: E402,
 )
+from web3.providers.async_rpc import (  # noqa: E402
+    AsyncHTTPProvider,
+)
 from web3.providers.eth_tester import (  # noqa: E402
     EthereumTesterProvider,
 )
@@ -40,6 +43,7 @@ __all__ = [
     "__version__",
     "Web3",
     "HTTPProvider",
+    "AsyncHTTPProvider",
     "IPCProvider",
     "WebsocketProvider",
     "TestRPCProvider",
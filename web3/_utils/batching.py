@@ -0,0 +1,341 @@
+import asyncio
+from concurrent.futures import (
+    Future,
+)
+from contextvars import (
+    copy_context,
+)
+import threading
+from types import (
+    TracebackType,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from web3._utils.metrics import (
+    RequestRecord,
+    current_request,
+    split_request_bytes,
+)
+from web3._utils.threads import (
+    spawn,
+)
+from web3.providers import (
+    BaseProvider,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+
+class RequestBatch:
+    """
+    Collects calls against a web3 instance so that every JSON-RPC request they
+    make is sent to the provider as a single JSON-RPC batch.
+
+    Each call runs in its own thread and goes through the same middleware
+    pipeline as any other request, only the innermost provider request is
+    deferred.  Once every call
+    is either finished or waiting on the provider, the waiting requests are
+    sent together with ``provider.make_batch_request`` and the responses are
+    handed back to the callers.  Calls that make more than one request (or
+    middlewares that make requests of their own) result in more than one round
+    trip, one for each "wave" of requests.
+
+    .. code-block:: python
+
+        >>> with w3.batch_requests() as batch:
+        ...     batch.add(w3.eth.getBlock, 1)
+        ...     batch.add(w3.eth.getBalance, address)
+        ...     block, balance = batch.execute()
+    """
+    def __init__(self, web3: "Web3") -> None:
+        self.web3 = web3
+        self._calls: List[Tuple[Callable[..., Any], Sequence[Any], Dict[str, Any]]] = []
+        self._condition = threading.Condition()
+        self._pending: List[Tuple[RPCEndpoint, Any, "Future[RPCResponse]", Optional[RequestRecord]]] = []  # noqa: E501
+        self._finished_count = 0
+
+    def __enter__(self) -> "RequestBatch":
+        return self
+
+    def __exit__(
+        self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType
+    ) -> None:
+        self._calls.clear()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Queue ``fn(*args, **kwargs)`` to be run when the batch is executed.
+        """
+        self._calls.append((fn, args, kwargs))
+
+    def execute(self) -> List[Any]:
+        """
+        Run all queued calls, returning their results in the order they were
+        added.  If any of the calls raised, the first exception is re-raised
+        once all calls are complete.
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            return []
+
+        self._finished_count = 0
+        call_futures: List["Future[Any]"] = [Future() for _ in calls]
+        for (fn, args, kwargs), call_future in zip(calls, call_futures):
+            # each call runs in the context of the caller, as if made by the caller
+            spawn(copy_context().run, self._run_call, call_future, fn, args, kwargs)
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._finished_count + len(self._pending) == len(calls)
+                )
+                pending, self._pending = self._pending, []
+
+            if not pending:
+                break
+            self._send_pending(pending)
+
+        return [call_future.result() for call_future in call_futures]
+
+    def _run_call(
+        self,
+        call_future: "Future[Any]",
+        fn: Callable[..., Any],
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        thread_local = self.web3.manager._thread_local
+        thread_local.batch = self
+        try:
+            call_future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            call_future.set_exception(exc)
+        finally:
+            thread_local.batch = None
+            with self._condition:
+                self._finished_count += 1
+                self._condition.notify()
+
+    def defer_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """
+        Waits for the request to be sent with the next batch, and returns its
+        response.  Used by the manager for requests made by the calls.
+        """
+        response_future: "Future[RPCResponse]" = Future()
+        with self._condition:
+            self._pending.append((method, params, response_future, current_request.get()))
+            self._condition.notify()
+        return response_future.result()
+
+    def _send_pending(
+        self,
+        pending: List[Tuple[RPCEndpoint, Any, "Future[RPCResponse]", Optional[RequestRecord]]],
+    ) -> None:
+        requests = [(method, params) for method, params, _, _ in pending]
+        responses: Union[List[RPCResponse], Exception]
+        batch_record = RequestRecord()
+        reset_token = current_request.set(batch_record)
+        try:
+            responses = self.web3.provider.make_batch_request(requests)
+        except Exception as exc:
+            responses = exc
+        finally:
+            current_request.reset(reset_token)
+        split_request_bytes(batch_record, [record for _, _, _, record in pending])
+        set_batch_responses(
+            [(method, params, response_future) for method, params, response_future, _ in pending],
+            responses,
+        )
+
+
+def set_batch_responses(
+    pending: Sequence[Tuple[RPCEndpoint, Any, Union["Future[RPCResponse]", "asyncio.Future[RPCResponse]"]]],  # noqa: E501
+    responses: Union[Sequence[RPCResponse], Exception],
+) -> None:
+    """
+    Hands each of the ``responses`` to a batch request to the future of the
+    request, or the exception raised while making it to all of them.
+    """
+    if not isinstance(responses, Exception) and len(responses) != len(pending):
+        responses = ValueError(
+            "Expected {0} responses to the batch request, got {1}".format(
+                len(pending),
+                len(responses),
+            )
+        )
+    if isinstance(responses, Exception):
+        for _, _, response_future in pending:
+            if not response_future.done():
+                response_future.set_exception(responses)
+    else:
+        for (_, _, response_future), response in zip(pending, responses):
+            if not response_future.done():
+                response_future.set_result(response)
+
+
+class MicroBatcher:
+    """
+    Sends the requests that arrive within ``max_wait`` seconds of each other
+    as one JSON-RPC batch, as used by
+    :meth:`~web3.manager.RequestManager.enable_micro_batching`.
+
+    The first request of a window waits, in the thread or task that made it,
+    for up to ``max_wait`` seconds for more requests to arrive, then sends
+    them all with ``provider.make_batch_request``.  A window is sent as soon
+    as it holds ``max_batch_size`` requests, and a window with a single
+    request is sent with ``provider.make_request``.  The bytes of a batch are
+    split evenly among the metrics records of its requests.
+    """
+    def __init__(
+        self, get_provider: Callable[[], BaseProvider], max_wait: float, max_batch_size: int
+    ) -> None:
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative, got: %r" % max_wait)
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1, got: %r" % max_batch_size)
+        self.get_provider = get_provider
+        self.max_wait = max_wait
+        self.max_batch_size = max_batch_size
+        self._condition = threading.Condition()
+        self._window: List[Tuple[RPCEndpoint, Any, "Future[RPCResponse]", Optional[RequestRecord]]] = None  # noqa: E501
+        self._async_windows: Dict[asyncio.AbstractEventLoop, "AsyncWindow"] = {}
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        response_future: "Future[RPCResponse]" = Future()
+        with self._condition:
+            window = self._window
+            is_first = window is None
+            if is_first:
+                window = self._window = []
+            window.append((method, params, response_future, current_request.get()))
+
+            batch = None
+            if len(window) >= self.max_batch_size:
+                batch = window
+                self._window = None
+                self._condition.notify_all()
+            elif is_first:
+                self._condition.wait_for(lambda: self._window is not window, self.max_wait)
+                if self._window is window:
+                    batch = window
+                    self._window = None
+
+        if batch is not None:
+            self._send(batch)
+        return response_future.result()
+
+    def _send(
+        self,
+        batch: List[Tuple[RPCEndpoint, Any, "Future[RPCResponse]", Optional[RequestRecord]]],
+    ) -> None:
+        provider = self.get_provider()
+        batch_record = RequestRecord()
+        reset_token = current_request.set(batch_record)
+        try:
+            if len(batch) == 1:
+                method, params, _, _ = batch[0]
+                responses: Union[List[RPCResponse], Exception] = [
+                    provider.make_request(method, params)
+                ]
+            else:
+                responses = provider.make_batch_request(
+                    [(method, params) for method, params, _, _ in batch]
+                )
+        except Exception as exc:
+            responses = exc
+        finally:
+            current_request.reset(reset_token)
+        split_request_bytes(batch_record, [record for _, _, _, record in batch])
+        set_batch_responses(
+            [(method, params, response_future) for method, params, response_future, _ in batch],
+            responses,
+        )
+
+    async def coro_make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        loop = asyncio.get_event_loop()
+        response_future: "asyncio.Future[RPCResponse]" = loop.create_future()
+        window = self._async_windows.get(loop)
+        if window is None:
+            window = self._async_windows[loop] = AsyncWindow(
+                loop.call_later(self.max_wait, self._flush, loop)
+            )
+        window.requests.append((method, params, response_future, current_request.get()))
+        if len(window.requests) >= self.max_batch_size:
+            self._flush(loop)
+        return await response_future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        window = self._async_windows.pop(loop)
+        window.timer.cancel()
+        asyncio.ensure_future(self._coro_send(window.requests))
+
+    async def _coro_send(
+        self,
+        batch: List[Tuple[RPCEndpoint, Any, "asyncio.Future[RPCResponse]", Optional[RequestRecord]]],  # noqa: E501
+    ) -> None:
+        provider = self.get_provider()
+        if len(batch) > 1 and asyncio.iscoroutinefunction(provider.make_batch_request):
+            batch_record = RequestRecord()
+            # the task runs in a copy of the context of whichever request
+            # flushed the window, so the record set here is its own
+            current_request.set(batch_record)
+            try:
+                # type ignored b/c make_batch_request is a coroutine in async providers
+                responses: Union[List[RPCResponse], Exception] = await provider.make_batch_request(  # type: ignore # noqa: E501
+                    [(method, params) for method, params, _, _ in batch]
+                )
+            except Exception as exc:
+                responses = exc
+            split_request_bytes(batch_record, [record for _, _, _, record in batch])
+            set_batch_responses(
+                [(method, params, response_future) for method, params, response_future, _ in batch],  # noqa: E501
+                responses,
+            )
+        else:
+            # providers without an async batch request get the requests of the
+            # batch all at once, each on its own
+            await asyncio.gather(*(
+                self._coro_send_request(provider, request) for request in batch
+            ))
+
+    @staticmethod
+    async def _coro_send_request(
+        provider: BaseProvider,
+        request: Tuple[RPCEndpoint, Any, "asyncio.Future[RPCResponse]", Optional[RequestRecord]],
+    ) -> None:
+        method, params, response_future, record = request
+        # gather runs each request in a task of its own, with its own context
+        current_request.set(record)
+        try:
+            # type ignored b/c make_request is a coroutine in async providers
+            responses: Union[List[RPCResponse], Exception] = [
+                await provider.make_request(method, params)  # type: ignore
+            ]
+        except Exception as exc:
+            responses = exc
+        set_batch_responses([(method, params, response_future)], responses)
+
+
+class AsyncWindow:
+    def __init__(self, timer: asyncio.TimerHandle) -> None:
+        self.timer = timer
+        self.requests: List[Tuple[RPCEndpoint, Any, "asyncio.Future[RPCResponse]", Optional[RequestRecord]]] = []  # noqa: E501
@@ -1,45 +1,244 @@
 import collections
 import hashlib
+import json
+import sqlite3
+import threading
 from typing import (
     Any,
+    Callable,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
 )
 
 from eth_utils import (
     is_boolean,
     is_bytes,
     is_dict,
+    is_integer,
     is_list_like,
     is_null,
     is_number,
     is_text,
-    to_bytes,
 )
 
+# values of these types are used as their own keys
+_KEY_TYPES = {bytes, str, int, type(None)}
 
-def generate_cache_key(value: Any) -> str:
+
+def _generate_dict_cache_key(value: Mapping[Any, Any]) -> Hashable:
+    return (dict, tuple(
+        (generate_cache_key(key), generate_cache_key(value[key]))
+        for key
+        in sorted(value.keys())
+    ))
+
+
+def generate_cache_key(value: Any) -> Hashable:
     """
-    Generates a cache key for the *args and **kwargs
+    Generates a cache key for the *args and **kwargs, as nested tuples which
+    are equal whenever the values are equal, whatever the order of their dict
+    keys.
     """
-    if is_bytes(value):
-        return hashlib.md5(value).hexdigest()
+    value_type = type(value)
+    if value_type in _KEY_TYPES:
+        return value
+    elif value_type is list or value_type is tuple:
+        return tuple(generate_cache_key(item) for item in value)
+    elif value_type is dict:
+        return _generate_dict_cache_key(value)
+    elif is_boolean(value):
+        # tagged so that True and 1 make different keys
+        return (bool, value)
+    elif is_bytes(value):
+        return bytes(value)
     elif is_text(value):
-        return generate_cache_key(to_bytes(text=value))
-    elif is_boolean(value) or is_null(value) or is_number(value):
-        return generate_cache_key(repr(value))
+        return str(value)
+    elif is_integer(value):
+        return int(value)
+    elif is_null(value):
+        return None
+    elif is_number(value):
+        # by repr, so that the key of nan is equal to itself
+        return (float, repr(value))
     elif is_dict(value):
-        return generate_cache_key((
-            (key, value[key])
-            for key
-            in sorted(value.keys())
-        ))
+        return _generate_dict_cache_key(value)
     elif is_list_like(value) or isinstance(value, collections.abc.Generator):
-        return generate_cache_key("".join((
-            generate_cache_key(item)
-            for item
-            in value
-        )))
+        return tuple(generate_cache_key(item) for item in value)
     else:
         raise TypeError("Cannot generate cache key for value {0} of type {1}".format(
             value,
             type(value),
         ))
+
+
+def generate_cache_digest(value: Any) -> str:
+    """
+    Generates a cache key for the *args and **kwargs as the md5 hex digest of
+    :func:`generate_cache_key`, for caches which outlive the process and need
+    keys which are strings.
+    """
+    return hashlib.md5(repr(generate_cache_key(value)).encode()).hexdigest()
+
+
+_MISSING = object()
+
+
+class ShardedCache(MutableMapping[Hashable, Any]):
+    """
+    A dictionary-like cache split into shards by the hash of the key.  Each
+    shard is made by ``cache_class`` and has a lock of its own, which is only
+    held while the shard is read or written, so that many threads can use the
+    cache at the same time.
+    """
+    def __init__(self, cache_class: Callable[[], Any], shard_count: int=16) -> None:
+        if shard_count < 1:
+            raise ValueError("The shard count must be at least 1, got {0}".format(shard_count))
+        self._shards = [cache_class() for _ in range(shard_count)]
+        self._locks = [threading.Lock() for _ in range(shard_count)]
+
+    def _get_shard_index(self, key: Hashable) -> int:
+        if len(self._shards) == 1:
+            return 0
+        return hash(key) % len(self._shards)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        index = self._get_shard_index(key)
+        with self._locks[index]:
+            return self._shards[index][key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        index = self._get_shard_index(key)
+        with self._locks[index]:
+            self._shards[index][key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        index = self._get_shard_index(key)
+        with self._locks[index]:
+            del self._shards[index][key]
+
+    def __contains__(self, key: Any) -> bool:
+        index = self._get_shard_index(key)
+        with self._locks[index]:
+            return key in self._shards[index]
+
+    # the MutableMapping versions of these read and write the key under two
+    # acquisitions of its lock, so threads racing on the same key could fail
+    def get(self, key: Hashable, default: Any=None) -> Any:
+        index = self._get_shard_index(key)
+        with self._locks[index]:
+            try:
+                return self._shards[index][key]
+            except KeyError:
+                return default
+
+    def pop(self, key: Hashable, default: Any=_MISSING) -> Any:
+        index = self._get_shard_index(key)
+        with self._locks[index]:
+            shard = self._shards[index]
+            try:
+                value = shard[key]
+            except KeyError:
+                if default is _MISSING:
+                    raise
+                return default
+            del shard[key]
+            return value
+
+    def setdefault(self, key: Hashable, default: Any=None) -> Any:
+        index = self._get_shard_index(key)
+        with self._locks[index]:
+            shard = self._shards[index]
+            try:
+                return shard[key]
+            except KeyError:
+                shard[key] = default
+                return default
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                keys = list(shard.keys())
+            yield from keys
+
+    def __len__(self) -> int:
+        length = 0
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                length += len(shard)
+        return length
+
+
+class SQLiteCache(MutableMapping[str, Any]):
+    """
+    A dictionary-like cache kept in a table of an SQLite database, so that it
+    survives restarts of the process and can be shared between processes.
+    Values are stored as JSON, so they must be JSON-RPC results or responses
+    as they came from the provider.
+    """
+    def __init__(
+        self,
+        path: str,
+        table: str='web3_cache',
+        timeout: float=30,
+        dumps: Callable[[Any], str]=json.dumps,
+        loads: Callable[[str], Any]=json.loads,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError("The table name must be an identifier, got {0!r}".format(table))
+        self.path = path
+        self.table = table
+        self._dumps = dumps
+        self._loads = loads
+        self._lock = threading.Lock()
+        # autocommit, with one connection shared by the threads of the process
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False,
+        )
+        with self._lock:
+            # lets other processes read while one writes
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS {0} '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL)'.format(table)
+            )
+
+    def _execute(self, query: str, *params: Any) -> List[Any]:
+        # rows are fetched while holding the lock, as the cursor shares the connection
+        with self._lock:
+            cursor = self._connection.execute(query.format(self.table), params)
+            return cursor.fetchall()
+
+    def __getitem__(self, key: str) -> Any:
+        rows = self._execute('SELECT value FROM {0} WHERE key = ?', key)
+        if not rows:
+            raise KeyError(key)
+        return self._loads(rows[0][0])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._execute(
+            'INSERT OR REPLACE INTO {0} (key, value) VALUES (?, ?)', key, self._dumps(value),
+        )
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            cursor = self._connection.execute(
+                'DELETE FROM {0} WHERE key = ?'.format(self.table), (key,),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return bool(self._execute('SELECT 1 FROM {0} WHERE key = ?', key))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._execute('SELECT key FROM {0}')])
+
+    def __len__(self) -> int:
+        return self._execute('SELECT COUNT(*) FROM {0}')[0][0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -47,6 +47,10 @@ from web3._utils.abi import (
     size_of_type,
     sub_type_of_array_type,
 )
+from web3._utils.json_codecs import (
+    JSONCodec,
+    get_default_json_codec,
+)
 from web3._utils.validation import (
     validate_abi_type,
     validate_abi_value,
@@ -176,6 +180,9 @@ def hexstr_if_str(
     return to_type(primitive, hexstr=hexstr)
 
 
+DEFAULT_JSON_CODEC = get_default_json_codec()
+
+
 class FriendlyJsonSerde:
     """
     Friendly JSON serializer & deserializer
@@ -183,7 +190,16 @@ class FriendlyJsonSerde:
     When encoding or decoding fails, this class collects
     information on which fields failed, to show more
     helpful information in the raised error messages.
+
+    Values are encoded and decoded with ``codec``, which defaults to the
+    fastest JSON library that is installed.
     """
+    def __init__(self, codec: JSONCodec=None) -> None:
+        if codec is None:
+            self.codec = DEFAULT_JSON_CODEC
+        else:
+            self.codec = codec
+
     def _json_mapping_errors(self, mapping: Dict[Any, Any]) -> Iterable[str]:
         for key, val in mapping.items():
             try:
@@ -212,7 +228,14 @@ class FriendlyJsonSerde:
             else:
                 raise full_exception
 
-    def json_decode(self, json_str: str) -> Dict[Any, Any]:
+    def json_decode(self, json_str: Union[str, bytes]) -> Dict[Any, Any]:
+        try:
+            return self.codec.loads(json_str)
+        except ValueError:
+            # faster codecs reject some valid JSON, and only the standard
+            # library error tells where invalid JSON went wrong
+            pass
+
         try:
             decoded = json.loads(json_str)
             return decoded
@@ -228,6 +251,14 @@ class FriendlyJsonSerde:
         except TypeError as exc:
             raise TypeError("Could not encode to JSON: {}".format(exc))
 
+    def json_encode_bytes(self, obj: Any) -> bytes:
+        try:
+            return self.codec.dumps(obj)
+        except (TypeError, ValueError, OverflowError):
+            # faster codecs reject some values the standard library encodes,
+            # such as integers that do not fit in 64 bits
+            return self.json_encode(obj).encode('utf-8')
+
 
 def to_4byte_hex(hex_or_str_or_bytes: Union[HexStr, str, bytes, int]) -> HexStr:
     size_of_4bytes = 4 * 8
@@ -0,0 +1,84 @@
+import json
+from typing import (
+    Any,
+    Union,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONCodec:
+    """
+    Encodes and decodes JSON with the standard library ``json`` module.
+
+    Faster codecs subclass this, and are allowed to give up on values the
+    standard library can handle (such as integers that do not fit in 64 bits)
+    by raising an error; :class:`~web3._utils.encoding.FriendlyJsonSerde` then
+    encodes or decodes the value with the standard library instead.
+    """
+    name = 'json'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = 'orjson'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return orjson is not None
+
+    def dumps(self, obj: Any) -> bytes:
+        # datetimes and dataclasses are left to the standard library, which
+        # refuses to encode them
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class UJSONCodec(JSONCodec):
+    name = 'ujson'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return ujson is not None
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return ujson.loads(data)  # type: ignore
+
+
+FAST_JSON_CODECS = (OrjsonCodec, UJSONCodec)
+
+
+def get_default_json_codec() -> JSONCodec:
+    """
+    Returns the fastest codec whose library is installed, falling back to the
+    standard library.
+    """
+    for codec_class in FAST_JSON_CODECS:
+        if codec_class.is_available():
+            return codec_class()
+    return JSONCodec()
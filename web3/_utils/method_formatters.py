@@ -66,6 +66,7 @@ from web3._utils.rpc_abi import (
 )
 from web3.datastructures import (
     AttributeDict,
+    LazyAttributeDict,
 )
 from web3.types import (
     RPCEndpoint,
@@ -339,6 +340,10 @@ PYTHONIC_REQUEST_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
     RPC.eth_getUncleByBlockHashAndIndex: apply_formatter_at_index(integer_to_hex, 1),
     RPC.eth_newFilter: apply_formatter_at_index(filter_params_formatter, 0),
     RPC.eth_getLogs: apply_formatter_at_index(filter_params_formatter, 0),
+    RPC.eth_subscribe: apply_formatter_if(
+        is_length(2),
+        apply_formatter_at_index(filter_params_formatter, 1),
+    ),
     RPC.eth_call: apply_formatters_to_sequence([
         transaction_param_formatter,
         block_number_formatter,
@@ -432,13 +437,206 @@ PYTHONIC_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
 }
 
 
+def to_attrdict_if_collection(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, str, bytes)):
+        return value
+    else:
+        return AttributeDict.recursive(value)
+
+
+def fused_dict_formatter(
+    formatters: Dict[str, Any],
+    attrdict_formatters: Dict[str, Callable[..., Any]]=None,
+) -> Callable[[Dict[str, Any]], AttributeDict[str, Any]]:
+    """
+    Returns a formatter which gives the same result as
+    ``apply_formatters_to_dict(formatters)`` followed by
+    ``AttributeDict.recursive``, in a single pass over the dict.
+
+    The fields in ``attrdict_formatters`` are formatted with those instead,
+    which must return AttributeDicts for any dicts they contain, so that
+    nested dicts are not walked again.
+    """
+    if attrdict_formatters is None:
+        attrdict_formatters = {}
+
+    def formatter(value: Dict[str, Any]) -> AttributeDict[str, Any]:
+        formatted = {}
+        for key, item in value.items():
+            try:
+                if key in attrdict_formatters:
+                    formatted[key] = attrdict_formatters[key](item)
+                elif key in formatters:
+                    formatted[key] = to_attrdict_if_collection(formatters[key](item))
+                else:
+                    formatted[key] = to_attrdict_if_collection(item)
+            except (TypeError, ValueError) as exc:
+                raise type(exc)(
+                    "Could not format value %r as field %r" % (item, key)
+                ) from exc
+        return AttributeDict(formatted)
+    return formatter
+
+
+attrdict_transaction_formatter = fused_dict_formatter(TRANSACTION_FORMATTERS)
+attrdict_log_entry_formatter = fused_dict_formatter(LOG_ENTRY_FORMATTERS)
+
+attrdict_receipt_formatter = fused_dict_formatter(RECEIPT_FORMATTERS, {
+    'logs': apply_list_to_array_formatter(attrdict_log_entry_formatter),
+})
+
+attrdict_block_formatter = fused_dict_formatter(BLOCK_FORMATTERS, {
+    'transactions': apply_one_of_formatters((
+        (is_array_of_dicts, apply_list_to_array_formatter(attrdict_transaction_formatter)),
+        (is_array_of_strings, apply_list_to_array_formatter(to_hexbytes(32))),
+    )),
+})
+
+attrdict_proof_formatter = fused_dict_formatter(ACCOUNT_PROOF_FORMATTERS, {
+    'storageProof': apply_list_to_array_formatter(
+        fused_dict_formatter(STORAGE_PROOF_FORMATTERS)
+    ),
+})
+
+attrdict_signed_tx_formatter = fused_dict_formatter(SIGNED_TX_FORMATTER, {
+    'tx': attrdict_transaction_formatter,
+})
+
+attrdict_syncing_formatter = fused_dict_formatter(SYNCING_FORMATTERS)
+
+# Single pass replacements for the pythonic result formatters followed by the
+# attrdict middleware, for the methods that return nested dicts
+ATTRDICT_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
+    RPC.eth_getBlockByHash: apply_formatter_if(is_not_null, attrdict_block_formatter),
+    RPC.eth_getBlockByNumber: apply_formatter_if(is_not_null, attrdict_block_formatter),
+    RPC.eth_getProof: apply_formatter_if(is_not_null, attrdict_proof_formatter),
+    RPC.eth_getTransactionByBlockHashAndIndex: apply_formatter_if(
+        is_not_null,
+        attrdict_transaction_formatter,
+    ),
+    RPC.eth_getTransactionByBlockNumberAndIndex: apply_formatter_if(
+        is_not_null,
+        attrdict_transaction_formatter,
+    ),
+    RPC.eth_getTransactionByHash: apply_formatter_if(is_not_null, attrdict_transaction_formatter),
+    RPC.eth_getTransactionReceipt: apply_formatter_if(is_not_null, attrdict_receipt_formatter),
+    RPC.eth_signTransaction: apply_formatter_if(is_not_null, attrdict_signed_tx_formatter),
+    RPC.eth_syncing: apply_formatter_if(is_not_false, attrdict_syncing_formatter),
+}
+
+# The pythonic result formatters fused with the attrdict middleware.  The
+# attrdict middleware only converts results that are dicts.
+FUSED_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
+    method: ATTRDICT_RESULT_FORMATTERS.get(
+        method,
+        compose(apply_formatter_if(is_dict, to_attrdict_if_collection), formatter),
+    )
+    for method, formatter in PYTHONIC_RESULT_FORMATTERS.items()
+}
+
+
+def with_field_errors(key: str, formatter: Callable[..., Any]) -> Callable[..., Any]:
+    def format_field(value: Any) -> Any:
+        try:
+            return formatter(value)
+        except (TypeError, ValueError) as exc:
+            raise type(exc)(
+                "Could not format value %r as field %r" % (value, key)
+            ) from exc
+    return format_field
+
+
+def lazy_dict_formatter(
+    formatters: Dict[str, Any],
+    attrdict_formatters: Dict[str, Callable[..., Any]]=None,
+) -> Callable[[Dict[str, Any]], LazyAttributeDict[str, Any]]:
+    """
+    Like :func:`fused_dict_formatter`, except that the returned formatter
+    gives a LazyAttributeDict, which only formats each field when it is
+    first read.
+    """
+    field_formatters = {
+        key: with_field_errors(key, compose(to_attrdict_if_collection, formatter))
+        for key, formatter in formatters.items()
+    }
+    if attrdict_formatters is not None:
+        field_formatters.update({
+            key: with_field_errors(key, formatter)
+            for key, formatter in attrdict_formatters.items()
+        })
+
+    def formatter(value: Dict[str, Any]) -> LazyAttributeDict[str, Any]:
+        return LazyAttributeDict(value, field_formatters, to_attrdict_if_collection)
+    return formatter
+
+
+lazy_transaction_formatter = lazy_dict_formatter(TRANSACTION_FORMATTERS)
+lazy_log_entry_formatter = lazy_dict_formatter(LOG_ENTRY_FORMATTERS)
+
+lazy_receipt_formatter = lazy_dict_formatter(RECEIPT_FORMATTERS, {
+    'logs': apply_list_to_array_formatter(lazy_log_entry_formatter),
+})
+
+lazy_block_formatter = lazy_dict_formatter(BLOCK_FORMATTERS, {
+    'transactions': apply_one_of_formatters((
+        (is_array_of_dicts, apply_list_to_array_formatter(lazy_transaction_formatter)),
+        (is_array_of_strings, apply_list_to_array_formatter(to_hexbytes(32))),
+    )),
+})
+
+lazy_proof_formatter = lazy_dict_formatter(ACCOUNT_PROOF_FORMATTERS, {
+    'storageProof': apply_list_to_array_formatter(
+        lazy_dict_formatter(STORAGE_PROOF_FORMATTERS)
+    ),
+})
+
+lazy_signed_tx_formatter = lazy_dict_formatter(SIGNED_TX_FORMATTER, {
+    'tx': lazy_transaction_formatter,
+})
+
+# The fused result formatters, except that blocks, transactions, receipts and
+# proofs are formatted a field at a time, as their fields are read
+LAZY_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
+    **FUSED_RESULT_FORMATTERS,
+    RPC.eth_getBlockByHash: apply_formatter_if(is_not_null, lazy_block_formatter),
+    RPC.eth_getBlockByNumber: apply_formatter_if(is_not_null, lazy_block_formatter),
+    RPC.eth_getProof: apply_formatter_if(is_not_null, lazy_proof_formatter),
+    RPC.eth_getTransactionByBlockHashAndIndex: apply_formatter_if(
+        is_not_null,
+        lazy_transaction_formatter,
+    ),
+    RPC.eth_getTransactionByBlockNumberAndIndex: apply_formatter_if(
+        is_not_null,
+        lazy_transaction_formatter,
+    ),
+    RPC.eth_getTransactionByHash: apply_formatter_if(is_not_null, lazy_transaction_formatter),
+    RPC.eth_getTransactionReceipt: apply_formatter_if(is_not_null, lazy_receipt_formatter),
+    RPC.eth_signTransaction: apply_formatter_if(is_not_null, lazy_signed_tx_formatter),
+}
+
+
+SUBSCRIPTION_RESULT_FORMATTERS: Dict[str, Callable[..., Any]] = {
+    'newHeads': block_formatter,
+    'logs': log_entry_formatter,
+    'newPendingTransactions': to_hexbytes(32),
+    'syncing': apply_formatter_if(
+        is_dict,
+        apply_formatters_to_dict({'status': syncing_formatter}),
+    ),
+}
+
+
 ATTRDICT_FORMATTER = {
     '*': apply_formatter_if(is_dict and not_attrdict, AttributeDict.recursive)
 }
 
 METHOD_NORMALIZERS: Dict[RPCEndpoint, Callable[..., Any]] = {
     RPC.eth_getLogs: apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 0),
-    RPC.eth_newFilter: apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 0)
+    RPC.eth_newFilter: apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 0),
+    RPC.eth_subscribe: apply_formatter_if(
+        is_length(2),
+        apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 1),
+    ),
 }
 
 STANDARD_NORMALIZERS = [
@@ -485,6 +683,16 @@ def get_result_formatters(
     return compose(*formatters, attrdict_formatter)
 
 
+def get_subscription_result_formatters(subscription_type: str) -> Callable[..., Any]:
+    formatters = combine_formatters(
+        (SUBSCRIPTION_RESULT_FORMATTERS,),
+        subscription_type
+    )
+    attrdict_formatter = apply_formatter_if(is_dict and not_attrdict, AttributeDict.recursive)
+
+    return compose(attrdict_formatter, *formatters)
+
+
 def get_error_formatters(
     method_name: Union[RPCEndpoint, Callable[..., RPCEndpoint]]
 ) -> Dict[str, Callable[..., Any]]:
@@ -0,0 +1,193 @@
+import bisect
+from contextvars import (
+    ContextVar,
+)
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+# upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class RequestSample(NamedTuple):
+    """
+    The measurements of a single request, as handed to metrics exporters.
+    """
+    method: str
+    duration: float
+    provider_duration: Optional[float]
+    error: bool
+    bytes_sent: int
+    bytes_received: int
+
+
+class RequestRecord:
+    """
+    Collects the measurements of the request being made in the current
+    thread or task, while it is being made.
+    """
+    __slots__ = ('provider_duration', 'bytes_sent', 'bytes_received')
+
+    def __init__(self) -> None:
+        self.provider_duration: float = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+current_request: 'ContextVar[Optional[RequestRecord]]' = ContextVar(
+    'web3_current_request', default=None
+)
+
+
+def record_bytes_sent(size: int) -> None:
+    record = current_request.get()
+    if record is not None:
+        record.bytes_sent += size
+
+
+def record_bytes_received(size: int) -> None:
+    record = current_request.get()
+    if record is not None:
+        record.bytes_received += size
+
+
+def split_request_bytes(
+    shared_record: RequestRecord, records: Sequence[Optional[RequestRecord]]
+) -> None:
+    """
+    Splits the bytes of a request made on behalf of several others evenly
+    among their records, the first one taking what is left over.
+    """
+    count = len(records)
+    for index, record in enumerate(records):
+        if record is not None:
+            record.bytes_sent += shared_record.bytes_sent // count
+            record.bytes_received += shared_record.bytes_received // count
+            if index == 0:
+                record.bytes_sent += shared_record.bytes_sent % count
+                record.bytes_received += shared_record.bytes_received % count
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: Sequence[float]=DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float = None
+        self.max: float = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the histogram as a dict, with the count of observations of at
+        most each bucket bound, as Prometheus does.
+        """
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'buckets': buckets,
+        }
+
+
+class MethodMetrics:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram(buckets)
+        self.provider_latency = LatencyHistogram(buckets)
+        self.middleware_latency = LatencyHistogram(buckets)
+
+    def record(self, sample: RequestSample) -> None:
+        self.requests += 1
+        self.errors += sample.error
+        self.bytes_sent += sample.bytes_sent
+        self.bytes_received += sample.bytes_received
+        self.latency.observe(sample.duration)
+        if sample.provider_duration is not None:
+            self.provider_latency.observe(sample.provider_duration)
+            self.middleware_latency.observe(max(0.0, sample.duration - sample.provider_duration))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'latency': self.latency.snapshot(),
+            'provider_latency': self.provider_latency.snapshot(),
+            'middleware_latency': self.middleware_latency.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """
+    Per RPC method counts of requests, errors and bytes, and histograms of
+    their latency, split into the time spent in the provider and the time
+    spent in middlewares.
+
+    Each recorded request is also handed to every exporter, as a
+    :class:`RequestSample`, so that it can be forwarded to a metrics system.
+    """
+    def __init__(
+        self,
+        exporters: Sequence[Callable[[RequestSample], Any]]=(),
+        buckets: Sequence[float]=DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self.exporters: List[Callable[[RequestSample], Any]] = list(exporters)
+        self._methods: Dict[str, MethodMetrics] = {}
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter: Callable[[RequestSample], Any]) -> None:
+        self.exporters.append(exporter)
+
+    def remove_exporter(self, exporter: Callable[[RequestSample], Any]) -> None:
+        self.exporters.remove(exporter)
+
+    def record(self, sample: RequestSample) -> None:
+        with self._lock:
+            method_metrics = self._methods.get(sample.method)
+            if method_metrics is None:
+                method_metrics = self._methods[sample.method] = MethodMetrics(self.buckets)
+            method_metrics.record(sample)
+        for exporter in self.exporters:
+            exporter(sample)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                method: method_metrics.snapshot()
+                for method, method_metrics in self._methods.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
@@ -0,0 +1,259 @@
+import asyncio
+from contextvars import (
+    ContextVar,
+)
+import inspect
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from web3.middleware import (
+    MiddlewarePipeline,
+    get_rpc_methods,
+)
+from web3.types import (
+    Middleware,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+# the name under which the time spent in the provider itself is reported
+PROVIDER_LAYER = 'provider'
+
+
+class LayerStats:
+    """
+    The number of calls to one middleware layer for one RPC method, and the
+    time spent in them.  Inclusive time counts the layers inside this one and
+    the provider, exclusive time only counts the layer's own code.
+    """
+    __slots__ = ('calls', 'inclusive', 'exclusive')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+
+    def record(self, inclusive: float, exclusive: float) -> None:
+        self.calls += 1
+        self.inclusive += inclusive
+        self.exclusive += exclusive
+
+    def add(self, other: 'LayerStats') -> None:
+        self.calls += other.calls
+        self.inclusive += other.inclusive
+        self.exclusive += other.exclusive
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'inclusive': self.inclusive,
+            'exclusive': self.exclusive,
+        }
+
+
+class _Frame:
+    __slots__ = ('child_time',)
+
+    def __init__(self) -> None:
+        self.child_time = 0.0
+
+
+_current_frame: 'ContextVar[Optional[_Frame]]' = ContextVar(
+    'web3_middleware_frame', default=None
+)
+
+
+def get_layer_name(name: Any) -> str:
+    if isinstance(name, str):
+        return name
+    return getattr(name, '__name__', repr(name))
+
+
+class MiddlewareProfiler:
+    """
+    Times every layer of the middleware onion separately, per RPC method.
+
+    Each middleware is wrapped so that the time between a request entering it
+    and its response leaving it is recorded as the layer's inclusive time.
+    The inclusive time of the next layer in is subtracted from it to give the
+    layer's exclusive time, so that the exclusive times of all layers and of
+    the provider add up to the time of the whole request.
+    """
+    def __init__(self) -> None:
+        self._stats: Dict[Tuple[str, Any], LayerStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, layer: str, method: Any, inclusive: float, exclusive: float) -> None:
+        with self._lock:
+            stats = self._stats.get((layer, method))
+            if stats is None:
+                stats = self._stats[(layer, method)] = LayerStats()
+            stats.record(inclusive, exclusive)
+
+    def _finish(self, layer: str, method: Any, frame: _Frame, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        parent = _current_frame.get()
+        if parent is not None:
+            parent.child_time += elapsed
+        self.record(layer, method, elapsed, max(0.0, elapsed - frame.child_time))
+
+    def profile_request(
+        self,
+        layer: str,
+        make_request: Callable[[RPCEndpoint, Any], Any],
+        is_coroutine: bool=False,
+    ) -> Callable[[RPCEndpoint, Any], Any]:
+        """
+        Wraps one request function of the onion, so that its time is recorded
+        under ``layer``.
+        """
+        if is_coroutine:
+            async def profiled_coroutine(method: RPCEndpoint, params: Any) -> RPCResponse:
+                frame = _Frame()
+                token = _current_frame.set(frame)
+                start = time.perf_counter()
+                try:
+                    response = make_request(method, params)
+                    # middlewares that pass the request on may return the
+                    # awaitable of the next layer without awaiting it
+                    if inspect.isawaitable(response):
+                        response = await response
+                    return response
+                finally:
+                    _current_frame.reset(token)
+                    self._finish(layer, method, frame, start)
+            return profiled_coroutine
+
+        def profiled(method: RPCEndpoint, params: Any) -> RPCResponse:
+            frame = _Frame()
+            token = _current_frame.set(frame)
+            start = time.perf_counter()
+            try:
+                return make_request(method, params)
+            finally:
+                _current_frame.reset(token)
+                self._finish(layer, method, frame, start)
+        return profiled
+
+    def profile_middleware(self, layer: str, middleware: Middleware) -> Middleware:
+        def profiled_middleware(
+            make_request: Callable[[RPCEndpoint, Any], Any], web3: 'Web3'
+        ) -> Callable[[RPCEndpoint, Any], Any]:
+            request_fn = middleware(make_request, web3)
+            profiled = self.profile_request(
+                layer,
+                request_fn,
+                asyncio.iscoroutinefunction(web3.provider.make_request),
+            )
+            # type ignored b/c mypy doesn't allow attributes on functions
+            profiled.rpc_methods = get_rpc_methods(request_fn)  # type: ignore
+            return profiled
+        return profiled_middleware
+
+    def combine_middlewares(
+        self,
+        named_middlewares: Sequence[Tuple[Any, Middleware]],
+        web3: 'Web3',
+        provider_request_fn: Callable[[RPCEndpoint, Any], Any],
+    ) -> Callable[..., RPCResponse]:
+        """
+        Like :class:`web3.middleware.MiddlewarePipeline`, but takes
+        ``(name, middleware)`` pairs, outermost first, and profiles every
+        layer and the provider.
+        """
+        return MiddlewarePipeline(
+            middlewares=[
+                self.profile_middleware(get_layer_name(name), middleware)
+                for name, middleware in named_middlewares
+            ],
+            web3=web3,
+            provider_request_fn=self.profile_request(
+                PROVIDER_LAYER,
+                provider_request_fn,
+                asyncio.iscoroutinefunction(web3.provider.make_request),
+            ),
+        ).make_request
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Returns the calls, inclusive and exclusive time of every layer, by RPC
+        method and then by layer name.
+        """
+        snapshot: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with self._lock:
+            for (layer, method), stats in self._stats.items():
+                method_name = method if isinstance(method, str) else repr(method)
+                snapshot.setdefault(method_name, {})[layer] = stats.snapshot()
+        return snapshot
+
+    def _get_layer_totals(self, method: str=None) -> List[Tuple[str, LayerStats]]:
+        totals: Dict[str, LayerStats] = {}
+        with self._lock:
+            for (layer, layer_method), stats in self._stats.items():
+                if method is not None and layer_method != method:
+                    continue
+                if layer not in totals:
+                    totals[layer] = LayerStats()
+                totals[layer].add(stats)
+        return sorted(totals.items(), key=lambda item: item[1].exclusive, reverse=True)
+
+    def most_expensive(
+        self, limit: int=10, method: str=None
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Returns up to ``limit`` ``(layer, stats)`` pairs, with the most
+        exclusive time first, for ``method`` or summed over all methods.
+        """
+        return [
+            (layer, stats.snapshot())
+            for layer, stats in self._get_layer_totals(method)[:limit]
+        ]
+
+    def report(self, limit: int=10, method: str=None) -> str:
+        """
+        Returns a table of the ``limit`` most expensive layers, as returned by
+        :meth:`most_expensive`.
+        """
+        totals = self._get_layer_totals(method)
+        total = sum(stats.exclusive for _, stats in totals)
+        layers = [(layer, stats.snapshot()) for layer, stats in totals[:limit]]
+        rows = [
+            ('layer', 'calls', 'inclusive ms', 'exclusive ms', 'exclusive %', 'per call us'),
+        ] + [
+            (
+                layer,
+                str(stats['calls']),
+                '%.3f' % (stats['inclusive'] * 1000),
+                '%.3f' % (stats['exclusive'] * 1000),
+                '%.1f' % (100 * stats['exclusive'] / total if total else 0),
+                '%.1f' % (stats['exclusive'] * 1e6 / stats['calls']),
+            )
+            for layer, stats in layers
+        ]
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        lines = [
+            '  '.join(
+                cell.ljust(width) if column == 0 else cell.rjust(width)
+                for column, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        ]
+        lines.insert(1, '  '.join('-' * width for width in widths))
+        return '\n'.join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -1,5 +1,10 @@
+import threading
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
+    Hashable,
 )
 
 from eth_typing import (
@@ -7,13 +12,29 @@ from eth_typing import (
 )
 import lru
 import requests
+from requests.adapters import (
+    DEFAULT_POOLSIZE,
+    HTTPAdapter,
+)
+from urllib3 import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
+    PoolManager,
+)
+from urllib3.connection import (
+    HTTPConnection,
+    HTTPSConnection,
+)
 
 from web3._utils.caching import (
     generate_cache_key,
 )
 
+if TYPE_CHECKING:
+    from aiohttp import ClientSession  # noqa: F401
 
-def _remove_session(key: str, session: requests.Session) -> None:
+
+def _remove_session(key: Hashable, session: requests.Session) -> None:
     session.close()
 
 
@@ -27,11 +48,184 @@ def _get_session(*args: Any, **kwargs: Any) -> requests.Session:
     return _session_cache[cache_key]
 
 
-def make_post_request(endpoint_uri: URI, data: bytes, *args: Any, **kwargs: Any) -> bytes:
+class _ConnectionCountingMixin:
+    def connect(self) -> None:
+        # pooled connection objects connect again after the server closed the
+        # previous socket, so it is the connects that are counted
+        on_connect = getattr(self, 'on_connect', None)
+        if on_connect is not None:
+            on_connect()
+        super().connect()  # type: ignore
+
+
+class ConnectionCountingHTTPConnection(_ConnectionCountingMixin, HTTPConnection):
+    pass
+
+
+class ConnectionCountingHTTPSConnection(_ConnectionCountingMixin, HTTPSConnection):
+    pass
+
+
+class _ConnectionCountingPoolMixin:
+    def _new_conn(self) -> Any:
+        connection = super()._new_conn()  # type: ignore
+        # set by ConnectionCountingPoolManager once the pool is created
+        connection.on_connect = getattr(self, 'on_new_connection', None)
+        return connection
+
+    def _put_conn(self, conn: Any) -> None:
+        # the pool queue holds the idle connections, and a None for each
+        # connection that may still be opened, so closing a connection and
+        # putting back a None keeps at most max_idle_connections idle without
+        # changing how many connections may be open at once
+        max_idle_connections = getattr(self, 'max_idle_connections', None)
+        pool = getattr(self, 'pool', None)
+        if conn is not None and max_idle_connections is not None and pool is not None:
+            with pool.mutex:
+                idle_connections = sum(1 for pooled in pool.queue if pooled is not None)
+            if idle_connections >= max_idle_connections:
+                conn.close()
+                conn = None
+        super()._put_conn(conn)  # type: ignore
+
+
+class ConnectionCountingHTTPConnectionPool(_ConnectionCountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = ConnectionCountingHTTPConnection
+
+
+class ConnectionCountingHTTPSConnectionPool(_ConnectionCountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = ConnectionCountingHTTPSConnection
+
+
+class ConnectionCountingPoolManager(PoolManager):
+    def __init__(
+        self,
+        *args: Any,
+        on_new_connection: Callable[[], None],
+        max_idle_connections: int=None,
+        **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.on_new_connection = on_new_connection
+        self.max_idle_connections = max_idle_connections
+        self.pool_classes_by_scheme = {
+            'http': ConnectionCountingHTTPConnectionPool,
+            'https': ConnectionCountingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, *args: Any, **kwargs: Any) -> HTTPConnectionPool:
+        pool = super()._new_pool(*args, **kwargs)
+        pool.on_new_connection = self.on_new_connection  # type: ignore
+        pool.max_idle_connections = self.max_idle_connections  # type: ignore
+        return pool
+
+
+class ConnectionCountingAdapter(HTTPAdapter):
+    """
+    An ``HTTPAdapter`` that counts the requests it sends and the connections
+    it opens to send them.  Every request that did not need a new connection
+    reused one from the pool.
+
+    With ``max_idle_connections`` set, connections given back to a pool that
+    already holds that many idle connections are closed.
+    """
+    def __init__(self, *args: Any, max_idle_connections: int=None, **kwargs: Any) -> None:
+        self.max_idle_connections = max_idle_connections
+        self._counter_lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool=False, **pool_kwargs: Any
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = ConnectionCountingPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            on_new_connection=self._count_new_connection,
+            max_idle_connections=self.max_idle_connections,
+            **pool_kwargs
+        )
+
+    def _count_new_connection(self) -> None:
+        with self._counter_lock:
+            self.connections_opened += 1
+
+    def send(self, *args: Any, **kwargs: Any) -> requests.Response:
+        with self._counter_lock:
+            self.requests_sent += 1
+        return super().send(*args, **kwargs)
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        with self._counter_lock:
+            return {
+                'requests': self.requests_sent,
+                'connections_opened': self.connections_opened,
+                'connections_reused': max(0, self.requests_sent - self.connections_opened),
+            }
+
+
+def make_session(
+    pool_size: int=DEFAULT_POOLSIZE, max_connections: int=None, keep_alive: bool=True
+) -> requests.Session:
+    """
+    Returns a session that keeps up to ``pool_size`` connections to each host
+    open for reuse.  With ``max_connections`` set, no more than that many
+    connections are open at once and requests wait for a free connection
+    instead of opening more, while still no more than ``pool_size`` are kept
+    open once they are idle.
+    """
+    if max_connections is None:
+        adapter = ConnectionCountingAdapter(pool_maxsize=pool_size)
+    elif max_connections < pool_size:
+        raise ValueError(
+            "max_connections ({0}) must not be smaller than pool_size ({1})".format(
+                max_connections,
+                pool_size,
+            )
+        )
+    else:
+        adapter = ConnectionCountingAdapter(
+            pool_maxsize=max_connections, pool_block=True, max_idle_connections=pool_size,
+        )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def make_post_request(
+    endpoint_uri: URI,
+    data: bytes,
+    *args: Any,
+    session: requests.Session=None,
+    **kwargs: Any
+) -> bytes:
     kwargs.setdefault('timeout', 10)
-    session = _get_session(endpoint_uri)
+    if session is None:
+        session = _get_session(endpoint_uri)
     # https://github.com/python/mypy/issues/2582
     response = session.post(endpoint_uri, data=data, *args, **kwargs)  # type: ignore
     response.raise_for_status()
 
     return response.content
+
+
+async def async_make_post_request(
+    endpoint_uri: URI, data: bytes, session: 'ClientSession', *args: Any, **kwargs: Any
+) -> bytes:
+    from aiohttp import (
+        ClientTimeout,
+    )
+
+    kwargs.setdefault('timeout', ClientTimeout(10))
+    async with session.post(endpoint_uri, data=data, *args, **kwargs) as response:
+        response.raise_for_status()
+        return await response.read()
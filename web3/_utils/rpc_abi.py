@@ -81,8 +81,10 @@ class RPC:
     eth_signTypedData = RPCEndpoint("eth_signTypedData")
     eth_submitHashrate = RPCEndpoint("eth_submitHashrate")
     eth_submitWork = RPCEndpoint("eth_submitWork")
+    eth_subscribe = RPCEndpoint("eth_subscribe")
     eth_syncing = RPCEndpoint("eth_syncing")
     eth_uninstallFilter = RPCEndpoint("eth_uninstallFilter")
+    eth_unsubscribe = RPCEndpoint("eth_unsubscribe")
 
     # evm
     evm_mine = RPCEndpoint("evm_mine")
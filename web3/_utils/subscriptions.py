@@ -0,0 +1,82 @@
+import asyncio
+from types import (
+    TracebackType,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Type,
+)
+
+from web3._utils.method_formatters import (
+    get_subscription_result_formatters,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+
+class Subscription:
+    """
+    A subscription created with ``eth_subscribe``.
+
+    Notifications are pushed by the node and buffered by the provider until
+    they are read with :meth:`get_next`, or by iterating over the
+    subscription (``for`` and ``async for`` are both supported).
+    """
+    def __init__(self, web3: "Web3", subscription_id: str, subscription_type: str) -> None:
+        self.web3 = web3
+        self.subscription_id = subscription_id
+        self.subscription_type = subscription_type
+        self.result_formatter: Callable[..., Any] = get_subscription_result_formatters(
+            subscription_type
+        )
+
+    def __str__(self) -> str:
+        return "Subscription to {0} ({1})".format(self.subscription_type, self.subscription_id)
+
+    def get_next(self, timeout: float=None) -> Any:
+        message = self.web3.provider.get_subscription_message(  # type: ignore
+            self.subscription_id, timeout
+        )
+        return self.result_formatter(message)
+
+    async def coro_get_next(self, timeout: float=None) -> Any:
+        message = await self.web3.provider.coro_get_subscription_message(  # type: ignore
+            self.subscription_id, timeout
+        )
+        return self.result_formatter(message)
+
+    def unsubscribe(self) -> bool:
+        try:
+            return self.web3.eth.unsubscribe(self.subscription_id)
+        finally:
+            self.web3.provider.remove_subscription(self.subscription_id)  # type: ignore
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            yield self.get_next()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.coro_get_next()
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(
+        self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType
+    ) -> None:
+        self.unsubscribe()
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(
+        self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType
+    ) -> None:
+        await asyncio.get_event_loop().run_in_executor(None, self.unsubscribe)
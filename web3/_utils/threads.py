@@ -113,7 +113,7 @@ class ThreadWithReturn(threading.Thread, Generic[TReturn]):
 
 
 class TimerClass(threading.Thread):
-    def __init__(self, interval: int, callback: Callable[..., Any], *args: Any) -> None:
+    def __init__(self, interval: float, callback: Callable[..., Any], *args: Any) -> None:
         threading.Thread.__init__(self)
         self.callback = callback
         self.terminate_event = threading.Event()
@@ -1430,10 +1430,12 @@ def call_contract_function(
         fn_kwargs=kwargs,
     )
 
-    if block_id is None:
-        return_data = web3.eth.call(call_transaction)
-    else:
-        return_data = web3.eth.call(call_transaction, block_identifier=block_id)
+    # contract functions return their usual results, even within raw_results
+    with web3.manager.formatted_results():
+        if block_id is None:
+            return_data = web3.eth.call(call_transaction)
+        else:
+            return_data = web3.eth.call(call_transaction, block_identifier=block_id)
 
     if fn_abi is None:
         fn_abi = find_matching_fn_abi(contract_abi, web3.codec, function_identifier, args, kwargs)
@@ -1523,7 +1525,8 @@ def transact_with_contract_function(
         fn_kwargs=kwargs,
     )
 
-    txn_hash = web3.eth.sendTransaction(transact_transaction)
+    with web3.manager.formatted_results():
+        txn_hash = web3.eth.sendTransaction(transact_transaction)
     return txn_hash
 
 
@@ -1552,7 +1555,8 @@ def estimate_gas_for_function(
         fn_kwargs=kwargs,
     )
 
-    gas_estimate = web3.eth.estimateGas(estimate_transaction)
+    with web3.manager.formatted_results():
+        gas_estimate = web3.eth.estimateGas(estimate_transaction)
     return gas_estimate
 
 
@@ -1581,7 +1585,8 @@ def build_transaction_for_function(
         fn_kwargs=kwargs,
     )
 
-    prepared_transaction = fill_transaction_defaults(web3, prepared_transaction)
+    with web3.manager.formatted_results():
+        prepared_transaction = fill_transaction_defaults(web3, prepared_transaction)
 
     return prepared_transaction
 
@@ -12,7 +12,9 @@ from typing import (
     List,
     Mapping,
     MutableMapping,
+    Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -116,6 +118,88 @@ class AttributeDict(ReadableAttributeDict[TKey, TValue], Hashable):
             return False
 
 
+class LazyAttributeDict(AttributeDict[TKey, TValue]):
+    """
+    An AttributeDict over a raw mapping, which formats each value the first
+    time it is read and keeps the formatted value.  Values are formatted with
+    the formatter given for their key, or else ``default_formatter``, if any.
+
+    Copies and pickles are plain AttributeDicts with every value formatted.
+    """
+    __slots__ = ('_raw', '_formatters', '_default_formatter')
+    _raw: Mapping[TKey, Any]
+    _formatters: Mapping[TKey, Callable[[Any], TValue]]
+    _default_formatter: Optional[Callable[[Any], TValue]]
+
+    def __init__(
+        self,
+        raw: Mapping[TKey, Any],
+        formatters: Mapping[TKey, Callable[[Any], TValue]],
+        default_formatter: Callable[[Any], TValue]=None,
+    ) -> None:
+        super().__init__({})
+        object.__setattr__(self, '_raw', raw)
+        object.__setattr__(self, '_formatters', formatters)
+        object.__setattr__(self, '_default_formatter', default_formatter)
+
+    def _format(self, key: TKey) -> TValue:
+        value = self._raw[key]
+        if key in self._formatters:
+            value = self._formatters[key](value)
+        elif self._default_formatter is not None:
+            # type ignored b/c mypy takes callables annotated on the class for methods
+            value = self._default_formatter(value)  # type: ignore
+        # formatting the same value twice from two threads is harmless
+        # type ignored b/c __dict__ expects str index type not TKey
+        self.__dict__[key] = value  # type: ignore
+        return value
+
+    def __getitem__(self, key: TKey) -> TValue:
+        try:
+            return self.__dict__[key]  # type: ignore
+        except KeyError:
+            return self._format(key)
+
+    def __getattr__(self, attr: str) -> TValue:
+        # only called for attributes that are not formatted yet
+        if attr in LazyAttributeDict.__slots__ or attr not in self._raw:
+            raise AttributeError(
+                "%r object has no attribute %r" % (self.__class__.__name__, attr)
+            )
+        return self._format(cast(TKey, attr))
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__ + "(%r)" % dict(self)
+
+    def _repr_pretty_(self, builder: Any, cycle: bool) -> None:
+        builder.text(self.__class__.__name__ + "(")
+        if cycle:
+            builder.text("<cycle>")
+        else:
+            builder.pretty(dict(self))
+        builder.text(")")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (AttributeDict, (dict(self),))
+
+    __hash__ = AttributeDict.__hash__
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        else:
+            return False
+
+
 class NamedElementOnion(Mapping[TKey, TValue]):
     """
     Add layers to an onion-shaped structure. Optionally, inject to a specific layer.
@@ -126,6 +210,9 @@ class NamedElementOnion(Mapping[TKey, TValue]):
         self, init_elements: Sequence[Any], valid_element: Callable[..., bool]=callable
     ) -> None:
         self._queue: 'OrderedDict[Any, Any]' = OrderedDict()
+        # incremented on every change, so that users can tell cheaply if
+        # anything they built from the layers is stale
+        self.version = 0
         for element in reversed(init_elements):
             if valid_element(element):
                 self.add(element)
@@ -143,6 +230,7 @@ class NamedElementOnion(Mapping[TKey, TValue]):
                 raise ValueError("You can't add the same name again, use replace instead")
 
         self._queue[name] = element
+        self.version += 1
 
     def inject(self, element: TValue, name: TKey=None, layer: int=None) -> None:
         """
@@ -170,6 +258,7 @@ class NamedElementOnion(Mapping[TKey, TValue]):
             if name is None:
                 name = cast(TKey, element)
             self._queue.move_to_end(name, last=False)
+            self.version += 1
         elif layer == len(self._queue):
             return
         else:
@@ -177,6 +266,7 @@ class NamedElementOnion(Mapping[TKey, TValue]):
 
     def clear(self) -> None:
         self._queue.clear()
+        self.version += 1
 
     def replace(self, old: TKey, new: TKey) -> TValue:
         if old not in self._queue:
@@ -187,12 +277,14 @@ class NamedElementOnion(Mapping[TKey, TValue]):
             self._replace_with_new_name(old, new)
         else:
             self._queue[old] = new
+        self.version += 1
         return to_be_replaced
 
     def remove(self, old: TKey) -> None:
         if old not in self._queue:
             raise ValueError("You can only remove something that has been added")
         del self._queue[old]
+        self.version += 1
 
     def _replace_with_new_name(self, old: TKey, new: TKey) -> None:
         self._queue[new] = new
@@ -206,6 +298,12 @@ class NamedElementOnion(Mapping[TKey, TValue]):
                 self._queue.move_to_end(key)
         del self._queue[old]
 
+    def layers(self) -> List[Tuple[TKey, TValue]]:
+        """
+        Returns the ``(name, element)`` pairs of the onion, outermost layer first.
+        """
+        return list(reversed(self._queue.items()))
+
     def __iter__(self) -> Iterator[TKey]:
         elements = self._queue.values()
         if not isinstance(elements, Sequence):
@@ -55,6 +55,9 @@ from web3._utils.filters import (
 from web3._utils.rpc_abi import (
     RPC,
 )
+from web3._utils.subscriptions import (
+    Subscription,
+)
 from web3._utils.threads import (
     Timeout,
 )
@@ -73,6 +76,7 @@ from web3.contract import (
 )
 from web3.exceptions import (
     BlockNotFound,
+    CannotHandleRequest,
     TimeExhausted,
     TransactionNotFound,
 )
@@ -92,6 +96,7 @@ from web3.types import (
     MerkleProof,
     Nonce,
     SignedTx,
+    SubscriptionType,
     SyncStatus,
     TxData,
     TxParams,
@@ -354,8 +359,9 @@ class Eth(Module):
         )
 
     def replaceTransaction(self, transaction_hash: _Hash32, new_transaction: TxParams) -> HexBytes:
-        current_transaction = get_required_transaction(self.web3, transaction_hash)
-        return replace_transaction(self.web3, current_transaction, new_transaction)
+        with self.web3.manager.formatted_results():
+            current_transaction = get_required_transaction(self.web3, transaction_hash)
+            return replace_transaction(self.web3, current_transaction, new_transaction)
 
     # todo: Update Any to stricter kwarg checking with TxParams
     # https://github.com/python/mypy/issues/4441
@@ -363,10 +369,11 @@ class Eth(Module):
         self, transaction_hash: _Hash32, **transaction_params: Any
     ) -> HexBytes:
         assert_valid_transaction_params(cast(TxParams, transaction_params))
-        current_transaction = get_required_transaction(self.web3, transaction_hash)
-        current_transaction_params = extract_valid_transaction_params(current_transaction)
-        new_transaction = merge(current_transaction_params, transaction_params)
-        return replace_transaction(self.web3, current_transaction, new_transaction)
+        with self.web3.manager.formatted_results():
+            current_transaction = get_required_transaction(self.web3, transaction_hash)
+            current_transaction_params = extract_valid_transaction_params(current_transaction)
+            new_transaction = merge(current_transaction_params, transaction_params)
+            return replace_transaction(self.web3, current_transaction, new_transaction)
 
     def sendTransaction(self, transaction: TxParams) -> HexBytes:
         # TODO: move to middleware
@@ -375,11 +382,9 @@ class Eth(Module):
 
         # TODO: move gas estimation in middleware
         if 'gas' not in transaction:
-            transaction = assoc(
-                transaction,
-                'gas',
-                get_buffered_gas_estimate(self.web3, transaction),
-            )
+            with self.web3.manager.formatted_results():
+                gas_estimate = get_buffered_gas_estimate(self.web3, transaction)
+            transaction = assoc(transaction, 'gas', gas_estimate)
 
         return self.web3.manager.request_blocking(
             RPC.eth_sendTransaction,
@@ -512,6 +517,24 @@ class Eth(Module):
             RPC.eth_uninstallFilter, [filter_id],
         )
 
+    def subscribe(
+        self, subscription_type: SubscriptionType, filter_params: FilterParams=None
+    ) -> Subscription:
+        if not hasattr(self.web3.provider, 'get_subscription_message'):
+            raise CannotHandleRequest(
+                "{0} does not support subscriptions".format(self.web3.provider)
+            )
+        params: List[Any] = [subscription_type]
+        if filter_params is not None:
+            params.append(filter_params)
+        subscription_id = self.web3.manager.request_blocking(RPC.eth_subscribe, params)
+        return Subscription(self.web3, subscription_id, subscription_type)
+
+    def unsubscribe(self, subscription_id: str) -> bool:
+        return self.web3.manager.request_blocking(
+            RPC.eth_unsubscribe, [subscription_id],
+        )
+
     @overload
     def contract(self, address: None=None, **kwargs: Any) -> Type[Contract]: ...  # noqa: E704,E501
 
@@ -543,7 +566,8 @@ class Eth(Module):
 
     def generateGasPrice(self, transaction_params: TxParams=None) -> Optional[Wei]:
         if self.gasPriceStrategy:
-            return self.gasPriceStrategy(self.web3, transaction_params)
+            with self.web3.manager.formatted_results():
+                return self.gasPriceStrategy(self.web3, transaction_params)
         return None
 
     def setGasPriceStrategy(self, gas_price_strategy: GasPriceStrategy) -> None:
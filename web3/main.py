@@ -18,7 +18,7 @@ from eth_utils import (
 from hexbytes import (
     HexBytes,
 )
-from typing import Any, cast, Dict, List, Sequence, TYPE_CHECKING
+from typing import Any, cast, ContextManager, Dict, List, Sequence, TYPE_CHECKING
 
 from eth_typing import HexStr, Primitives
 from eth_typing.abi import TypeStr
@@ -32,6 +32,9 @@ from web3._utils.abi import (
     build_strict_registry,
     map_abi_data,
 )
+from web3._utils.batching import (
+    RequestBatch,
+)
 from web3._utils.decorators import (
     deprecated_for,
 )
@@ -80,12 +83,18 @@ from web3.parity import (
 from web3.providers import (
     BaseProvider,
 )
+from web3.providers.async_rpc import (
+    AsyncHTTPProvider,
+)
 from web3.providers.eth_tester import (
     EthereumTesterProvider,
 )
 from web3.providers.ipc import (
     IPCProvider,
 )
+from web3.providers.load_balancing import (
+    LoadBalancedProvider,
+)
 from web3.providers.rpc import (
     HTTPProvider,
 )
@@ -130,9 +139,11 @@ def get_default_modules() -> Dict[str, Sequence[Any]]:
 class Web3:
     # Providers
     HTTPProvider = HTTPProvider
+    AsyncHTTPProvider = AsyncHTTPProvider
     IPCProvider = IPCProvider
     EthereumTesterProvider = EthereumTesterProvider
     WebsocketProvider = WebsocketProvider
+    LoadBalancedProvider = LoadBalancedProvider
 
     # Managers
     RequestManager = DefaultRequestManager
@@ -257,6 +268,12 @@ class Web3:
     def isConnected(self) -> bool:
         return self.provider.isConnected()
 
+    def batch_requests(self) -> RequestBatch:
+        return RequestBatch(self)
+
+    def raw_results(self) -> ContextManager[None]:
+        return self.manager.raw_results()
+
     def is_encodable(self, _type: TypeStr, value: Any) -> bool:
         return self.codec.is_encodable(_type, value)
 
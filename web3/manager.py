@@ -1,9 +1,18 @@
+from contextlib import (
+    contextmanager,
+)
+from contextvars import (
+    ContextVar,
+)
 import logging
+import threading
+import time
 from typing import (  # noqa: F401
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     NoReturn,
     Optional,
@@ -18,9 +27,22 @@ from eth_utils.toolz import (
     pipe,
 )
 
+from web3._utils.batching import (
+    MicroBatcher,
+)
 from web3._utils.decorators import (
     deprecated_for,
 )
+from web3._utils.metrics import (
+    MetricsRegistry,
+    RequestRecord,
+    RequestSample,
+    current_request,
+)
+from web3._utils.profiling import (
+    MiddlewareProfiler,
+    get_layer_name,
+)
 from web3._utils.threads import (  # noqa: F401
     ThreadWithReturn,
     spawn,
@@ -29,9 +51,12 @@ from web3.datastructures import (
     NamedElementOnion,
 )
 from web3.middleware import (
+    MiddlewarePipeline,
     abi_middleware,
     attrdict_middleware,
     gas_price_strategy_middleware,
+    get_raw_middleware,
+    get_raw_middlewares,
     name_to_address_middleware,
     normalize_errors_middleware,
     pythonic_middleware,
@@ -52,6 +77,14 @@ from web3.types import (  # noqa: F401
 if TYPE_CHECKING:
     from web3 import Web3  # noqa: F401
 
+DEFAULT_MICRO_BATCH_WAIT = 0.002
+DEFAULT_MICRO_BATCH_SIZE = 100
+
+# the request managers returning raw results in the current thread or task
+_raw_results_managers: ContextVar[Tuple['RequestManager', ...]] = ContextVar(
+    'raw_results_managers', default=(),
+)
+
 
 def apply_error_formatters(
     error_formatters: Callable[..., Any], response: RPCResponse
@@ -74,6 +107,9 @@ class RequestManager:
     ) -> None:
         self.web3 = web3
         self.pending_requests: Dict[UUID, ThreadWithReturn[RPCResponse]] = {}
+        self._thread_local = threading.local()
+        # (provider_request_fn, raw) -> (onion, provider middlewares, versions, request_func)
+        self._request_funcs: Dict[Tuple[Callable[..., Any], bool], Tuple[Any, Any, Tuple[int, int], Callable[..., RPCResponse]]] = {}  # noqa: E501
 
         if middlewares is None:
             middlewares = self.default_middlewares(web3)
@@ -87,6 +123,9 @@ class RequestManager:
 
     web3: 'Web3' = None
     _provider = None
+    _micro_batcher: MicroBatcher = None
+    metrics: MetricsRegistry = None
+    profiler: MiddlewareProfiler = None
 
     @property
     def provider(self) -> BaseProvider:
@@ -118,24 +157,271 @@ class RequestManager:
     #
     # Provider requests and response
     #
+    def enable_micro_batching(
+        self,
+        max_wait: float=DEFAULT_MICRO_BATCH_WAIT,
+        max_batch_size: int=DEFAULT_MICRO_BATCH_SIZE,
+    ) -> None:
+        """
+        Send the requests made within ``max_wait`` seconds of each other, by
+        any thread or task, to the provider as one JSON-RPC batch of at most
+        ``max_batch_size`` requests.
+        """
+        self._micro_batcher = MicroBatcher(lambda: self.provider, max_wait, max_batch_size)
+        self._request_funcs = {}
+
+    def disable_micro_batching(self) -> None:
+        self._micro_batcher = None
+        self._request_funcs = {}
+
+    @property
+    def micro_batching(self) -> bool:
+        return self._micro_batcher is not None
+
+    def enable_metrics(self, metrics: MetricsRegistry=None) -> MetricsRegistry:
+        """
+        Record the count, errors, bytes and latency of every request, per RPC
+        method, in ``metrics`` or in a new :class:`MetricsRegistry`, which is
+        returned.
+        """
+        if metrics is None:
+            metrics = MetricsRegistry()
+        self.metrics = metrics
+        return metrics
+
+    def disable_metrics(self) -> None:
+        self.metrics = None
+
+    def enable_middleware_profiling(
+        self, profiler: MiddlewareProfiler=None
+    ) -> MiddlewareProfiler:
+        """
+        Record the time spent in each middleware layer and in the provider,
+        per RPC method, in ``profiler`` or in a new :class:`MiddlewareProfiler`,
+        which is returned.
+        """
+        if profiler is None:
+            profiler = MiddlewareProfiler()
+        self.profiler = profiler
+        self._request_funcs = {}
+        return profiler
+
+    def disable_middleware_profiling(self) -> None:
+        self.profiler = None
+        self._request_funcs = {}
+
+    @contextmanager
+    def raw_results(self) -> Iterator[None]:
+        """
+        Within the context, results of the requests made from the current
+        thread or task are returned as they were decoded from the JSON-RPC
+        response.  Requests are still normalized and formatted, but the
+        middlewares which convert results are left out, or replaced by their
+        ``raw_middleware``.
+        """
+        token = _raw_results_managers.set(_raw_results_managers.get() + (self,))
+        try:
+            yield
+        finally:
+            _raw_results_managers.reset(token)
+
+    @contextmanager
+    def formatted_results(self) -> Iterator[None]:
+        """
+        Within the context, results are formatted as usual even inside
+        :meth:`raw_results`.  Web3 makes its own requests, such as those of
+        middlewares, gas price strategies and contract calls, within it, as
+        raw mode only applies to the call made by the user.
+        """
+        managers = _raw_results_managers.get()
+        token = _raw_results_managers.set(tuple(
+            manager for manager in managers if manager is not self
+        ))
+        try:
+            yield
+        finally:
+            _raw_results_managers.reset(token)
+
+    @property
+    def returning_raw_results(self) -> bool:
+        return self in _raw_results_managers.get()
+
+    def _combine_middlewares(
+        self, provider_request_fn: Callable[..., Any], raw: bool=False
+    ) -> Callable[..., RPCResponse]:
+        onion, provider_middlewares = self.middleware_onion, self.provider.middlewares
+        versions = (onion.version, getattr(provider_middlewares, 'version', None))
+        cached_onion, cached_provider_middlewares, cached_versions, request_func = (
+            self._request_funcs.get((provider_request_fn, raw), (None, None, None, None))
+        )
+        if (
+            cached_onion is not onion or
+            cached_provider_middlewares is not provider_middlewares or
+            cached_versions != versions
+        ):
+            if self.profiler is not None:
+                named_middlewares = onion.layers() + [
+                    (get_layer_name(middleware), middleware)
+                    for middleware in provider_middlewares
+                ]
+                if raw:
+                    named_middlewares = [
+                        (name, get_raw_middleware(middleware))
+                        for name, middleware in named_middlewares
+                        if get_raw_middleware(middleware) is not None
+                    ]
+                request_func = self.profiler.combine_middlewares(
+                    named_middlewares,
+                    web3=self.web3,
+                    provider_request_fn=provider_request_fn,
+                )
+            else:
+                # type ignored b/c tuple(MiddlewareOnion) converts to tuple of middlewares
+                middlewares: Sequence[Middleware] = tuple(onion) + tuple(provider_middlewares)  # type: ignore # noqa: E501
+                if raw:
+                    middlewares = get_raw_middlewares(middlewares)
+                request_func = MiddlewarePipeline(
+                    middlewares=middlewares,
+                    web3=self.web3,
+                    provider_request_fn=provider_request_fn,
+                ).make_request
+            self._request_funcs[(provider_request_fn, raw)] = (
+                onion, provider_middlewares, versions, request_func
+            )
+        return request_func
+
+    def _get_provider_make_request(self) -> Callable[..., RPCResponse]:
+        if self._is_batching():
+            return self._make_batched_request
+        if self._micro_batcher is not None:
+            return self._micro_batcher.make_request
+        return self.provider.make_request
+
+    def _get_provider_request_fn(self) -> Callable[..., RPCResponse]:
+        if self.metrics is not None:
+            return self._make_measured_provider_request
+        return self._get_provider_make_request()
+
+    def _get_request_func(self) -> Callable[..., RPCResponse]:
+        raw = self.returning_raw_results
+        if (
+            raw or
+            self.metrics is not None or
+            self._micro_batcher is not None or
+            self.profiler is not None or
+            self._is_batching()
+        ):
+            return self._combine_middlewares(self._get_provider_request_fn(), raw)
+        return self.provider.request_func(self.web3, self.middleware_onion)
+
+    def _is_batching(self) -> bool:
+        return getattr(self._thread_local, 'batch', None) is not None
+
+    def _make_batched_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        # A RequestBatch runs each of its calls in a thread of its own, the
+        # pipeline is shared with every other request, only the batch differs
+        return self._thread_local.batch.defer_request(method, params)
+
+    def _make_measured_provider_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        make_request = self._get_provider_make_request()
+        record = current_request.get()
+        if record is None:
+            return make_request(method, params)
+
+        start = time.perf_counter()
+        try:
+            return make_request(method, params)
+        finally:
+            record.provider_duration = time.perf_counter() - start
+
+    async def _coro_make_measured_provider_request(
+        self, method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        if self._micro_batcher is not None:
+            make_request = self._micro_batcher.coro_make_request
+        else:
+            # type ignored b/c make_request is a coroutine in async providers
+            make_request = self.provider.make_request  # type: ignore
+        record = current_request.get()
+        if record is None:
+            return await make_request(method, params)
+
+        start = time.perf_counter()
+        try:
+            return await make_request(method, params)
+        finally:
+            record.provider_duration = time.perf_counter() - start
+
+    def _record_request(
+        self, method: Any, record: RequestRecord, start: float, error: bool
+    ) -> None:
+        # a failing exporter must not replace the result or error of the request
+        try:
+            self.metrics.record(RequestSample(
+                method=method if isinstance(method, str) else repr(method),
+                duration=time.perf_counter() - start,
+                provider_duration=record.provider_duration,
+                error=error,
+                bytes_sent=record.bytes_sent,
+                bytes_received=record.bytes_received,
+            ))
+        except Exception:
+            self.logger.exception("Failed to record request metrics. Method: %s", method)
+
     def _make_request(
         self, method: Union[RPCEndpoint, Callable[..., RPCEndpoint]], params: Any
     ) -> RPCResponse:
-        request_func = self.provider.request_func(
-            self.web3,
-            self.middleware_onion)
+        request_func = self._get_request_func()
         self.logger.debug("Making request. Method: %s", method)
-        return request_func(method, params)
+        # the requests middlewares make to serve this one are web3's own
+        with self.formatted_results():
+            if self.metrics is None:
+                return request_func(method, params)
+
+            record = RequestRecord()
+            token = current_request.set(record)
+            start = time.perf_counter()
+            error = True
+            try:
+                response = request_func(method, params)
+                error = 'error' in response
+                return response
+            finally:
+                current_request.reset(token)
+                self._record_request(method, record, start, error)
 
     async def _coro_make_request(
         self, method: Union[RPCEndpoint, Callable[..., RPCEndpoint]], params: Any
     ) -> RPCResponse:
-        request_func = self.provider.request_func(
-            self.web3,
-            self.middleware_onion)
+        raw = self.returning_raw_results
+        if self.metrics is not None:
+            request_func = self._combine_middlewares(self._coro_make_measured_provider_request, raw)
+        elif self._micro_batcher is not None:
+            request_func = self._combine_middlewares(self._micro_batcher.coro_make_request, raw)
+        elif raw or self.profiler is not None:
+            request_func = self._combine_middlewares(self.provider.make_request, raw)
+        else:
+            request_func = self.provider.request_func(
+                self.web3,
+                self.middleware_onion)
         self.logger.debug("Making request. Method: %s", method)
-        # type ignored b/c request_func is an awaitable in async model
-        return await request_func(method, params)  # type: ignore
+        # the requests middlewares make to serve this one are web3's own
+        with self.formatted_results():
+            if self.metrics is None:
+                # type ignored b/c request_func is an awaitable in async model
+                return await request_func(method, params)  # type: ignore
+
+            record = RequestRecord()
+            token = current_request.set(record)
+            start = time.perf_counter()
+            error = True
+            try:
+                response = await request_func(method, params)  # type: ignore
+                error = 'error' in response
+                return response
+            finally:
+                current_request.reset(token)
+                self._record_request(method, record, start, error)
 
     def request_blocking(
         self,
@@ -18,17 +18,26 @@ from .attrdict import (  # noqa: F401
     attrdict_middleware,
 )
 from .cache import (  # noqa: F401
+    SQLiteCache,
+    _finalized_block_cache_middleware as finalized_block_cache_middleware,
     _latest_block_based_cache_middleware as latest_block_based_cache_middleware,
     _simple_cache_middleware as simple_cache_middleware,
     _time_based_cache_middleware as time_based_cache_middleware,
+    construct_finalized_block_cache_middleware,
     construct_latest_block_based_cache_middleware,
+    construct_persistent_cache_middleware,
     construct_simple_cache_middleware,
     construct_time_based_cache_middleware,
 )
+from .coalescing import (  # noqa: F401
+    construct_request_coalescing_middleware,
+    request_coalescing_middleware,
+)
 from .exception_handling import (  # noqa: F401
     construct_exception_handler_middleware,
 )
 from .exception_retry_request import (  # noqa: F401
+    construct_exception_retry_middleware,
     http_retry_request_middleware,
 )
 from .filter import (  # noqa: F401
@@ -57,9 +66,22 @@ from .normalize_errors import (  # noqa: F401
 from .normalize_request_parameters import (  # noqa: F401
     request_parameter_normalizer,
 )
+from .pipeline import (  # noqa: F401
+    MiddlewarePipeline,
+    get_raw_middleware,
+    get_raw_middlewares,
+    get_rpc_methods,
+)
 from .pythonic import (  # noqa: F401
+    lazy_pythonic_middleware,
     pythonic_middleware,
 )
+from .rate_limit import (  # noqa: F401
+    construct_rate_limit_middleware,
+)
+from .records import (  # noqa: F401
+    record_middleware,
+)
 from .signing import (  # noqa: F401
     construct_sign_and_send_raw_middleware,
 )
@@ -41,3 +41,8 @@ def attrdict_middleware(
         else:
             return response
     return middleware
+
+
+# left out when results are returned raw
+# type ignored b/c mypy doesn't allow attributes on functions
+attrdict_middleware.raw_middleware = None  # type: ignore
@@ -7,14 +7,31 @@ from typing import (
     Callable,
     Collection,
     Dict,
+    List,
+    MutableMapping,
+    Optional,
     Set,
+    Tuple,
     Type,
     cast,
 )
 
+from eth_utils import (
+    is_dict,
+    is_hex,
+    is_integer,
+    is_list_like,
+    is_text,
+)
+from hexbytes import (
+    HexBytes,
+)
 import lru
 
-from web3._utils.caching import (
+from web3._utils.caching import (  # noqa: F401
+    ShardedCache,
+    SQLiteCache,
+    generate_cache_digest,
     generate_cache_key,
 )
 from web3._utils.compat import (
@@ -98,7 +115,8 @@ def _should_cache(method: RPCEndpoint, params: Any, response: RPCResponse) -> bo
 def construct_simple_cache_middleware(
     cache_class: Type[Dict[Any, Any]],
     rpc_whitelist: Collection[RPCEndpoint]=SIMPLE_CACHE_RPC_WHITELIST,
-    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache
+    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache,
+    shard_count: int=1,
 ) -> Middleware:
     """
     Constructs a middleware which caches responses based on the request
@@ -109,38 +127,37 @@ def construct_simple_cache_middleware(
     :param should_cache_fn: A callable which accepts ``method`` ``params`` and
         ``response`` and returns a boolean as to whether the response should be
         cached.
+    :param shard_count: The number of shards the cache is split into, each
+        made by ``cache_class``, so that threads can use them at the same time.
     """
     def simple_cache_middleware(
         make_request: Callable[[RPCEndpoint, Any], RPCResponse], web3: "Web3"
     ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
-        cache = cache_class()
-        lock = threading.Lock()
+        cache = ShardedCache(cache_class, shard_count)
 
         def middleware(
             method: RPCEndpoint, params: Any
         ) -> RPCResponse:
-            lock_acquired = lock.acquire(blocking=False)
+            if method not in rpc_whitelist:
+                return make_request(method, params)
 
+            cache_key = generate_cache_key((method, params))
             try:
-                if lock_acquired and method in rpc_whitelist:
-                    cache_key = generate_cache_key((method, params))
-                    if cache_key not in cache:
-                        response = make_request(method, params)
-                        if should_cache_fn(method, params, response):
-                            cache[cache_key] = response
-                        return response
-                    return cache[cache_key]
-                else:
-                    return make_request(method, params)
-            finally:
-                if lock_acquired:
-                    lock.release()
+                return cache[cache_key]
+            except KeyError:
+                pass
+
+            response = make_request(method, params)
+            if should_cache_fn(method, params, response):
+                cache[cache_key] = response
+            return response
         return middleware
     return simple_cache_middleware
 
 
 _simple_cache_middleware = construct_simple_cache_middleware(
-    cache_class=cast(Type[Dict[Any, Any]], functools.partial(lru.LRU, 256)),
+    cache_class=cast(Type[Dict[Any, Any]], functools.partial(lru.LRU, 16)),
+    shard_count=16,
 )
 
 
@@ -200,7 +217,8 @@ def construct_time_based_cache_middleware(
     cache_class: Callable[..., Dict[Any, Any]],
     cache_expire_seconds: int=15,
     rpc_whitelist: Collection[RPCEndpoint]=TIME_BASED_CACHE_RPC_WHITELIST,
-    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache
+    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache,
+    shard_count: int=1,
 ) -> Middleware:
     """
     Constructs a middleware which caches responses based on the request
@@ -213,47 +231,46 @@ def construct_time_based_cache_middleware(
     :param should_cache_fn: A callable which accepts ``method`` ``params`` and
         ``response`` and returns a boolean as to whether the response should be
         cached.
+    :param shard_count: The number of shards the cache is split into, each
+        made by ``cache_class``, so that threads can use them at the same time.
     """
     def time_based_cache_middleware(
         make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
     ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
-        cache = cache_class()
-        lock = threading.Lock()
+        cache = ShardedCache(cache_class, shard_count)
 
         def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
-            lock_acquired = lock.acquire(blocking=False)
+            if method not in rpc_whitelist:
+                return make_request(method, params)
 
+            cache_key = generate_cache_key((method, params))
             try:
-                if lock_acquired and method in rpc_whitelist:
-                    cache_key = generate_cache_key((method, params))
-                    if cache_key in cache:
-                        # check that the cached response is not expired.
-                        cached_at, cached_response = cache[cache_key]
-                        cached_for = time.time() - cached_at
+                cached_at, cached_response = cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                # check that the cached response is not expired.
+                cached_for = time.time() - cached_at
 
-                        if cached_for <= cache_expire_seconds:
-                            return cached_response
-                        else:
-                            del cache[cache_key]
+                if cached_for <= cache_expire_seconds:
+                    return cached_response
+                else:
+                    cache.pop(cache_key, None)
 
-                    # cache either missed or expired so make the request.
-                    response = make_request(method, params)
+            # cache either missed or expired so make the request.
+            response = make_request(method, params)
 
-                    if should_cache_fn(method, params, response):
-                        cache[cache_key] = (time.time(), response)
+            if should_cache_fn(method, params, response):
+                cache[cache_key] = (time.time(), response)
 
-                    return response
-                else:
-                    return make_request(method, params)
-            finally:
-                if lock_acquired:
-                    lock.release()
+            return response
         return middleware
     return time_based_cache_middleware
 
 
 _time_based_cache_middleware = construct_time_based_cache_middleware(
-    cache_class=functools.partial(lru.LRU, 256),
+    cache_class=functools.partial(lru.LRU, 16),
+    shard_count=16,
 )
 
 
@@ -334,7 +351,8 @@ def construct_latest_block_based_cache_middleware(
     rpc_whitelist: Collection[RPCEndpoint]=BLOCK_NUMBER_RPC_WHITELIST,
     average_block_time_sample_size: int=240,
     default_average_block_time: int=15,
-    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache
+    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache,
+    shard_count: int=1,
 ) -> Middleware:
     """
     Constructs a middleware which caches responses based on the request
@@ -347,6 +365,8 @@ def construct_latest_block_based_cache_middleware(
     :param should_cache_fn: A callable which accepts ``method`` ``params`` and
         ``response`` and returns a boolean as to whether the response should be
         cached.
+    :param shard_count: The number of shards the cache is split into, each
+        made by ``cache_class``, so that threads can use them at the same time.
 
     .. note::
         This middleware avoids re-fetching the current latest block for each
@@ -357,7 +377,7 @@ def construct_latest_block_based_cache_middleware(
     def latest_block_based_cache_middleware(
         make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
     ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
-        cache = cache_class()
+        cache = ShardedCache(cache_class, shard_count)
         block_info: BlockInfoCache = {}
 
         def _update_block_info_cache() -> None:
@@ -406,38 +426,444 @@ def construct_latest_block_based_cache_middleware(
                 # latest block has not been fetched so we fetch it.
                 block_info['latest_block'] = web3.eth.getBlock('latest')
 
-        lock = threading.Lock()
+        block_info_lock = threading.Lock()
 
         def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
-            lock_acquired = lock.acquire(blocking=False)
+            should_try_cache = (
+                method in rpc_whitelist and
+                not _is_latest_block_number_request(method, params)
+            )
+            if not should_try_cache:
+                return make_request(method, params)
+
+            # the block info is updated by one thread at a time, the others,
+            # and the requests made to update it, use the block info as it is
+            if block_info_lock.acquire(blocking=False):
+                try:
+                    _update_block_info_cache()
+                finally:
+                    block_info_lock.release()
+            if 'latest_block' not in block_info:
+                return make_request(method, params)
 
+            latest_block_hash = block_info['latest_block']['hash']
+            cache_key = generate_cache_key((latest_block_hash, method, params))
             try:
-                should_try_cache = (
-                    lock_acquired and
-                    method in rpc_whitelist and
-                    not _is_latest_block_number_request(method, params)
-                )
-                if should_try_cache:
-                    _update_block_info_cache()
-                    latest_block_hash = block_info['latest_block']['hash']
-                    cache_key = generate_cache_key((latest_block_hash, method, params))
-                    if cache_key in cache:
-                        return cache[cache_key]
-
-                    response = make_request(method, params)
-                    if should_cache_fn(method, params, response):
-                        cache[cache_key] = response
-                    return response
-                else:
-                    return make_request(method, params)
-            finally:
-                if lock_acquired:
-                    lock.release()
+                return cache[cache_key]
+            except KeyError:
+                pass
+
+            response = make_request(method, params)
+            if should_cache_fn(method, params, response):
+                cache[cache_key] = response
+            return response
         return middleware
     return latest_block_based_cache_middleware
 
 
 _latest_block_based_cache_middleware = construct_latest_block_based_cache_middleware(
-    cache_class=functools.partial(lru.LRU, 256),
+    cache_class=functools.partial(lru.LRU, 16),
     rpc_whitelist=BLOCK_NUMBER_RPC_WHITELIST,
+    shard_count=16,
+)
+
+
+PERSISTENT_CACHE_RPC_WHITELIST = cast(Set[RPCEndpoint], {
+    'web3_sha3',
+    'eth_chainId',
+    # the results for a block hash never change
+    'eth_getBlockByHash',
+    'eth_getBlockTransactionCountByHash',
+    'eth_getTransactionByBlockHashAndIndex',
+    'eth_getUncleByBlockHashAndIndex',
+    'eth_getUncleCountByBlockHash',
+    # cached once the block of the transaction is final
+    'eth_getTransactionByHash',
+    'eth_getTransactionReceipt',
+    # cached at a block pinned by hash, or at a final block number
+    'eth_call',
+    'eth_getBalance',
+    'eth_getCode',
+    'eth_getStorageAt',
+    'eth_getTransactionCount',
+})
+
+BLOCK_HASH_RPC_METHODS = cast(Set[RPCEndpoint], {
+    'web3_sha3',
+    'eth_getBlockByHash',
+    'eth_getBlockTransactionCountByHash',
+    'eth_getTransactionByBlockHashAndIndex',
+    'eth_getUncleByBlockHashAndIndex',
+    'eth_getUncleCountByBlockHash',
+})
+
+TRANSACTION_RPC_METHODS = cast(Set[RPCEndpoint], {
+    'eth_getTransactionByHash',
+    'eth_getTransactionReceipt',
+})
+
+# the index of the block identifier in the params of methods reading state
+BLOCK_IDENTIFIER_PARAM_INDEX = cast(Dict[RPCEndpoint, int], {
+    'eth_call': 1,
+    'eth_getBalance': 1,
+    'eth_getCode': 1,
+    'eth_getStorageAt': 2,
+    'eth_getTransactionCount': 1,
+})
+
+
+def _to_block_number(value: Any) -> Optional[int]:
+    if is_integer(value):
+        return value
+    elif is_text(value) and is_hex(value) and len(value) <= 18:
+        return int(value, 16)
+    else:
+        return None
+
+
+def _get_block_identifier(method: RPCEndpoint, params: Any) -> Any:
+    index = BLOCK_IDENTIFIER_PARAM_INDEX[method]
+    if is_list_like(params) and len(params) > index:
+        return params[index]
+    else:
+        return 'latest'
+
+
+def construct_persistent_cache_middleware(
+    cache_class: Callable[..., MutableMapping[str, Any]],
+    rpc_whitelist: Collection[RPCEndpoint]=PERSISTENT_CACHE_RPC_WHITELIST,
+    finality_depth: int=64,
+    head_refresh_seconds: float=15,
+    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache
+) -> Middleware:
+    """
+    Constructs a middleware which caches the responses which can never
+    change, in a cache that may outlive the process, like
+    :class:`~web3._utils.caching.SQLiteCache`.
+
+    Responses are cached for blocks looked up by hash, for transactions and
+    receipts once their block is ``finality_depth`` blocks below the latest
+    block, and for state read at a block pinned by hash or at a block number
+    that deep.  Cache keys include the chain id, so that one cache can be
+    shared by nodes of different chains.
+
+    The responses are cached as they come from the provider, so the
+    middleware must be inside the pythonic middleware, where they are still
+    plain JSON.
+
+    :param cache_class: A callable returning a dictionary-like object.
+    :param rpc_whitelist: A set of RPC methods which may have their responses cached.
+    :param finality_depth: The number of blocks after which a block is
+        taken not to be reorganized any more.
+    :param head_refresh_seconds: How long the latest block number is used
+        for before it is requested again.
+    :param should_cache_fn: A callable which accepts ``method`` ``params`` and
+        ``response`` and returns a boolean as to whether the response should be
+        cached.
+    """
+    def persistent_cache_middleware(
+        make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        cache = cache_class()
+        lock = threading.Lock()
+        # the eth_chainId response, and the latest block number with when it was requested
+        chain_id_response: Dict[str, RPCResponse] = {}
+        head: Dict[str, Tuple[int, float]] = {}
+
+        def get_chain_id_response() -> Optional[RPCResponse]:
+            with lock:
+                if 'response' not in chain_id_response:
+                    response = make_request(RPCEndpoint('eth_chainId'), [])
+                    if 'result' not in response:
+                        return None
+                    chain_id_response['response'] = response
+                return chain_id_response['response']
+
+        def get_head() -> Optional[int]:
+            with lock:
+                if 'head' not in head or time.time() - head['head'][1] > head_refresh_seconds:
+                    response = make_request(RPCEndpoint('eth_blockNumber'), [])
+                    block_number = _to_block_number(response.get('result'))
+                    if block_number is None:
+                        return None
+                    head['head'] = (block_number, time.time())
+                return head['head'][0]
+
+        def is_final(block_number: Optional[int]) -> bool:
+            if block_number is None:
+                return False
+            # a head that is out of date only makes this more cautious
+            latest_block_number = get_head()
+            return (
+                latest_block_number is not None and
+                block_number <= latest_block_number - finality_depth
+            )
+
+        def is_final_block_identifier(block_identifier: Any) -> bool:
+            if is_dict(block_identifier):
+                # EIP-1898 block identifiers
+                if 'blockHash' in block_identifier:
+                    return True
+                block_identifier = block_identifier.get('blockNumber')
+            if block_identifier == 'earliest':
+                return True
+            return is_final(_to_block_number(block_identifier))
+
+        def may_be_cached(method: RPCEndpoint, params: Any) -> bool:
+            if method in BLOCK_IDENTIFIER_PARAM_INDEX:
+                block_identifier = _get_block_identifier(method, params)
+                return not (is_text(block_identifier) and block_identifier in {'latest', 'pending'})
+            return True
+
+        def is_immutable(method: RPCEndpoint, params: Any, response: RPCResponse) -> bool:
+            if method in BLOCK_HASH_RPC_METHODS:
+                return True
+            elif method in TRANSACTION_RPC_METHODS:
+                return is_final(_to_block_number(response['result'].get('blockNumber')))
+            elif method in BLOCK_IDENTIFIER_PARAM_INDEX:
+                return is_final_block_identifier(_get_block_identifier(method, params))
+            else:
+                return False
+
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method not in rpc_whitelist:
+                return make_request(method, params)
+
+            chain_id = get_chain_id_response()
+            if method == 'eth_chainId' and chain_id is not None:
+                return chain_id
+            if chain_id is None or not may_be_cached(method, params):
+                return make_request(method, params)
+
+            cache_key = generate_cache_digest((chain_id['result'], method, params))
+            try:
+                return cache[cache_key]
+            except KeyError:
+                pass
+
+            response = make_request(method, params)
+            if should_cache_fn(method, params, response) and is_immutable(
+                method, params, response
+            ):
+                cache[cache_key] = response
+            return response
+        return middleware
+    return persistent_cache_middleware
+
+
+FINALIZED_BLOCK_RPC_WHITELIST = cast(Set[RPCEndpoint], {
+    'eth_getBlockByNumber',
+    'eth_getBlockTransactionCountByNumber',
+    'eth_getTransactionByBlockNumberAndIndex',
+    'eth_getUncleByBlockNumberAndIndex',
+    'eth_getUncleCountByBlockNumber',
+    'eth_getTransactionReceipt',
+    'eth_getLogs',
+})
+
+
+def _to_block_hash(value: Any) -> Optional[HexBytes]:
+    if value is None:
+        return None
+    else:
+        return HexBytes(value)
+
+
+def _get_highest_block_number(method: RPCEndpoint, params: Any, result: Any) -> Optional[int]:
+    """
+    Returns the number of the newest block the result depends on, or ``None``
+    if the result is not for a block given by number.
+    """
+    if method == 'eth_getTransactionReceipt':
+        return _to_block_number(result.get('blockNumber'))
+    elif not is_list_like(params) or not params:
+        return None
+    elif method == 'eth_getLogs':
+        log_filter = params[0]
+        if not is_dict(log_filter) or 'blockHash' in log_filter:
+            return None
+        from_block = _to_block_number(log_filter.get('fromBlock', 'latest'))
+        to_block = _to_block_number(log_filter.get('toBlock', 'latest'))
+        if from_block is None or to_block is None:
+            return None
+        return max(from_block, to_block)
+    elif params[0] == 'earliest':
+        return 0
+    else:
+        return _to_block_number(params[0])
+
+
+def _get_block_hashes(method: RPCEndpoint, result: Any) -> Dict[int, HexBytes]:
+    """
+    Returns the hashes of the blocks the result was read from, by number.
+    """
+    if method == 'eth_getBlockByNumber':
+        blocks = [(result.get('number'), result.get('hash'))]
+    elif method in {'eth_getTransactionByBlockNumberAndIndex', 'eth_getTransactionReceipt'}:
+        blocks = [(result.get('blockNumber'), result.get('blockHash'))]
+    elif method == 'eth_getLogs' and is_list_like(result):
+        blocks = [(log.get('blockNumber'), log.get('blockHash')) for log in result]
+    else:
+        blocks = []
+
+    block_hashes = {}
+    for block_number, block_hash in blocks:
+        block_number = _to_block_number(block_number)
+        if block_number is not None and block_hash is not None:
+            block_hashes[block_number] = _to_block_hash(block_hash)
+    return block_hashes
+
+
+def construct_finalized_block_cache_middleware(
+    cache_class: Callable[..., Dict[Any, Any]],
+    rpc_whitelist: Collection[RPCEndpoint]=FINALIZED_BLOCK_RPC_WHITELIST,
+    confirmations: int=12,
+    head_refresh_seconds: float=15,
+    tracked_block_count: int=4096,
+    should_cache_fn: Callable[[RPCEndpoint, Any, RPCResponse], bool]=_should_cache
+) -> Middleware:
+    """
+    Constructs a middleware which caches the responses for blocks given by
+    number, for receipts and for logs, once their blocks are ``confirmations``
+    blocks below the latest block.
+
+    The middleware keeps the hash of each block it has cached results for,
+    and checks the newest of them against the chain each time it requests the
+    latest block number.  When a reorg changes the hash of a block, the cached
+    responses for that block and the blocks after it are dropped.
+
+    :param cache_class: Any dictionary-like object
+    :param rpc_whitelist: A set of RPC methods which may have their responses cached.
+    :param confirmations: The number of blocks a block must be below the
+        latest block before responses for it are cached.
+    :param head_refresh_seconds: How long the latest block number is used
+        for before it is requested again.
+    :param tracked_block_count: The number of block hashes kept to detect
+        reorgs with.
+    :param should_cache_fn: A callable which accepts ``method`` ``params`` and
+        ``response`` and returns a boolean as to whether the response should be
+        cached.
+    """
+    def finalized_block_cache_middleware(
+        make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        cache = cache_class()
+        canonical_hashes: "lru.LRU[int, HexBytes]" = lru.LRU(tracked_block_count)
+        # the first block changed by each reorg, in the order they were found
+        reorgs: List[int] = []
+        head: Dict[str, Tuple[int, float]] = {}
+        # guards reorgs, head and canonical_hashes, and is never held across requests
+        lock = threading.Lock()
+        # held by the one thread refreshing the head
+        refresh_lock = threading.Lock()
+
+        def invalidate_from(block_number: int) -> None:
+            reorgs.append(block_number)
+            for tracked_block_number in canonical_hashes.keys():
+                if tracked_block_number >= block_number:
+                    del canonical_hashes[tracked_block_number]
+            head.clear()
+
+        def check_canonical_hashes() -> None:
+            with lock:
+                tracked_hashes = sorted(canonical_hashes.items(), reverse=True)
+            common_ancestor = -1
+            for block_number, known_hash in tracked_hashes:
+                response = make_request(
+                    RPCEndpoint('eth_getBlockByNumber'), [hex(block_number), False]
+                )
+                if 'result' not in response:
+                    return
+                elif response['result'] is not None:
+                    block_hash = _to_block_hash(response['result'].get('hash'))
+                    if block_hash == known_hash:
+                        common_ancestor = block_number
+                        break
+            if tracked_hashes and common_ancestor != tracked_hashes[0][0]:
+                with lock:
+                    invalidate_from(common_ancestor + 1)
+
+        def get_head() -> Optional[int]:
+            with lock:
+                latest_head = head.get('head')
+            if latest_head is not None and time.time() - latest_head[1] <= head_refresh_seconds:
+                return latest_head[0]
+            elif not refresh_lock.acquire(blocking=False):
+                # another thread is refreshing the head, the last one is lower
+                # than the new one, so it is safe to use meanwhile
+                return None if latest_head is None else latest_head[0]
+
+            try:
+                response = make_request(RPCEndpoint('eth_blockNumber'), [])
+                block_number = _to_block_number(response.get('result'))
+                if block_number is None:
+                    return None
+                check_canonical_hashes()
+                with lock:
+                    head['head'] = (block_number, time.time())
+                return block_number
+            finally:
+                refresh_lock.release()
+
+        def record_block_hashes(block_hashes: Dict[int, HexBytes]) -> None:
+            with lock:
+                for block_number, block_hash in sorted(block_hashes.items()):
+                    known_hash = canonical_hashes.get(block_number)
+                    if known_hash is None:
+                        canonical_hashes[block_number] = block_hash
+                    elif known_hash != block_hash:
+                        # the blocks since the last block known to be
+                        # unchanged may have changed as well
+                        unchanged_block_numbers = [
+                            tracked for tracked in canonical_hashes.keys() if tracked < block_number
+                        ]
+                        invalidate_from(max(unchanged_block_numbers, default=-1) + 1)
+                        break
+
+        def is_current(highest_block_number: int, generation: int) -> bool:
+            # reorgs is only appended to, so no reorg since the response was
+            # cached needs no lock to tell
+            if generation == len(reorgs):
+                return True
+            with lock:
+                return all(
+                    block_number > highest_block_number for block_number in reorgs[generation:]
+                )
+
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method not in rpc_whitelist:
+                return make_request(method, params)
+
+            cache_key = generate_cache_key((method, params))
+            try:
+                highest_block_number, generation, response = cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                if is_current(highest_block_number, generation):
+                    return response
+                cache.pop(cache_key, None)
+
+            generation = len(reorgs)
+            response = make_request(method, params)
+            if not should_cache_fn(method, params, response):
+                return response
+
+            highest_block_number = _get_highest_block_number(method, params, response['result'])
+            latest_block_number = get_head()
+            if (
+                highest_block_number is not None and
+                latest_block_number is not None and
+                highest_block_number <= latest_block_number - confirmations
+            ):
+                record_block_hashes(_get_block_hashes(method, response['result']))
+                cache[cache_key] = (highest_block_number, generation, response)
+            return response
+        return middleware
+    return finalized_block_cache_middleware
+
+
+_finalized_block_cache_middleware = construct_finalized_block_cache_middleware(
+    cache_class=cast(Type[Dict[Any, Any]], functools.partial(lru.LRU, 256)),
+    rpc_whitelist=FINALIZED_BLOCK_RPC_WHITELIST,
 )
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    Set,
+    cast,
+)
+
+from web3._utils.caching import (
+    generate_cache_key,
+)
+from web3.types import (
+    Middleware,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+# methods that only read from the node, so that callers asking the same
+# question at the same time can share one answer
+COALESCING_RPC_WHITELIST = cast(Set[RPCEndpoint], {
+    'web3_clientVersion',
+    'web3_sha3',
+    'net_version',
+    'net_peerCount',
+    'net_listening',
+    'eth_protocolVersion',
+    'eth_chainId',
+    'eth_syncing',
+    'eth_coinbase',
+    'eth_mining',
+    'eth_hashrate',
+    'eth_gasPrice',
+    'eth_accounts',
+    'eth_blockNumber',
+    'eth_getBalance',
+    'eth_getStorageAt',
+    'eth_getProof',
+    'eth_getTransactionCount',
+    'eth_getBlockTransactionCountByHash',
+    'eth_getBlockTransactionCountByNumber',
+    'eth_getUncleCountByBlockHash',
+    'eth_getUncleCountByBlockNumber',
+    'eth_getCode',
+    'eth_call',
+    'eth_estimateGas',
+    'eth_getBlockByHash',
+    'eth_getBlockByNumber',
+    'eth_getTransactionByHash',
+    'eth_getTransactionByBlockHashAndIndex',
+    'eth_getTransactionByBlockNumberAndIndex',
+    'eth_getTransactionReceipt',
+    'eth_getUncleByBlockHashAndIndex',
+    'eth_getUncleByBlockNumberAndIndex',
+    'eth_getLogs',
+})
+
+
+class InFlightRequest:
+    """
+    A request being made on behalf of every thread that asked for it while
+    it was in flight.
+    """
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self._response: RPCResponse = None
+        self._exception: BaseException = None
+
+    def set_response(self, response: RPCResponse) -> None:
+        self._response = response
+        self._done.set()
+
+    def set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._done.set()
+
+    def wait(self) -> RPCResponse:
+        self._done.wait()
+        if self._exception is not None:
+            raise self._exception
+        return self._response
+
+
+def _get_request_key(method: RPCEndpoint, params: Any) -> Hashable:
+    try:
+        return generate_cache_key((method, params))
+    except TypeError:
+        return None
+
+
+def construct_request_coalescing_middleware(
+    rpc_whitelist: Collection[RPCEndpoint]=COALESCING_RPC_WHITELIST,
+) -> Middleware:
+    """
+    Constructs a middleware which makes callers that send the same
+    ``method`` and ``params`` while an identical request is in flight wait
+    for its response, instead of making a request of their own.
+
+    Works with both blocking providers and providers with an awaitable
+    ``make_request``, such as the ``AsyncHTTPProvider``.
+
+    :param rpc_whitelist: A set of RPC methods which may be coalesced.
+    """
+    def request_coalescing_middleware(
+        make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], Any]:
+        if asyncio.iscoroutinefunction(web3.provider.make_request):
+            return _coalesce_coroutines(make_request, rpc_whitelist)
+        else:
+            return _coalesce_threads(make_request, rpc_whitelist)
+    return request_coalescing_middleware
+
+
+def _coalesce_threads(
+    make_request: Callable[[RPCEndpoint, Any], RPCResponse],
+    rpc_whitelist: Collection[RPCEndpoint],
+) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+    in_flight: Dict[Hashable, InFlightRequest] = {}
+    lock = threading.Lock()
+
+    def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        key = _get_request_key(method, params) if method in rpc_whitelist else None
+        if key is None:
+            return make_request(method, params)
+
+        with lock:
+            request = in_flight.get(key)
+            is_leader = request is None
+            if is_leader:
+                request = in_flight[key] = InFlightRequest()
+        if not is_leader:
+            return request.wait()
+
+        try:
+            response = make_request(method, params)
+        except BaseException as exc:
+            request.set_exception(exc)
+            raise
+        else:
+            request.set_response(response)
+            return response
+        finally:
+            with lock:
+                del in_flight[key]
+    return middleware
+
+
+def _coalesce_coroutines(
+    make_request: Callable[[RPCEndpoint, Any], Awaitable[RPCResponse]],
+    rpc_whitelist: Collection[RPCEndpoint],
+) -> Callable[[RPCEndpoint, Any], Awaitable[RPCResponse]]:
+    # requests are only shared between callers on the same event loop
+    in_flight: Dict[Any, 'asyncio.Future[RPCResponse]'] = {}
+
+    async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        key = _get_request_key(method, params) if method in rpc_whitelist else None
+        if key is None:
+            return await make_request(method, params)
+
+        loop_key = (id(asyncio.get_event_loop()), key)
+        future = in_flight.get(loop_key)
+        if future is None:
+            future = asyncio.ensure_future(make_request(method, params))
+            in_flight[loop_key] = future
+            future.add_done_callback(lambda _: in_flight.pop(loop_key, None))
+        # a caller that is cancelled must not cancel the request for the others
+        return await asyncio.shield(future)
+    return middleware
+
+
+request_coalescing_middleware = construct_request_coalescing_middleware()
@@ -1,10 +1,24 @@
+from collections import (
+    deque,
+)
+from email.utils import (
+    parsedate_to_datetime,
+)
+import random
+import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Collection,
+    Deque,
+    Optional,
     Type,
 )
+from weakref import (
+    WeakKeyDictionary,
+)
 
 from requests.exceptions import (
     ConnectionError,
@@ -14,12 +28,14 @@ from requests.exceptions import (
 )
 
 from web3.types import (
+    Middleware,
     RPCEndpoint,
     RPCResponse,
 )
 
 if TYPE_CHECKING:
     from web3 import Web3  # noqa: F401
+    from web3.providers import BaseProvider  # noqa: F401
 
 whitelist = [
     'admin',
@@ -87,33 +103,183 @@ def check_if_retry_on_failure(method: RPCEndpoint) -> bool:
         return False
 
 
+# responses that ask the client to come back later
+RETRY_AFTER_STATUS_CODES = {429, 503}
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of the requests made in the last ``window``
+    seconds, so that a struggling node gets at most ``ratio`` times more
+    traffic from retries.  ``min_retries`` retries are always allowed in a
+    window, so that a quiet client can still retry.
+    """
+    def __init__(self, ratio: float=0.2, min_retries: int=10, window: float=10) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] <= now - self.window:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """
+        Returns whether a retry fits in the budget, and counts it if it does.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+                return False
+            self._retries.append(now)
+            return True
+
+
+# the default budgets, one per provider, as the middlewares of a provider are
+# built again whenever its middlewares change
+_provider_retry_budgets: 'WeakKeyDictionary[BaseProvider, RetryBudget]' = WeakKeyDictionary()
+_provider_retry_budgets_lock = threading.Lock()
+
+
+def get_provider_retry_budget(provider: "BaseProvider") -> RetryBudget:
+    with _provider_retry_budgets_lock:
+        retry_budget = _provider_retry_budgets.get(provider)
+        if retry_budget is None:
+            retry_budget = _provider_retry_budgets[provider] = RetryBudget()
+        return retry_budget
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """
+    Returns the number of seconds the ``Retry-After`` header of a 429 or 503
+    HTTP response asks to wait, if ``exc`` was raised for one.
+    """
+    response = getattr(exc, 'response', None)
+    if response is None or response.status_code not in RETRY_AFTER_STATUS_CODES:
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def get_backoff(attempt: int, backoff_factor: float, max_backoff: float) -> float:
+    """
+    Returns a random delay of up to ``backoff_factor * 2 ** attempt``
+    seconds, capped at ``max_backoff``, so that clients that failed together
+    do not all retry at the same moment.
+    """
+    return random.uniform(0, min(max_backoff, backoff_factor * 2 ** attempt))
+
+
 def exception_retry_middleware(
     make_request: Callable[[RPCEndpoint, Any], RPCResponse],
     web3: "Web3",
     errors: Collection[Type[BaseException]],
     retries: int=5,
+    backoff_factor: float=0.1,
+    max_backoff: float=5,
+    max_retry_after: float=30,
+    retry_budget: RetryBudget=None,
 ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
     """
     Creates middleware that retries failed HTTP requests. Is a default
     middleware for HTTPProvider.
+
+    Retries wait an exponentially growing, randomized delay, or as long as
+    the ``Retry-After`` header of a 429 or 503 response asks if that is up to
+    ``max_retry_after`` seconds.  Requests are not retried once
+    ``retry_budget`` is used up, by default the budget of ``web3.provider``.
     """
+    if retry_budget is None:
+        retry_budget = get_provider_retry_budget(web3.provider)
+
     def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        retry_budget.record_request()
         if check_if_retry_on_failure(method):
             for i in range(retries):
                 try:
                     return make_request(method, params)
                 # https://github.com/python/mypy/issues/5349
-                except errors:  # type: ignore
-                    if i < retries - 1:
-                        continue
-                    else:
+                except errors as exc:  # type: ignore
+                    if i >= retries - 1:
                         raise
+
+                    delay = get_backoff(i, backoff_factor, max_backoff)
+                    retry_after = get_retry_after(exc)
+                    if retry_after is not None:
+                        if retry_after > max_retry_after:
+                            raise
+                        delay = max(delay, retry_after)
+
+                    if not retry_budget.try_retry():
+                        raise
+                    time.sleep(delay)
             return None
         else:
             return make_request(method, params)
     return middleware
 
 
+def construct_exception_retry_middleware(
+    errors: Collection[Type[BaseException]]=(ConnectionError, HTTPError, Timeout, TooManyRedirects),
+    retries: int=5,
+    backoff_factor: float=0.1,
+    max_backoff: float=5,
+    max_retry_after: float=30,
+    retry_budget: RetryBudget=None,
+) -> Middleware:
+    """
+    Constructs a middleware which retries requests that raise one of
+    ``errors``, like ``http_retry_request_middleware`` but configurable.
+
+    :param errors: The exceptions to retry on.
+    :param retries: How many times a request is made at most.
+    :param backoff_factor: The first retry waits up to this many seconds,
+        each later one up to twice as long as the one before.
+    :param max_backoff: The longest a retry waits, unless asked for longer
+        by a ``Retry-After`` header.
+    :param max_retry_after: Requests asked to wait longer than this by a
+        ``Retry-After`` header are not retried.
+    :param retry_budget: The :class:`RetryBudget` to spend retries from.  By
+        default each provider gets its own.
+    """
+    def retry_middleware(
+        make_request: Callable[[RPCEndpoint, Any], RPCResponse], web3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        return exception_retry_middleware(
+            make_request,
+            web3,
+            errors,
+            retries,
+            backoff_factor=backoff_factor,
+            max_backoff=max_backoff,
+            max_retry_after=max_retry_after,
+            retry_budget=retry_budget,
+        )
+    return retry_middleware
+
+
 def http_retry_request_middleware(
     make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
 ) -> Callable[[RPCEndpoint, Any], Any]:
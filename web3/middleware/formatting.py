@@ -53,7 +53,14 @@ def construct_web3_formatting_middleware(
             },
             web3_formatters_builder(w3),
         )
-        return apply_formatters(make_request=make_request, **formatters)
+
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            return apply_formatters(method, params, make_request, **formatters)
+
+        # requests for methods without formatters skip this middleware
+        # type ignored b/c mypy doesn't allow attributes on functions
+        middleware.rpc_methods = frozenset().union(*formatters.values())  # type: ignore
+        return middleware
 
     return formatter_middleware
 
@@ -32,4 +32,6 @@ def gas_price_strategy_middleware(
                     transaction = assoc(transaction, 'gasPrice', generated_gas_price)
                     return make_request(method, [transaction])
         return make_request(method, params)
+    # type ignored b/c mypy doesn't allow attributes on functions
+    middleware.rpc_methods = {'eth_sendTransaction'}  # type: ignore
     return middleware
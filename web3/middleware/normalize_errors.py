@@ -40,4 +40,6 @@ def normalize_errors_middleware(
                 return result
         else:
             return result
+    # type ignored b/c mypy doesn't allow attributes on functions
+    middleware.rpc_methods = {'eth_getTransactionReceipt'}  # type: ignore
     return middleware
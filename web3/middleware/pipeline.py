@@ -0,0 +1,113 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+from web3.types import (
+    Middleware,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+
+def get_rpc_methods(request_fn: Callable[..., Any]) -> Optional[Collection[RPCEndpoint]]:
+    """
+    Returns the RPC methods a middleware handles, as declared by setting
+    ``rpc_methods`` on the request function it returns, or ``None`` if it
+    handles every method.
+    """
+    return getattr(request_fn, 'rpc_methods', None)
+
+
+def get_raw_middleware(middleware: Middleware) -> Optional[Middleware]:
+    """
+    Returns the middleware to use in place of ``middleware`` when results are
+    returned raw.  Middlewares which convert results set it as their
+    ``raw_middleware`` attribute, or set that to ``None`` if they are to be
+    left out.  Other middlewares are used as they are.
+    """
+    return getattr(middleware, 'raw_middleware', middleware)
+
+
+def get_raw_middlewares(middlewares: Sequence[Middleware]) -> List[Middleware]:
+    raw_middlewares = (get_raw_middleware(middleware) for middleware in middlewares)
+    return [middleware for middleware in raw_middlewares if middleware is not None]
+
+
+class MiddlewarePipeline:
+    """
+    The middlewares combined with the provider request function, like
+    :func:`web3.middleware.combine_middlewares` does, except that a request
+    skips the layers which declare that they do not handle its method.
+
+    Each middleware is still built once, so that state it keeps is shared by
+    all methods.  The function a layer is given as ``make_request`` looks up
+    the next layer handling the method it is called with, and the layers for
+    each method are worked out on its first request and then cached.  Layers
+    that handle every method are called directly, as in the combined onion.
+    """
+    def __init__(
+        self,
+        middlewares: Sequence[Middleware],
+        web3: 'Web3',
+        provider_request_fn: Callable[[RPCEndpoint, Any], Any],
+    ) -> None:
+        self.provider_request_fn = provider_request_fn
+        self._layers: List[Callable[[RPCEndpoint, Any], Any]] = [None] * len(middlewares)
+        self._rpc_methods: List[Optional[Collection[RPCEndpoint]]] = [None] * len(middlewares)
+        for index in reversed(range(len(middlewares))):
+            layer = middlewares[index](self._get_next_request_fn(index + 1), web3)
+            self._layers[index] = layer
+            self._rpc_methods[index] = get_rpc_methods(layer)
+        # the entry point of the pipeline, without the indirection of __call__
+        self.make_request = self._get_next_request_fn(0)
+
+    def _get_next_request_fn(self, index: int) -> Callable[[RPCEndpoint, Any], Any]:
+        if index == len(self._layers):
+            return self.provider_request_fn
+        elif self._rpc_methods[index] is None:
+            # a layer that handles every method is called directly
+            return self._layers[index]
+        else:
+            return self._route_from(index)
+
+    def _find_request_fn(
+        self, index: int, method: RPCEndpoint
+    ) -> Callable[[RPCEndpoint, Any], Any]:
+        for layer, rpc_methods in zip(self._layers[index:], self._rpc_methods[index:]):
+            if rpc_methods is None or method in rpc_methods:
+                return layer
+        return self.provider_request_fn
+
+    def _route_from(self, index: int) -> Callable[[RPCEndpoint, Any], Any]:
+        routes: Dict[RPCEndpoint, Callable[[RPCEndpoint, Any], Any]] = {}
+
+        def make_request(method: RPCEndpoint, params: Any) -> Any:
+            try:
+                request_fn = routes[method]
+            except KeyError:
+                request_fn = routes[method] = self._find_request_fn(index, method)
+            return request_fn(method, params)
+        return make_request
+
+    def get_layers(self, method: RPCEndpoint) -> List[Callable[[RPCEndpoint, Any], Any]]:
+        """
+        Returns the request functions a request for ``method`` goes through,
+        outermost first and ending with the provider request function.
+        """
+        return [
+            layer for layer, rpc_methods in zip(self._layers, self._rpc_methods)
+            if rpc_methods is None or method in rpc_methods
+        ] + [self.provider_request_fn]
+
+    def __call__(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self.make_request(method, params)
@@ -1,12 +1,83 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+)
+
 from web3._utils.method_formatters import (
+    FUSED_RESULT_FORMATTERS,
+    LAZY_RESULT_FORMATTERS,
     PYTHONIC_REQUEST_FORMATTERS,
     PYTHONIC_RESULT_FORMATTERS,
 )
+from web3.datastructures import (
+    NamedElementOnion,
+)
+from web3.middleware.attrdict import (
+    attrdict_middleware,
+)
 from web3.middleware.formatting import (
     construct_formatting_middleware,
 )
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
 
-pythonic_middleware = construct_formatting_middleware(
+_pythonic_middleware = construct_formatting_middleware(
     request_formatters=PYTHONIC_REQUEST_FORMATTERS,
     result_formatters=PYTHONIC_RESULT_FORMATTERS,
 )
+
+_fused_pythonic_middleware = construct_formatting_middleware(
+    request_formatters=PYTHONIC_REQUEST_FORMATTERS,
+    result_formatters=FUSED_RESULT_FORMATTERS,
+)
+
+lazy_pythonic_middleware = construct_formatting_middleware(
+    request_formatters=PYTHONIC_REQUEST_FORMATTERS,
+    result_formatters=LAZY_RESULT_FORMATTERS,
+)
+
+# used in place of the pythonic middlewares when results are returned raw
+_raw_pythonic_middleware = construct_formatting_middleware(
+    request_formatters=PYTHONIC_REQUEST_FORMATTERS,
+)
+# type ignored b/c mypy doesn't allow attributes on functions
+lazy_pythonic_middleware.raw_middleware = _raw_pythonic_middleware  # type: ignore
+
+
+def is_wrapped_by_attrdict(web3: "Web3") -> bool:
+    """
+    Whether the attrdict middleware is the layer right outside the pythonic
+    middleware in the middleware onion of ``web3``.
+    """
+    middlewares = getattr(getattr(web3, 'manager', None), 'middleware_onion', None)
+    if not isinstance(middlewares, NamedElementOnion):
+        return False
+    layers = list(middlewares)
+    if pythonic_middleware not in layers:
+        return False
+    index = layers.index(pythonic_middleware)
+    return index > 0 and layers[index - 1] is attrdict_middleware
+
+
+def pythonic_middleware(
+    make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
+) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+    """
+    Converts results to python types.  When the attrdict middleware wraps
+    this one, as it does by default, results are converted to AttributeDicts
+    in the same pass, instead of being walked again by the attrdict middleware.
+    """
+    if is_wrapped_by_attrdict(web3):
+        return _fused_pythonic_middleware(make_request, web3)
+    else:
+        return _pythonic_middleware(make_request, web3)
+
+
+# type ignored b/c mypy doesn't allow attributes on functions
+pythonic_middleware.raw_middleware = _raw_pythonic_middleware  # type: ignore
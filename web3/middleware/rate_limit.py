@@ -0,0 +1,184 @@
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Mapping,
+)
+
+from web3.types import (
+    Middleware,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+# relative costs of methods that take a node much longer to answer than a
+# simple lookup, every other method costs 1
+DEFAULT_METHOD_COSTS = {
+    'debug_traceTransaction': 20,
+    'eth_call': 2,
+    'eth_estimateGas': 2,
+    'eth_getLogs': 5,
+    'trace_block': 20,
+    'trace_filter': 20,
+    'trace_replayTransaction': 20,
+    'trace_transaction': 20,
+}
+
+
+def is_error_response(response: RPCResponse) -> bool:
+    return 'error' in response
+
+
+class TokenBucket:
+    """
+    Allows ``rate`` tokens to be taken per second on average, and bursts of
+    up to ``capacity`` tokens.
+    """
+    def __init__(self, rate: float, capacity: float=None) -> None:
+        if rate <= 0:
+            raise ValueError("The rate must be positive, got: %r" % rate)
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def take(self, cost: float=1) -> float:
+        """
+        Takes ``cost`` tokens, or reserves them if there are not enough, and
+        returns how many seconds to wait before the reserved tokens are
+        refilled.  Costs above the capacity are charged as the capacity.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= min(cost, self.capacity)
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def acquire(self, cost: float=1) -> None:
+        delay = self.take(cost)
+        if delay:
+            time.sleep(delay)
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    Limits how many requests are in flight at once.  Like TCP congestion
+    control, the limit grows by one for every ``limit`` successful requests,
+    and is multiplied by ``backoff`` when a request fails or takes longer
+    than ``latency_target`` seconds, at most once per ``cooldown`` seconds.
+    """
+    def __init__(
+        self,
+        initial_limit: int=10,
+        min_limit: int=1,
+        max_limit: int=100,
+        backoff: float=0.5,
+        latency_target: float=None,
+        cooldown: float=1,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "The concurrency limits must satisfy 1 <= min_limit <= initial_limit <= "
+                "max_limit, got: %r, %r, %r" % (min_limit, initial_limit, max_limit)
+            )
+        if not 0 < backoff < 1:
+            raise ValueError("The backoff must be between 0 and 1, got: %r" % backoff)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._decreased_at: float = None
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, failed: bool) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            overloaded = failed or (
+                self.latency_target is not None and latency > self.latency_target
+            )
+            if not overloaded:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            elif self._decreased_at is None or now - self._decreased_at >= self.cooldown:
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+                self._decreased_at = now
+            self._condition.notify_all()
+
+
+def construct_rate_limit_middleware(
+    requests_per_second: float=None,
+    burst: float=None,
+    method_costs: Mapping[str, float]=DEFAULT_METHOD_COSTS,
+    concurrency_limit: AdaptiveConcurrencyLimit=None,
+    is_failure: Callable[[RPCResponse], bool]=is_error_response,
+) -> Middleware:
+    """
+    Constructs a middleware which keeps requests within a quota, and limits
+    how many of them are in flight at once.
+
+    The limits are shared by every provider using the middleware, so a
+    single middleware can keep all the threads of a process within one quota.
+
+    :param requests_per_second: The quota, in tokens per second.  Each
+        request takes as many tokens as its method costs, and waits until
+        there are enough.  ``None`` means no quota.
+    :param burst: How many tokens may be spent at once after a quiet period,
+        defaults to one second's worth.
+    :param method_costs: The cost of each method, methods not in it cost 1.
+    :param concurrency_limit: An :class:`AdaptiveConcurrencyLimit`, which
+        shrinks when requests fail or slow down and grows back when they
+        succeed.  ``None`` means no limit.
+    :param is_failure: Whether a response counts as a failed request for the
+        concurrency limit, by default any error response does.  Requests that
+        raise always count as failed.
+    """
+    bucket = TokenBucket(requests_per_second, burst) if requests_per_second is not None else None
+
+    def rate_limit_middleware(
+        make_request: Callable[[RPCEndpoint, Any], RPCResponse], web3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if bucket is not None:
+                bucket.acquire(method_costs.get(method, 1))
+            if concurrency_limit is None:
+                return make_request(method, params)
+
+            concurrency_limit.acquire()
+            start = time.monotonic()
+            failed = True
+            try:
+                response = make_request(method, params)
+                failed = is_failure(response)
+                return response
+            finally:
+                concurrency_limit.release(time.monotonic() - start, failed)
+        return middleware
+    return rate_limit_middleware
@@ -0,0 +1,78 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+)
+
+from eth_utils import (
+    is_dict,
+)
+from eth_utils.toolz import (
+    assoc,
+)
+
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.records import (
+    BlockRecord,
+    LogRecord,
+    ReceiptRecord,
+    Record,
+    TransactionRecord,
+    records_of,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+RECORD_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[[Any], Any]] = {
+    RPC.eth_getBlockByHash: BlockRecord,
+    RPC.eth_getBlockByNumber: BlockRecord,
+    RPC.eth_getTransactionByBlockHashAndIndex: TransactionRecord,
+    RPC.eth_getTransactionByBlockNumberAndIndex: TransactionRecord,
+    RPC.eth_getTransactionByHash: TransactionRecord,
+    RPC.eth_getTransactionReceipt: ReceiptRecord,
+    RPC.eth_getFilterChanges: records_of(LogRecord),
+    RPC.eth_getFilterLogs: records_of(LogRecord),
+    RPC.eth_getLogs: records_of(LogRecord),
+}
+
+
+def record_middleware(
+    make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
+) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+    """
+    Converts blocks, transactions, receipts and logs into compact records,
+    and any other result which is a dictionary into an AttributeDict.  Meant
+    to be used in place of the attrdict middleware.
+    """
+    def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        response = make_request(method, params)
+
+        if 'result' in response:
+            result = response['result']
+            if result is None or isinstance(result, Record):
+                return response
+            elif method in RECORD_RESULT_FORMATTERS:
+                return assoc(response, 'result', RECORD_RESULT_FORMATTERS[method](result))
+            elif is_dict(result) and not isinstance(result, AttributeDict):
+                return assoc(response, 'result', AttributeDict.recursive(result))
+            else:
+                return response
+        else:
+            return response
+    return middleware
+
+
+# left out when results are returned raw
+# type ignored b/c mypy doesn't allow attributes on functions
+record_middleware.raw_middleware = None  # type: ignore
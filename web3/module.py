@@ -40,7 +40,10 @@ def retrieve_blocking_method_call_fn(
     def caller(*args: Any, **kwargs: Any) -> RPCResponse:
         (method_str, params), response_formatters = method.process_params(module, *args, **kwargs)
         result_formatters, error_formatters = response_formatters
+        raw = w3.manager.returning_raw_results
         result = w3.manager.request_blocking(method_str, params, error_formatters)
+        if raw:
+            return result
         return apply_result_formatters(result_formatters, result)
     return caller
 
@@ -52,7 +55,10 @@ def retrieve_async_method_call_fn(
     async def caller(*args: Any, **kwargs: Any) -> RPCResponse:
         (method_str, params), response_formatters = method.process_params(module, *args, **kwargs)
         result_formatters, error_formatters = response_formatters
+        raw = w3.manager.returning_raw_results
         result = await w3.manager.coro_request(method_str, params, error_formatters)
+        if raw:
+            return result
         return apply_result_formatters(result_formatters, result)
     return caller
 
@@ -2,6 +2,9 @@ from .base import (  # noqa: F401
     BaseProvider,
     JSONBaseProvider,
 )
+from .async_rpc import (  # noqa: F401,
+    AsyncHTTPProvider,
+)
 from .ipc import (  # noqa: F401,
     IPCProvider,
 )
@@ -11,6 +14,9 @@ from .rpc import (  # noqa: F401,
 from .websocket import (  # noqa: F401,
     WebsocketProvider,
 )
+from .load_balancing import (  # noqa: F401,
+    LoadBalancedProvider,
+)
 from .auto import (  # noqa: F401,
     AutoProvider,
 )
@@ -0,0 +1,169 @@
+import asyncio
+import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from eth_typing import (
+    URI,
+)
+from eth_utils import (
+    to_dict,
+)
+
+from web3._utils.http import (
+    construct_user_agent,
+)
+from web3._utils.request import (
+    async_make_post_request,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+from .base import (
+    JSONBaseProvider,
+)
+from .rpc import (
+    get_default_endpoint,
+)
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession  # noqa: F401
+
+DEFAULT_CONNECTION_POOL_SIZE = 100
+
+
+class AsyncHTTPProvider(JSONBaseProvider):
+    """
+    HTTP provider with an awaitable ``make_request``, for use with the
+    ``coro_request`` path of the request manager.
+
+    Requests are made with a single ``aiohttp.ClientSession`` per event loop,
+    whose connection pool holds at most ``pool_size`` connections.  Requests
+    beyond that wait for a pooled connection to be released.  ``aiohttp`` is
+    only imported once the first session is made.
+    """
+    logger = logging.getLogger("web3.providers.AsyncHTTPProvider")
+    endpoint_uri = None
+    _request_kwargs = None
+
+    def __init__(
+        self,
+        endpoint_uri: URI=None,
+        request_kwargs: Any=None,
+        pool_size: int=DEFAULT_CONNECTION_POOL_SIZE,
+    ) -> None:
+        if endpoint_uri is None:
+            self.endpoint_uri = get_default_endpoint()
+        else:
+            self.endpoint_uri = endpoint_uri
+        self._request_kwargs = request_kwargs or {}
+        self.pool_size = pool_size
+        self._sessions: Dict[asyncio.AbstractEventLoop, 'ClientSession'] = {}
+        super().__init__()
+
+    def __str__(self) -> str:
+        return "Async RPC connection {0}".format(self.endpoint_uri)
+
+    @to_dict
+    def get_request_kwargs(self) -> Iterable[Tuple[str, Any]]:
+        if 'headers' not in self._request_kwargs:
+            yield 'headers', self.get_request_headers()
+        for key, value in self._request_kwargs.items():
+            yield key, value
+
+    def get_request_headers(self) -> Dict[str, str]:
+        return {
+            'Content-Type': 'application/json',
+            'User-Agent': construct_user_agent(str(type(self))),
+        }
+
+    async def get_session(self) -> 'ClientSession':
+        from aiohttp import (
+            ClientSession,
+            TCPConnector,
+        )
+
+        # aiohttp sessions are bound to the event loop they were created in
+        loop = asyncio.get_event_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = ClientSession(connector=TCPConnector(limit=self.pool_size))
+            self._sessions[loop] = session
+            # the sessions of loops that have been closed since can not be used again
+            for closed_loop in [each for each in self._sessions if each.is_closed()]:
+                await self._sessions.pop(closed_loop).close()
+        return session
+
+    async def disconnect(self) -> None:
+        loop = asyncio.get_event_loop()
+        sessions, self._sessions = self._sessions, {}
+        for session_loop, session in sessions.items():
+            if session_loop is not loop and session_loop.is_running():
+                # a session in use by another thread is closed in its own loop
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+                )
+            else:
+                await session.close()
+
+    # type ignored b/c conflict w/ def in BaseProvider
+    async def make_request(  # type: ignore
+        self, method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        self.logger.debug("Making request HTTP. URI: %s, Method: %s",
+                          self.endpoint_uri, method)
+        request_data = self.encode_rpc_request(method, params)
+        raw_response = await async_make_post_request(
+            self.endpoint_uri,
+            request_data,
+            await self.get_session(),
+            **self.get_request_kwargs()
+        )
+        response = self.decode_rpc_response(raw_response)
+        self.logger.debug("Getting response HTTP. URI: %s, "
+                          "Method: %s, Response: %s",
+                          self.endpoint_uri, method, response)
+        return response
+
+    # type ignored b/c conflict w/ def in BaseProvider
+    async def make_batch_request(  # type: ignore
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self.logger.debug("Making batch request HTTP. URI: %s, Methods: %s",
+                          self.endpoint_uri, [method for method, _ in requests])
+        request_data = self.encode_batch_rpc_request(requests)
+        raw_response = await async_make_post_request(
+            self.endpoint_uri,
+            request_data,
+            await self.get_session(),
+            **self.get_request_kwargs()
+        )
+        response = self.decode_batch_rpc_response(raw_response)
+        self.logger.debug("Getting batch response HTTP. URI: %s, Response: %s",
+                          self.endpoint_uri, response)
+        return response
+
+    # type ignored b/c conflict w/ def in JSONBaseProvider
+    async def isConnected(self) -> bool:  # type: ignore
+        from aiohttp import (
+            ClientError,
+        )
+
+        try:
+            response = await self.make_request(RPCEndpoint('web3_clientVersion'), [])
+        except (IOError, ClientError, asyncio.TimeoutError):
+            return False
+
+        assert response['jsonrpc'] == '2.0'
+        assert 'error' not in response
+
+        return True
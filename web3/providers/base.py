@@ -3,21 +3,25 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
+    List,
     Sequence,
     Tuple,
     cast,
 )
 
-from eth_utils import (
-    to_bytes,
-    to_text,
-)
-
 from web3._utils.encoding import (
     FriendlyJsonSerde,
 )
+from web3._utils.json_codecs import (
+    JSONCodec,
+)
+from web3._utils.metrics import (
+    record_bytes_received,
+    record_bytes_sent,
+)
 from web3.middleware import (
-    combine_middlewares,
+    MiddlewarePipeline,
 )
 from web3.types import (
     Middleware,
@@ -32,8 +36,8 @@ if TYPE_CHECKING:
 
 class BaseProvider:
     _middlewares: Tuple[Middleware, ...] = ()
-    # a tuple of (all_middlewares, request_func)
-    _request_func_cache: Tuple[Tuple[Middleware, ...], Callable[..., RPCResponse]] = (None, None)
+    # a tuple of (outer_middlewares, middlewares, versions, request_func)
+    _request_func_cache: Tuple[Any, Any, Tuple[int, int], Callable[..., RPCResponse]] = (None, None, None, None)  # noqa: E501
 
     @property
     def middlewares(self) -> Tuple[Middleware, ...]:
@@ -53,29 +57,52 @@ class BaseProvider:
         @param outer_middlewares is an iterable of middlewares, ordered by first to execute
         @returns a function that calls all the middleware and eventually self.make_request()
         """
-        # type ignored b/c tuple(MiddlewareOnion) converts to tuple of middlewares
-        all_middlewares: Tuple[Middleware] = tuple(outer_middlewares) + tuple(self.middlewares)  # type: ignore # noqa: E501
-
-        cache_key = self._request_func_cache[0]
-        if cache_key is None or cache_key != all_middlewares:
+        onion, middlewares, versions, request_func = self._request_func_cache
+        # the version of an onion changes whenever a layer is added, replaced
+        # or removed, which is much cheaper to check than every middleware
+        current_versions = (
+            outer_middlewares.version,
+            getattr(self._middlewares, 'version', None),
+        )
+        if (
+            onion is not outer_middlewares or
+            middlewares is not self._middlewares or
+            versions != current_versions
+        ):
+            # type ignored b/c tuple(MiddlewareOnion) converts to tuple of middlewares
+            all_middlewares: Tuple[Middleware] = tuple(outer_middlewares) + tuple(self.middlewares)  # type: ignore # noqa: E501
+            request_func = self._generate_request_func(web3, all_middlewares)
             self._request_func_cache = (
-                all_middlewares,
-                self._generate_request_func(web3, all_middlewares)
+                outer_middlewares,
+                self._middlewares,
+                current_versions,
+                request_func,
             )
-        return self._request_func_cache[-1]
+        return request_func
 
     def _generate_request_func(
         self, web3: "Web3", middlewares: Sequence[Middleware]
     ) -> Callable[..., RPCResponse]:
-        return combine_middlewares(
+        return MiddlewarePipeline(
             middlewares=middlewares,
             web3=web3,
             provider_request_fn=self.make_request,
-        )
+        ).make_request
 
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         raise NotImplementedError("Providers must implement this method")
 
+    def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        """
+        Make each of the ``(method, params)`` requests, returning the responses
+        in the same order.  Providers that can send several requests in a
+        single round trip should override this, the default implementation
+        makes the requests one at a time.
+        """
+        return [self.make_request(method, params) for method, params in requests]
+
     def isConnected(self) -> bool:
         raise NotImplementedError("Providers must implement this method")
 
@@ -83,20 +110,47 @@ class BaseProvider:
 class JSONBaseProvider(BaseProvider):
     def __init__(self) -> None:
         self.request_counter = itertools.count()
+        self._json_serde = FriendlyJsonSerde()
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._json_serde.codec
+
+    @json_codec.setter
+    def json_codec(self, codec: JSONCodec) -> None:
+        self._json_serde = FriendlyJsonSerde(codec)
+
+    def _decode_rpc_object(self, raw_response: bytes) -> Any:
+        # readers running outside the context of the request decode with this,
+        # and the bytes are counted by the caller once it has the response
+        return self._json_serde.json_decode(raw_response)
 
     def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
-        text_response = to_text(raw_response)
-        return cast(RPCResponse, FriendlyJsonSerde().json_decode(text_response))
+        record_bytes_received(len(raw_response))
+        return cast(RPCResponse, self._decode_rpc_object(raw_response))
 
-    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
-        rpc_dict = {
+    def _build_rpc_dict(self, method: RPCEndpoint, params: Any) -> Dict[str, Any]:
+        return {
             "jsonrpc": "2.0",
             "method": method,
             "params": params or [],
             "id": next(self.request_counter),
         }
-        encoded = FriendlyJsonSerde().json_encode(rpc_dict)
-        return to_bytes(text=encoded)
+
+    def _encode_rpc_object(self, rpc_object: Any) -> bytes:
+        encoded = self._json_serde.json_encode_bytes(rpc_object)
+        record_bytes_sent(len(encoded))
+        return encoded
+
+    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        return self._encode_rpc_object(self._build_rpc_dict(method, params))
+
+    def encode_batch_rpc_request(self, requests: Sequence[Tuple[RPCEndpoint, Any]]) -> bytes:
+        rpc_list = [self._build_rpc_dict(method, params) for method, params in requests]
+        return self._encode_rpc_object(rpc_list)
+
+    def decode_batch_rpc_response(self, raw_response: bytes) -> List[RPCResponse]:
+        return sort_batch_response(self.decode_rpc_response(raw_response))
 
     def isConnected(self) -> bool:
         try:
@@ -108,3 +162,35 @@ class JSONBaseProvider(BaseProvider):
         assert 'error' not in response
 
         return True
+
+
+def sort_batch_response(response: Any) -> List[RPCResponse]:
+    """
+    Batch responses may arrive in any order.  Request ids are taken from an
+    incrementing counter, so sorting by id restores the order of the requests.
+    """
+    if not isinstance(response, list):
+        # a batch that is rejected as a whole is answered with a single error
+        if isinstance(response, dict) and 'error' in response:
+            raise ValueError(response['error'])
+        raise ValueError("Expected a list of responses to the batch request, got: {0!r}".format(
+            response,
+        ))
+    for rpc_response in response:
+        # an error for a request the node could not read has no id, so there
+        # is no telling which request of the batch it answers
+        if rpc_response.get('id') is None:
+            raise ValueError(rpc_response.get('error', rpc_response))
+    return sorted(response, key=lambda rpc_response: rpc_response['id'])
+
+
+def get_response_key(rpc_message: Any) -> Any:
+    """
+    Returns the key used to match a response (or the request that caused it).
+    Batches are matched by their lowest id, as request ids are unique and
+    taken from an incrementing counter.
+    """
+    if isinstance(rpc_message, list):
+        ids = [item['id'] for item in rpc_message if item.get('id') is not None]
+        return min(ids) if ids else None
+    return rpc_message.get('id')
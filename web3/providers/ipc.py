@@ -1,11 +1,17 @@
-from json import (
-    JSONDecodeError,
+from concurrent import (
+    futures,
 )
+from contextlib import (
+    contextmanager,
+)
+import itertools
 import logging
 import os
 from pathlib import (
     Path,
 )
+import queue
+import re
 import socket
 import sys
 import threading
@@ -14,9 +20,19 @@ from types import (
 )
 from typing import (
     Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
     Type,
 )
 
+from web3._utils.metrics import (
+    record_bytes_received,
+)
 from web3._utils.threads import (
     Timeout,
 )
@@ -27,8 +43,12 @@ from web3.types import (
 
 from .base import (
     JSONBaseProvider,
+    get_response_key,
+    sort_batch_response,
 )
 
+DEFAULT_RECV_SIZE = 65536
+
 
 def get_ipc_socket(ipc_path: str, timeout: float=0.1) -> socket.socket:
     if sys.platform == 'win32':
@@ -76,6 +96,149 @@ class PersistantSocket:
         self.sock = self._open()
         return self.sock
 
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+class PersistantSocketPool:
+    """
+    Up to ``size`` sockets, each used by a single request at a time.  Idle
+    sockets are handed out most recently used first, so requests keep using
+    the connections that are already open.
+    """
+    def __init__(self, ipc_path: str, size: int) -> None:
+        if size < 1:
+            raise ValueError("The IPC socket pool size must be at least 1, got: %r" % size)
+        self.sockets = [PersistantSocket(ipc_path) for _ in range(size)]
+        self._idle_sockets: "queue.LifoQueue[PersistantSocket]" = queue.LifoQueue()
+        for persistant_socket in reversed(self.sockets):
+            self._idle_sockets.put(persistant_socket)
+
+    @contextmanager
+    def checkout(self) -> Iterator[PersistantSocket]:
+        persistant_socket = self._idle_sockets.get()
+        try:
+            yield persistant_socket
+        finally:
+            self._idle_sockets.put(persistant_socket)
+
+    def close(self) -> None:
+        for persistant_socket in self.sockets:
+            persistant_socket.close()
+
+
+class PipelinedSocket:
+    """
+    A socket shared by any number of requests at once.  Requests are written
+    whole under a lock, and a reader thread hands every response, with its
+    size, to the request with the same JSON-RPC ``id``.
+    """
+    logger = logging.getLogger("web3.providers.PipelinedSocket")
+
+    def __init__(
+        self, ipc_path: str, recv_size: int, decode_response: Callable[[bytes], Any]
+    ) -> None:
+        self.ipc_path = ipc_path
+        self.recv_size = recv_size
+        self.decode_response = decode_response
+        self.sock: socket.socket = None
+        self._lock = threading.Lock()
+        self._pending_responses: Dict[Any, "futures.Future[Any]"] = {}
+
+    def make_request(self, request_key: Any, request: bytes, timeout: float) -> Any:
+        response_future: "futures.Future[Any]" = futures.Future()
+        with self._lock:
+            sock = self._connect()
+            pending_responses = self._pending_responses
+            pending_responses[request_key] = response_future
+            try:
+                sock.sendall(request)
+            except OSError:
+                # a partly written request leaves the socket unusable
+                self._close(sock)
+                raise
+        try:
+            response, size = response_future.result(timeout)
+        except futures.TimeoutError:
+            raise Timeout(timeout)
+        finally:
+            pending_responses.pop(request_key, None)
+        # the reader thread has no access to the context of the request
+        record_bytes_received(size)
+        return response
+
+    def _connect(self) -> socket.socket:
+        if not self.ipc_path:
+            raise FileNotFoundError("cannot connect to IPC socket at path: %r" % self.ipc_path)
+
+        if self.sock is None:
+            self.sock = get_ipc_socket(self.ipc_path)
+            # responses to requests made on an earlier connection never arrive
+            # on this one, so each connection gets its own requests to answer
+            self._pending_responses = {}
+            reader = threading.Thread(
+                target=self._read_responses,
+                args=(self.sock, self._pending_responses),
+                daemon=True,
+            )
+            reader.start()
+        return self.sock
+
+    def _close(self, sock: socket.socket) -> None:
+        if sock is self.sock:
+            self.sock = None
+        try:
+            sock.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self.sock is not None:
+                self._close(self.sock)
+
+    def _read_responses(
+        self, sock: socket.socket, pending_responses: Dict[Any, "futures.Future[Any]"]
+    ) -> None:
+        framer = JSONFramer()
+        error: BaseException = None
+        try:
+            while self.sock is sock:
+                try:
+                    chunk = sock.recv(self.recv_size)
+                except socket.timeout:
+                    continue
+                if not chunk:
+                    break
+                framer.feed(chunk)
+                raw_response = framer.pop_message()
+                while raw_response is not None:
+                    self._dispatch_response(
+                        self.decode_response(raw_response), len(raw_response), pending_responses
+                    )
+                    raw_response = framer.pop_message()
+        except Exception as exc:
+            error = exc
+        finally:
+            if error is None:
+                error = ConnectionError("IPC socket at {0} was closed".format(self.ipc_path))
+            with self._lock:
+                self._close(sock)
+            for response_future in list(pending_responses.values()):
+                if not response_future.done():
+                    response_future.set_exception(error)
+
+    def _dispatch_response(
+        self, response: Any, size: int, pending_responses: Dict[Any, "futures.Future[Any]"]
+    ) -> None:
+        response_future = pending_responses.get(get_response_key(response))
+        if response_future is None:
+            self.logger.debug("Discarding unexpected IPC response: %s", response)
+        else:
+            response_future.set_result((response, size))
+
 
 # type ignored b/c missing return statement is by design here
 def get_default_ipc_path() -> str:  # type: ignore
@@ -201,9 +364,18 @@ def get_dev_ipc_path() -> str:  # type: ignore
 
 class IPCProvider(JSONBaseProvider):
     logger = logging.getLogger("web3.providers.IPCProvider")
-    _socket = None
-
-    def __init__(self, ipc_path: str=None, timeout: int=10, *args: Any, **kwargs: Any) -> None:
+    _socket_pool = None
+
+    def __init__(
+        self,
+        ipc_path: str=None,
+        timeout: int=10,
+        recv_size: int=DEFAULT_RECV_SIZE,
+        pool_size: int=1,
+        pipeline: bool=False,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
         if ipc_path is None:
             self.ipc_path = get_default_ipc_path()
         elif isinstance(ipc_path, str) or isinstance(ipc_path, Path):
@@ -212,47 +384,191 @@ class IPCProvider(JSONBaseProvider):
             raise TypeError("ipc_path must be of type string or pathlib.Path")
 
         self.timeout = timeout
-        self._lock = threading.Lock()
-        self._socket = PersistantSocket(self.ipc_path)
+        self.recv_size = recv_size
+        self.pool_size = pool_size
+        self.pipeline = pipeline
+        if pipeline:
+            if sys.platform == 'win32':
+                raise ValueError("Pipelining IPC requests is not supported on Windows")
+            if pool_size < 1:
+                raise ValueError("The IPC socket pool size must be at least 1, got: %r" % pool_size)
+            self._pipelined_sockets = [
+                PipelinedSocket(self.ipc_path, recv_size, self._decode_rpc_object)
+                for _ in range(pool_size)
+            ]
+            self._next_pipelined_socket = itertools.cycle(self._pipelined_sockets)
+        else:
+            self._socket_pool = PersistantSocketPool(self.ipc_path, pool_size)
         super().__init__()
 
     def __str__(self) -> str:
         return f"<{self.__class__.__name__} {self.ipc_path}>"
 
+    def disconnect(self) -> None:
+        if self.pipeline:
+            for pipelined_socket in self._pipelined_sockets:
+                pipelined_socket.close()
+        else:
+            self._socket_pool.close()
+
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         self.logger.debug("Making request IPC. Path: %s, Method: %s",
                           self.ipc_path, method)
-        request = self.encode_rpc_request(method, params)
+        rpc_dict = self._build_rpc_dict(method, params)
+        return self._make_raw_request(rpc_dict['id'], self._encode_rpc_object(rpc_dict))
+
+    def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self.logger.debug("Making batch request IPC. Path: %s, Methods: %s",
+                          self.ipc_path, [method for method, _ in requests])
+        rpc_list = [self._build_rpc_dict(method, params) for method, params in requests]
+        response = self._make_raw_request(
+            get_response_key(rpc_list),
+            self._encode_rpc_object(rpc_list),
+        )
+        return sort_batch_response(response)
+
+    def _make_raw_request(self, request_key: Any, request: bytes) -> Any:
+        if self.pipeline:
+            pipelined_socket = next(self._next_pipelined_socket)
+            return pipelined_socket.make_request(request_key, request, self.timeout)
 
-        with self._lock, self._socket as sock:
+        with self._socket_pool.checkout() as persistant_socket, persistant_socket as sock:
             try:
                 sock.sendall(request)
             except BrokenPipeError:
                 # one extra attempt, then give up
-                sock = self._socket.reset()
+                sock = persistant_socket.reset()
                 sock.sendall(request)
 
-            raw_response = b""
+            framer = JSONFramer()
             with Timeout(self.timeout) as timeout:
                 while True:
                     try:
-                        raw_response += sock.recv(4096)
+                        chunk = sock.recv(self.recv_size)
                     except socket.timeout:
                         timeout.sleep(0)
                         continue
-                    if raw_response == b"":
-                        timeout.sleep(0)
-                    elif has_valid_json_rpc_ending(raw_response):
-                        try:
-                            response = self.decode_rpc_response(raw_response)
-                        except JSONDecodeError:
-                            timeout.sleep(0)
-                            continue
-                        else:
-                            return response
-                    else:
-                        timeout.sleep(0)
-                        continue
+                    if chunk:
+                        framer.feed(chunk)
+                        raw_response = framer.pop_message()
+                        if raw_response is not None:
+                            return self.decode_rpc_response(raw_response)
+                    timeout.sleep(0)
+
+
+# a complete JSON string, and the part of a string up to its closing quote
+_JSON_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_JSON_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_JSON_STRUCTURE_CHARS = re.compile(rb'[\[\]{}"]')
+_NON_BRACKET_BYTES = bytes(byte for byte in range(256) if byte not in b'[]{}')
+_NON_TOKEN_BYTES = bytes(byte for byte in range(256) if byte not in b'[]{}"')
+_BRACKET_DEPTH_CHANGES = {ord('['): 1, ord('{'): 1, ord(']'): -1, ord('}'): -1}
+_QUOTE = ord('"')
+
+
+class JSONFramer:
+    """
+    Splits a stream of concatenated JSON objects and arrays into messages.
+
+    Received bytes are appended to a buffer and only the bytes that have not
+    been looked at yet are scanned, so finding the end of a message takes a
+    single pass no matter how many chunks it arrives in.  Strings are skipped
+    and brackets counted with ``bytes`` methods, only the chunk that holds the
+    end of a message is walked token by token.
+    """
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> None:
+        self.buffer += data
+
+    def pop_message(self) -> Optional[bytes]:
+        """
+        Removes and returns the first complete message in the buffer, or
+        ``None`` if more data is needed.
+        """
+        end = self._find_message_end()
+        if end is None:
+            return None
+        message = bytes(self.buffer[:end])
+        del self.buffer[:end]
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        return message
+
+    def _skip_string(self) -> bool:
+        """
+        Moves past the rest of the current string, returns whether its
+        closing quote has been received.
+        """
+        end = _JSON_STRING_BODY.match(self.buffer, self._position).end()
+        if end < len(self.buffer) and self.buffer[end] == _QUOTE:
+            self._position = end + 1
+            self._in_string = False
+            return True
+        else:
+            # stop in front of a trailing backslash, as what it escapes is
+            # still to come
+            self._position = end
+            return False
+
+    def _find_message_end(self) -> Optional[int]:
+        if self._in_string and not self._skip_string():
+            return None
+
+        segment = bytes(self.buffer[self._position:])
+        if b'\\' in segment:
+            # escaped quotes rule out splitting on quotes
+            without_strings = _JSON_STRING.sub(b'', segment)
+            string_start = without_strings.find(b'"')
+            if string_start == -1:
+                outside_strings = without_strings
+            else:
+                outside_strings = without_strings[:string_start]
+                string_start += len(segment) - len(without_strings)
+        else:
+            parts = segment.translate(None, _NON_TOKEN_BYTES).split(b'"')
+            outside_strings = b''.join(parts[::2])
+            # an odd number of quotes leaves a string that is not complete yet
+            string_start = -1 if len(parts) % 2 else segment.rfind(b'"')
+
+        depth = self._depth
+        for bracket in outside_strings.translate(None, _NON_BRACKET_BYTES):
+            depth += _BRACKET_DEPTH_CHANGES[bracket]
+            if depth <= 0:
+                return self._walk_to_message_end()
+
+        self._depth = depth
+        if string_start == -1:
+            self._position = len(self.buffer)
+        else:
+            self._position += string_start + 1
+            self._in_string = True
+            self._skip_string()
+        return None
+
+    def _walk_to_message_end(self) -> Optional[int]:
+        buffer = self.buffer
+        position = self._position
+        while True:
+            match = _JSON_STRUCTURE_CHARS.search(buffer, position)
+            if match is None:
+                raise ValueError("Unbalanced JSON-RPC message: %r" % buffer)
+            position = match.end()
+            if buffer[match.start()] == _QUOTE:
+                position = _JSON_STRING.match(buffer, match.start()).end()
+            elif buffer[match.start()] in b'[{':
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth <= 0:
+                    return position
 
 
 # A valid JSON RPC response can only end in } or ] http://www.jsonrpc.org/specification
@@ -0,0 +1,487 @@
+import asyncio
+from collections import (
+    defaultdict,
+    deque,
+)
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+import logging
+import math
+import random
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from websockets.exceptions import (
+    WebSocketException,
+)
+
+from web3._utils.compat import (
+    Literal,
+)
+from web3._utils.threads import (
+    Timeout,
+    TimerClass,
+)
+from web3.datastructures import (
+    NamedElementOnion,
+)
+from web3.exceptions import (
+    CannotHandleRequest,
+)
+from web3.middleware.exception_retry_request import (
+    check_if_retry_on_failure,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.types import (
+    Middleware,
+    MiddlewareOnion,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
+
+TResult = TypeVar('TResult')
+
+LoadBalancingStrategy = Literal['round_robin', 'latency']
+
+# errors that mean the endpoint, rather than the request, is at fault
+FAILOVER_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    IOError,
+    Timeout,
+    asyncio.TimeoutError,
+    WebSocketException,
+)
+
+# methods that are safe to retry, but change the state of the node that
+# answers them or only make sense to send to the node holding that state
+NON_HEDGEABLE_NAMESPACES = {'admin', 'evm', 'miner', 'personal', 'shh', 'testing'}
+NON_HEDGEABLE_METHODS = {
+    'eth_getFilterChanges',
+    'eth_getFilterLogs',
+    'eth_newBlockFilter',
+    'eth_newFilter',
+    'eth_newPendingTransactionFilter',
+    'eth_sendRawTransaction',
+    'eth_sign',
+    'eth_signTypedData',
+    'eth_uninstallFilter',
+}
+
+
+def check_if_hedge_allowed(method: RPCEndpoint) -> bool:
+    """
+    Returns whether ``method`` is read-only, so that sending it to a second
+    node while the first one is still working on it is harmless.
+    """
+    if method.split('_')[0] in NON_HEDGEABLE_NAMESPACES or method in NON_HEDGEABLE_METHODS:
+        return False
+    return check_if_retry_on_failure(method)
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+class Endpoint:
+    """
+    A backend provider of a :class:`LoadBalancedProvider`, together with its
+    health and a moving average of how long its requests take.
+    """
+    def __init__(self, provider: BaseProvider) -> None:
+        self.provider = provider
+        self.healthy = True
+        self.consecutive_failures = 0
+        self.latency: float = None
+
+    def __repr__(self) -> str:
+        return '<Endpoint {0} healthy={1} latency={2}>'.format(
+            self.provider, self.healthy, self.latency,
+        )
+
+
+class LoadBalancedProvider(BaseProvider):
+    """
+    Spreads requests across several providers, failing over to the next one
+    when a provider raises a connection error.
+
+    Requests go through the middlewares of the provider they are sent to,
+    built with the ``Web3`` instance this provider is used by.  Batches are
+    sent to the providers as they are, like batches sent to any provider.
+    """
+    logger = logging.getLogger("web3.providers.LoadBalancedProvider")
+    failover_exceptions = FAILOVER_EXCEPTIONS
+    # weight of the newest sample in the moving average of request latency
+    latency_smoothing = 0.3
+    # hedged requests wait for this percentile of the recent latencies of the
+    # method, or for default_hedge_delay until enough of them were measured
+    hedge_percentile = 95
+    hedge_min_samples = 20
+    hedge_latency_window = 500
+    default_hedge_delay = 0.1
+
+    def __init__(
+        self,
+        providers: Sequence[BaseProvider],
+        strategy: LoadBalancingStrategy='round_robin',
+        max_failures: int=3,
+        health_check_interval: float=10,
+        hedge: bool=False,
+        hedge_delay: float=None,
+        hedge_workers: int=32,
+    ) -> None:
+        if not providers:
+            raise ValueError("LoadBalancedProvider needs at least one provider")
+        if strategy not in ('round_robin', 'latency'):
+            raise ValueError(
+                "Unknown load balancing strategy %r, expected 'round_robin' or 'latency'"
+                % strategy
+            )
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1, got: %r" % max_failures)
+        if hedge_workers < 1:
+            raise ValueError("hedge_workers must be at least 1, got: %r" % hedge_workers)
+
+        self.endpoints = [Endpoint(provider) for provider in providers]
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.health_check_interval = health_check_interval
+        self._lock = threading.Lock()
+        self._next_index = 0
+
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self._method_latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.hedge_latency_window)
+        )
+        self.hedge_workers = hedge_workers
+        self._executor = ThreadPoolExecutor(
+            hedge_workers, thread_name_prefix='web3-hedge'
+        ) if hedge else None
+        # taken by each request running on the executor, so that none of them
+        # waits in its queue
+        self._hedge_slots = threading.BoundedSemaphore(hedge_workers)
+
+        self._health_checker: TimerClass = None
+
+        self._web3: "Web3" = None
+        self._backend_middlewares: MiddlewareOnion = NamedElementOnion([])
+        # type ignored b/c conflict with _middlewares attr on BaseProvider
+        self._middlewares: Tuple[Middleware, ...] = NamedElementOnion([  # type: ignore
+            (self._web3_middleware, 'load_balancing'),
+        ])
+
+    def __str__(self) -> str:
+        return '<{0} {1}>'.format(
+            self.__class__.__name__,
+            ', '.join(str(endpoint.provider) for endpoint in self.endpoints),
+        )
+
+    @property
+    def providers(self) -> List[BaseProvider]:
+        return [endpoint.provider for endpoint in self.endpoints]
+
+    @property
+    def healthy_providers(self) -> List[BaseProvider]:
+        return [endpoint.provider for endpoint in self.endpoints if endpoint.healthy]
+
+    def disconnect(self) -> None:
+        if self._health_checker is not None:
+            self._health_checker.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        for endpoint in self.endpoints:
+            disconnect = getattr(endpoint.provider, 'disconnect', None)
+            if disconnect is not None:
+                disconnect()
+
+    def _web3_middleware(
+        self, make_request: Callable[[RPCEndpoint, Any], Any], web3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], Any]:
+        # keeps the Web3 instance the middlewares of the backends are built with
+        self._web3 = web3
+        return make_request
+
+    def _get_request_func(self, provider: BaseProvider) -> Callable[..., RPCResponse]:
+        if self._web3 is None:
+            # used on its own, outside of a Web3 instance
+            return provider.make_request
+        return provider.request_func(self._web3, self._backend_middlewares)
+
+    def _start_health_checks(self) -> None:
+        # started by the first request, so that creating the provider does
+        # not probe the endpoints
+        if self._health_checker is not None or self.health_check_interval is None:
+            return
+        with self._lock:
+            if self._health_checker is None:
+                self._health_checker = TimerClass(self.health_check_interval, self.check_health)
+                self._health_checker.daemon = True
+                self._health_checker.start()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        def send(provider: BaseProvider) -> RPCResponse:
+            return self._get_request_func(provider)(method, params)
+
+        self._start_health_checks()
+        if self.hedge and check_if_hedge_allowed(method):
+            return self._hedge(method, send)
+        return self._failover(method, send)
+
+    def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self._start_health_checks()
+        return self._failover(
+            [method for method, _ in requests],
+            lambda provider: provider.make_batch_request(requests),
+        )
+
+    def isConnected(self) -> bool:
+        return any(endpoint.provider.isConnected() for endpoint in self.endpoints)
+
+    def check_health(self) -> None:
+        """
+        Checks whether each endpoint is connected, ejecting the ones that are
+        not and bringing back the ones that recovered.
+        """
+        for endpoint in self.endpoints:
+            try:
+                connected = endpoint.provider.isConnected()
+            except Exception:
+                connected = False
+
+            with self._lock:
+                if connected and not endpoint.healthy:
+                    self.logger.info("Endpoint %s recovered", endpoint.provider)
+                    endpoint.healthy = True
+                    endpoint.consecutive_failures = 0
+                elif not connected and endpoint.healthy:
+                    self.logger.warning("Endpoint %s failed its health check", endpoint.provider)
+                    endpoint.healthy = False
+
+    def get_hedge_delay(self, method: RPCEndpoint) -> float:
+        """
+        Returns how long to wait for an answer to ``method`` before sending
+        it to a second endpoint as well.
+        """
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        with self._lock:
+            latencies = list(self._method_latencies.get(method, ()))
+        if len(latencies) < self.hedge_min_samples:
+            return self.default_hedge_delay
+        return percentile(latencies, self.hedge_percentile)
+
+    def _send(
+        self, endpoint: Endpoint, method: Any, send: Callable[[BaseProvider], TResult]
+    ) -> TResult:
+        self.logger.debug("Making request through %s. Method: %s", endpoint.provider, method)
+        start = time.monotonic()
+        try:
+            result = send(endpoint.provider)
+        except self.failover_exceptions as exc:
+            self.logger.warning(
+                "Request through %s failed, failing over. Method: %s, Error: %r",
+                endpoint.provider, method, exc,
+            )
+            self._record_failure(endpoint)
+            raise
+        else:
+            self._record_success(endpoint, method, time.monotonic() - start)
+            return result
+
+    def _failover(
+        self,
+        method: Any,
+        send: Callable[[BaseProvider], TResult],
+        candidates: Iterable[Endpoint]=None,
+        last_error: BaseException=None,
+    ) -> TResult:
+        if candidates is None:
+            candidates = self._get_candidates()
+        for endpoint in candidates:
+            try:
+                return self._send(endpoint, method, send)
+            except self.failover_exceptions as exc:
+                last_error = exc
+
+        raise CannotHandleRequest(
+            "All endpoints failed while making request: method:{0}".format(method)
+        ) from last_error
+
+    def _submit(
+        self, endpoint: Endpoint, method: Any, send: Callable[[BaseProvider], TResult]
+    ) -> Optional[Tuple['Future[TResult]', threading.Event]]:
+        """
+        Starts sending the request through ``endpoint`` on the executor, and
+        returns its future and an event set once it is sent.  Returns
+        ``None`` when every worker of the executor is busy, rather than
+        leaving the request to wait in its queue.
+        """
+        if not self._hedge_slots.acquire(blocking=False):
+            return None
+        started = threading.Event()
+
+        def send_started() -> TResult:
+            started.set()
+            return self._send(endpoint, method, send)
+
+        try:
+            future = self._executor.submit(send_started)
+        except RuntimeError:
+            # the executor was shut down by disconnect()
+            self._hedge_slots.release()
+            return None
+        future.add_done_callback(lambda _: self._hedge_slots.release())
+        return future, started
+
+    def _hedge(self, method: RPCEndpoint, send: Callable[[BaseProvider], TResult]) -> TResult:
+        """
+        Sends the request to the first endpoint, and to the next one as well
+        if the first has not answered within the hedge delay, returning
+        whichever answer arrives first.  Failed requests fail over like
+        unhedged ones.  The request that loses the race is left to finish in
+        the background, so its latency is still measured.
+
+        The requests are sent from the executor, so that this thread can
+        return the first answer.  When all of its workers are busy, the
+        request is made in this thread instead, without a hedge.
+        """
+        candidates: Deque[Endpoint] = deque(self._get_candidates())
+        first_endpoint = candidates.popleft()
+        submitted = self._submit(first_endpoint, method, send)
+        if submitted is None:
+            candidates.appendleft(first_endpoint)
+            return self._failover(method, send, candidates)
+
+        first_future, started = submitted
+        pending: Set[Future[TResult]] = {first_future}
+        last_error: BaseException = None
+        hedged = False
+        # the hedge delay counts from when the request is sent
+        started.wait()
+        while pending:
+            timeout = None if hedged else self.get_hedge_delay(method)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                if candidates:
+                    submitted = self._submit(candidates[0], method, send)
+                    if submitted is not None:
+                        self.logger.debug(
+                            "Hedging request after %.3fs. Method: %s", timeout, method,
+                        )
+                        candidates.popleft()
+                        pending.add(submitted[0])
+                continue
+
+            for future in done:
+                pending.remove(future)
+                try:
+                    return future.result()
+                except self.failover_exceptions as exc:
+                    last_error = exc
+            if not pending and candidates:
+                submitted = self._submit(candidates[0], method, send)
+                if submitted is None:
+                    return self._failover(method, send, candidates, last_error)
+                candidates.popleft()
+                pending.add(submitted[0])
+
+        raise CannotHandleRequest(
+            "All endpoints failed while making request: method:{0}".format(method)
+        ) from last_error
+
+    def _get_candidates(self) -> List[Endpoint]:
+        """
+        Returns the endpoints in the order they should be tried: the healthy
+        ones as ordered by the strategy, then the ejected ones as a last
+        resort.
+        """
+        with self._lock:
+            healthy = [endpoint for endpoint in self.endpoints if endpoint.healthy]
+            ejected = [endpoint for endpoint in self.endpoints if not endpoint.healthy]
+            if self.strategy == 'latency':
+                return self._order_by_latency(healthy) + ejected
+
+            if healthy:
+                start = self._next_index % len(healthy)
+                self._next_index += 1
+                healthy = healthy[start:] + healthy[:start]
+            return healthy + ejected
+
+    def _order_by_latency(self, endpoints: List[Endpoint]) -> List[Endpoint]:
+        """
+        Picks the first endpoint at random, weighted by the inverse of its
+        latency, and orders the rest fastest first.  Endpoints that have not
+        been measured yet are treated as being as fast as the fastest one, so
+        they get picked and measured.
+        """
+        if len(endpoints) < 2:
+            return endpoints
+
+        measured = [endpoint.latency for endpoint in endpoints if endpoint.latency is not None]
+        fastest = min(measured) if measured else 1.0
+        latencies: Dict[int, float] = {
+            id(endpoint): max(
+                endpoint.latency if endpoint.latency is not None else fastest,
+                1e-6,
+            )
+            for endpoint in endpoints
+        }
+        first = random.choices(
+            endpoints,
+            weights=[1 / latencies[id(endpoint)] for endpoint in endpoints],
+        )[0]
+        rest = sorted(
+            (endpoint for endpoint in endpoints if endpoint is not first),
+            key=lambda endpoint: latencies[id(endpoint)],
+        )
+        return [first] + rest
+
+    def _record_success(self, endpoint: Endpoint, method: Any, latency: float) -> None:
+        with self._lock:
+            if self.hedge and isinstance(method, str):
+                self._method_latencies[method].append(latency)
+            if endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency += self.latency_smoothing * (latency - endpoint.latency)
+            endpoint.consecutive_failures = 0
+            if not endpoint.healthy:
+                self.logger.info("Endpoint %s recovered", endpoint.provider)
+                endpoint.healthy = True
+
+    def _record_failure(self, endpoint: Endpoint) -> None:
+        with self._lock:
+            endpoint.consecutive_failures += 1
+            if endpoint.healthy and endpoint.consecutive_failures >= self.max_failures:
+                self.logger.warning(
+                    "Ejecting endpoint %s after %d consecutive failures",
+                    endpoint.provider, endpoint.consecutive_failures,
+                )
+                endpoint.healthy = False
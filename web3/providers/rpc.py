@@ -4,6 +4,8 @@ from typing import (
     Any,
     Dict,
     Iterable,
+    List,
+    Sequence,
     Tuple,
 )
 
@@ -18,7 +20,9 @@ from web3._utils.http import (
     construct_user_agent,
 )
 from web3._utils.request import (
+    DEFAULT_POOLSIZE,
     make_post_request,
+    make_session,
 )
 from web3.datastructures import (
     NamedElementOnion,
@@ -49,12 +53,20 @@ class HTTPProvider(JSONBaseProvider):
     # type ignored b/c conflict with _middlewares attr on BaseProvider
     _middlewares: Tuple[Middleware, ...] = NamedElementOnion([(http_retry_request_middleware, 'http_retry_request')])  # type: ignore # noqa: E501
 
-    def __init__(self, endpoint_uri: URI=None, request_kwargs: Any=None) -> None:
+    def __init__(
+        self,
+        endpoint_uri: URI=None,
+        request_kwargs: Any=None,
+        pool_size: int=DEFAULT_POOLSIZE,
+        max_connections: int=None,
+        keep_alive: bool=True,
+    ) -> None:
         if endpoint_uri is None:
             self.endpoint_uri = get_default_endpoint()
         else:
             self.endpoint_uri = endpoint_uri
         self._request_kwargs = request_kwargs or {}
+        self.session = make_session(pool_size, max_connections, keep_alive)
         super().__init__()
 
     def __str__(self) -> str:
@@ -73,6 +85,16 @@ class HTTPProvider(JSONBaseProvider):
             'User-Agent': construct_user_agent(str(type(self))),
         }
 
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Returns how many requests were sent, and how many of them had to open
+        a new connection or reused one from the pool.
+        """
+        return self.session.get_adapter(self.endpoint_uri).get_connection_stats()
+
+    def disconnect(self) -> None:
+        self.session.close()
+
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         self.logger.debug("Making request HTTP. URI: %s, Method: %s",
                           self.endpoint_uri, method)
@@ -80,6 +102,7 @@ class HTTPProvider(JSONBaseProvider):
         raw_response = make_post_request(
             self.endpoint_uri,
             request_data,
+            session=self.session,
             **self.get_request_kwargs()
         )
         response = self.decode_rpc_response(raw_response)
@@ -87,3 +110,20 @@ class HTTPProvider(JSONBaseProvider):
                           "Method: %s, Response: %s",
                           self.endpoint_uri, method, response)
         return response
+
+    def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self.logger.debug("Making batch request HTTP. URI: %s, Methods: %s",
+                          self.endpoint_uri, [method for method, _ in requests])
+        request_data = self.encode_batch_rpc_request(requests)
+        raw_response = make_post_request(
+            self.endpoint_uri,
+            request_data,
+            session=self.session,
+            **self.get_request_kwargs()
+        )
+        response = self.decode_batch_rpc_response(raw_response)
+        self.logger.debug("Getting batch response HTTP. URI: %s, Response: %s",
+                          self.endpoint_uri, response)
+        return response
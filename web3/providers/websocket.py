@@ -1,4 +1,7 @@
 import asyncio
+from collections import (
+    deque,
+)
 import json
 import logging
 import os
@@ -10,6 +13,13 @@ from types import (
 )
 from typing import (
     Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Sequence,
+    Set,
+    Tuple,
     Type,
 )
 
@@ -18,11 +28,16 @@ from eth_typing import (
 )
 import websockets
 
+from web3._utils.metrics import (
+    record_bytes_received,
+)
 from web3.exceptions import (
     ValidationError,
 )
 from web3.providers.base import (
     JSONBaseProvider,
+    get_response_key,
+    sort_batch_response,
 )
 from web3.types import (
     RPCEndpoint,
@@ -31,6 +46,7 @@ from web3.types import (
 
 RESTRICTED_WEBSOCKET_KWARGS = {'uri', 'loop'}
 DEFAULT_WEBSOCKET_TIMEOUT = 10
+DEFAULT_SUBSCRIPTION_QUEUE_SIZE = 1000
 
 
 def _start_event_loop(loop: asyncio.AbstractEventLoop) -> None:
@@ -50,32 +66,185 @@ def get_default_endpoint() -> URI:
     return URI(os.environ.get('WEB3_WS_PROVIDER_URI', 'ws://127.0.0.1:8546'))
 
 
+class SubscriptionQueue:
+    """
+    The notifications of a subscription that have not been read yet.
+
+    Once the subscription has ended, because its connection closed or more
+    than ``max_size`` notifications were left unread, the notifications that
+    were queued can still be read, and reading past them raises the error it
+    ended with.
+    """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.error: BaseException = None
+        self._messages: Deque[Any] = deque()
+        self._changed = asyncio.Event()
+
+    def put(self, message: Any) -> None:
+        if self.error is not None:
+            return
+        elif len(self._messages) >= self.max_size:
+            self.close(OverflowError(
+                "Subscription has more than {0} unread notifications".format(self.max_size)
+            ))
+        else:
+            self._messages.append(message)
+            self._changed.set()
+
+    def close(self, error: BaseException) -> None:
+        if self.error is None:
+            self.error = error
+            self._changed.set()
+
+    async def get(self) -> Any:
+        while not self._messages:
+            if self.error is not None:
+                raise self.error
+            self._changed.clear()
+            await self._changed.wait()
+        return self._messages.popleft()
+
+
 class PersistentWebSocket:
+    """
+    A single websocket connection shared by all requests of a provider.
+
+    A reader task routes every incoming message to the request with the same
+    JSON-RPC ``id``, so any number of requests may be in flight on the
+    connection at once.  ``eth_subscription`` notifications are queued per
+    subscription id until they are read.  The queue of a subscription is
+    made when the response to its ``eth_subscribe`` request arrives, so
+    notifications for subscriptions that were not made, or were removed, are
+    dropped.
+    """
+    logger = logging.getLogger("web3.providers.PersistentWebSocket")
 
     def __init__(
-        self, endpoint_uri: URI, loop: asyncio.AbstractEventLoop, websocket_kwargs: Any
+        self,
+        endpoint_uri: URI,
+        loop: asyncio.AbstractEventLoop,
+        websocket_kwargs: Any,
+        decode_message: Callable[[Any], Any]=json.loads,
+        subscription_queue_size: int=DEFAULT_SUBSCRIPTION_QUEUE_SIZE,
     ) -> None:
         self.ws: websockets.WebSocketClientProtocol = None
         self.endpoint_uri = endpoint_uri
         self.loop = loop
         self.websocket_kwargs = websocket_kwargs
+        self.decode_message = decode_message
+        self._connect_lock: asyncio.Lock = None
+        self.subscription_queue_size = subscription_queue_size
+        self._pending_responses: Dict[Any, "asyncio.Future[Any]"] = {}
+        self._subscribe_requests: Set[Any] = set()
+        self._subscriptions: Dict[str, SubscriptionQueue] = {}
 
     async def __aenter__(self) -> websockets.WebSocketClientProtocol:
-        if self.ws is None:
-            self.ws = await websockets.connect(
-                uri=self.endpoint_uri, loop=self.loop, **self.websocket_kwargs
-            )
-        return self.ws
+        return await self.connect()
 
     async def __aexit__(
         self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType
     ) -> None:
         if exc_val is not None:
+            await self._close(self.ws)
+
+    async def connect(self) -> websockets.WebSocketClientProtocol:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self.ws is None:
+                self.ws = await websockets.connect(
+                    uri=self.endpoint_uri, loop=self.loop, **self.websocket_kwargs
+                )
+                asyncio.ensure_future(self._read_messages(self.ws), loop=self.loop)
+        return self.ws
+
+    async def _close(self, ws: websockets.WebSocketClientProtocol) -> None:
+        if ws is not None and ws is self.ws:
+            self.ws = None
             try:
-                await self.ws.close()
+                await ws.close()
             except Exception:
                 pass
-            self.ws = None
+
+    async def make_request(
+        self, request_key: Any, request_data: bytes, timeout: float, subscribe: bool=False
+    ) -> Tuple[Any, int]:
+        """
+        Returns the response and its size, which the caller counts, as this
+        runs in the loop of the connection rather than the context of the request.
+        """
+        conn = await self.connect()
+        response_future = self.loop.create_future()
+        self._pending_responses[request_key] = response_future
+        if subscribe:
+            self._subscribe_requests.add(request_key)
+        try:
+            await asyncio.wait_for(conn.send(request_data), timeout=timeout)
+            return await asyncio.wait_for(response_future, timeout=timeout)
+        except (websockets.ConnectionClosed, OSError):
+            # other requests may still be waiting on the connection, so it is
+            # only closed when the connection itself failed
+            await self._close(conn)
+            raise
+        finally:
+            self._pending_responses.pop(request_key, None)
+            self._subscribe_requests.discard(request_key)
+
+    async def get_subscription_message(self, subscription_id: str, timeout: float) -> Any:
+        try:
+            queue = self._subscriptions[subscription_id]
+        except KeyError:
+            raise ValueError("Unknown subscription: {0}".format(subscription_id))
+        return await asyncio.wait_for(queue.get(), timeout=timeout)
+
+    def remove_subscription(self, subscription_id: str) -> None:
+        self._subscriptions.pop(subscription_id, None)
+
+    async def _read_messages(self, ws: websockets.WebSocketClientProtocol) -> None:
+        error: BaseException = None
+        try:
+            async for raw_message in ws:
+                self._dispatch_message(self.decode_message(raw_message), len(raw_message))
+        except Exception as exc:
+            error = exc
+        finally:
+            if error is None:
+                error = ConnectionError(
+                    "Websocket connection to {0} closed".format(self.endpoint_uri)
+                )
+            for response_future in self._pending_responses.values():
+                if not response_future.done():
+                    response_future.set_exception(error)
+            # subscriptions do not survive the connection they were made on,
+            # they are kept until removed so that reading them raises the error
+            for queue in self._subscriptions.values():
+                queue.close(error)
+            await self._close(ws)
+
+    def _dispatch_message(self, message: Any, size: int) -> None:
+        if isinstance(message, dict) and message.get('method') == 'eth_subscription':
+            params = message['params']
+            queue = self._subscriptions.get(params['subscription'])
+            if queue is None:
+                self.logger.debug("Discarding notification of unknown subscription: %s", message)
+            else:
+                queue.put(params['result'])
+            return
+
+        request_key = get_response_key(message)
+        response_future = self._pending_responses.get(request_key)
+        if response_future is None or response_future.done():
+            self.logger.debug("Discarding unexpected websocket message: %s", message)
+            return
+
+        # the queue is made before the subscriber gets the subscription id,
+        # as its first notifications may follow right after this response
+        if request_key in self._subscribe_requests and 'result' in message:
+            self._subscriptions[message['result']] = SubscriptionQueue(
+                self.subscription_queue_size
+            )
+        response_future.set_result((message, size))
 
 
 class WebsocketProvider(JSONBaseProvider):
@@ -87,6 +256,7 @@ class WebsocketProvider(JSONBaseProvider):
         endpoint_uri: URI=None,
         websocket_kwargs: Any=None,
         websocket_timeout: int=DEFAULT_WEBSOCKET_TIMEOUT,
+        subscription_queue_size: int=DEFAULT_SUBSCRIPTION_QUEUE_SIZE,
     ) -> None:
         self.endpoint_uri = endpoint_uri
         self.websocket_timeout = websocket_timeout
@@ -106,7 +276,11 @@ class WebsocketProvider(JSONBaseProvider):
                     'found: {1}'.format(RESTRICTED_WEBSOCKET_KWARGS, found_restricted_keys)
                 )
         self.conn = PersistentWebSocket(
-            self.endpoint_uri, WebsocketProvider._loop, websocket_kwargs
+            self.endpoint_uri,
+            WebsocketProvider._loop,
+            websocket_kwargs,
+            self._decode_rpc_object,
+            subscription_queue_size,
         )
         super().__init__()
 
@@ -114,24 +288,62 @@ class WebsocketProvider(JSONBaseProvider):
         return "WS connection {0}".format(self.endpoint_uri)
 
     async def coro_make_request(self, request_data: bytes) -> RPCResponse:
-        async with self.conn as conn:
-            await asyncio.wait_for(
-                conn.send(request_data),
-                timeout=self.websocket_timeout
-            )
-            return json.loads(
-                await asyncio.wait_for(
-                    conn.recv(),
-                    timeout=self.websocket_timeout
-                )
-            )
+        request = json.loads(request_data)
+        subscribe = isinstance(request, dict) and request.get('method') == 'eth_subscribe'
+        response, size = await self.conn.make_request(
+            get_response_key(request), request_data, self.websocket_timeout, subscribe
+        )
+        record_bytes_received(size)
+        return response
 
-    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
-        self.logger.debug("Making request WebSocket. URI: %s, "
-                          "Method: %s", self.endpoint_uri, method)
-        request_data = self.encode_rpc_request(method, params)
+    def _make_threadsafe_request(
+        self, request_key: Any, request_data: bytes, subscribe: bool=False
+    ) -> Any:
+        future = asyncio.run_coroutine_threadsafe(
+            self.conn.make_request(request_key, request_data, self.websocket_timeout, subscribe),
+            WebsocketProvider._loop
+        )
+        response, size = future.result()
+        record_bytes_received(size)
+        return response
+
+    async def coro_get_subscription_message(
+        self, subscription_id: str, timeout: float=None
+    ) -> Any:
         future = asyncio.run_coroutine_threadsafe(
-            self.coro_make_request(request_data),
+            self.conn.get_subscription_message(subscription_id, timeout),
+            WebsocketProvider._loop
+        )
+        return await asyncio.wrap_future(future)
+
+    def get_subscription_message(self, subscription_id: str, timeout: float=None) -> Any:
+        future = asyncio.run_coroutine_threadsafe(
+            self.conn.get_subscription_message(subscription_id, timeout),
             WebsocketProvider._loop
         )
         return future.result()
+
+    def remove_subscription(self, subscription_id: str) -> None:
+        WebsocketProvider._loop.call_soon_threadsafe(
+            self.conn.remove_subscription, subscription_id
+        )
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self.logger.debug("Making request WebSocket. URI: %s, "
+                          "Method: %s", self.endpoint_uri, method)
+        rpc_dict = self._build_rpc_dict(method, params)
+        return self._make_threadsafe_request(
+            rpc_dict['id'], self._encode_rpc_object(rpc_dict), method == 'eth_subscribe'
+        )
+
+    def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self.logger.debug("Making batch request WebSocket. URI: %s, Methods: %s",
+                          self.endpoint_uri, [method for method, _ in requests])
+        rpc_list = [self._build_rpc_dict(method, params) for method, params in requests]
+        response = self._make_threadsafe_request(
+            get_response_key(rpc_list),
+            self._encode_rpc_object(rpc_list),
+        )
+        return sort_batch_response(response)
@@ -0,0 +1,186 @@
+from collections.abc import (
+    Hashable,
+)
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
+
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.types import (
+    BlockData,
+    EventData,
+    LogReceipt,
+    TxData,
+    TxReceipt,
+)
+
+
+def _to_attrdict_if_collection(value: Any) -> Any:
+    if isinstance(value, (Mapping, list, tuple)):
+        return AttributeDict.recursive(value)
+    else:
+        return value
+
+
+class Record(Mapping[str, Any], Hashable):
+    """
+    A read-only mapping which keeps the fields of a TypedDict in slots, rather
+    than in a ``__dict__`` per instance like an AttributeDict.  Fields can be
+    read as attributes or as items.
+
+    Keys which are not fields of the TypedDict are kept in a dict of their
+    own.  Nested mappings are converted to the record type given for their
+    field in ``_nested``, or else to AttributeDicts.
+
+    Subclasses are made with :func:`make_record_type`.
+    """
+    __slots__ = ('_keys', '_extra')
+    _keys: Tuple[str, ...]
+    _extra: Optional[Dict[str, Any]]
+
+    _fields: Tuple[str, ...] = ()
+    _nested: Dict[str, Callable[[Any], Any]] = {}
+    _setters: Dict[str, Callable[[Any, Any], None]] = {}
+    # the tuples of keys of the instances, so that records with the same
+    # keys share a single tuple
+    _key_sets: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def __init__(self, mapping: Mapping[str, Any]) -> None:
+        setters = self._setters
+        nested = self._nested
+        extra = None
+        for key, value in mapping.items():
+            if key in nested:
+                value = nested[key](value)
+            else:
+                value = _to_attrdict_if_collection(value)
+            if key in setters:
+                setters[key](self, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        keys = tuple(mapping)
+        _set_keys(self, self._key_sets.setdefault(keys, keys))
+        _set_extra(self, extra)
+
+    def __getattr__(self, attr: str) -> Any:
+        # only called for fields that are not set and keys that are not fields
+        if attr not in Record.__slots__:
+            extra = self._extra
+            if extra is not None and attr in extra:
+                return extra[attr]
+        raise AttributeError(
+            "%r object has no attribute %r" % (self.__class__.__name__, attr)
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._setters or (self._extra is not None and key in self._extra):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __setattr__(self, attr: str, val: Any) -> None:
+        raise TypeError('This data is immutable -- create a copy instead of modifying')
+
+    def __delattr__(self, key: str) -> None:
+        raise TypeError('This data is immutable -- create a copy instead of modifying')
+
+    def __hash__(self) -> int:
+        # unlike sorting the items, this doesn't depend on the keys' order
+        return hash(frozenset(self.items()))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        else:
+            return False
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__ + "(%r)" % dict(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__, (dict(self),))
+
+
+_set_keys = Record.__dict__['_keys'].__set__
+_set_extra = Record.__dict__['_extra'].__set__
+
+
+def make_record_type(
+    name: str, typed_dict: Type[Any], nested: Dict[str, Callable[[Any], Any]]=None
+) -> Type[Record]:
+    """
+    Returns a :class:`Record` type with a slot for each field of
+    ``typed_dict``.  ``nested`` maps fields to the formatters of their
+    values, for fields which hold other records.
+    """
+    fields = tuple(typed_dict.__annotations__)
+    clashes = [field for field in fields if hasattr(Record, field)]
+    if clashes:
+        raise ValueError(
+            "Fields %r of %s clash with attributes of Record" % (clashes, typed_dict.__name__)
+        )
+    record_type = cast(Type[Record], type(name, (Record,), {
+        '__slots__': fields,
+        # so that records can be pickled, as in collections.namedtuple
+        '__module__': sys._getframe(1).f_globals.get('__name__', '__main__'),
+        '__doc__': "A compact, read-only %s." % typed_dict.__name__,
+        '_fields': fields,
+        '_nested': dict(nested or {}),
+        '_key_sets': {},
+    }))
+    record_type._setters = {
+        field: record_type.__dict__[field].__set__ for field in fields
+    }
+    return record_type
+
+
+def records_of(record_type: Type[Record]) -> Callable[[Sequence[Any]], Any]:
+    """
+    Returns a formatter which converts the mappings in a list to records of
+    ``record_type``, leaving any other items, like hashes, as they are.
+    """
+    def formatter(values: Sequence[Any]) -> Any:
+        if not isinstance(values, (list, tuple)):
+            return _to_attrdict_if_collection(values)
+        converted = [
+            record_type(value) if isinstance(value, Mapping) else value
+            for value in values
+        ]
+        return tuple(converted) if isinstance(values, tuple) else converted
+    return formatter
+
+
+TransactionRecord = make_record_type('TransactionRecord', TxData)
+LogRecord = make_record_type('LogRecord', LogReceipt)
+ReceiptRecord = make_record_type('ReceiptRecord', TxReceipt, {
+    'logs': records_of(LogRecord),
+})
+BlockRecord = make_record_type('BlockRecord', BlockData, {
+    'transactions': records_of(TransactionRecord),
+})
+EventDataRecord = make_record_type('EventDataRecord', EventData)
@@ -0,0 +1,156 @@
+"""
+Benchmarks the hit rate and throughput of the simple cache middleware under
+concurrent requests.
+
+Each thread makes requests for keys picked at random from a fixed set, to a
+provider which answers after a delay, through the simple cache middleware
+with a sharded cache, with a single shard, and as it used to be, skipping the
+cache whenever another thread held its lock.  For each, the benchmark reports
+the share of requests answered from the cache and the requests per second.
+
+Usage::
+
+    python -m web3.tools.benchmark.cache_concurrency --threads 1 8 32 --latency 0.002
+"""
+import argparse
+import itertools
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Set,
+)
+
+from web3 import Web3
+from web3._utils.caching import (
+    generate_cache_key,
+)
+from web3.middleware import (
+    construct_result_generator_middleware,
+    construct_simple_cache_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.tools.benchmark.utils import (
+    format_table,
+)
+from web3.types import (
+    Middleware,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+
+def construct_lock_skipping_cache_middleware(rpc_whitelist: Set[RPCEndpoint]) -> Middleware:
+    """
+    The simple cache middleware as it used to be, holding one lock across the
+    whole request, and skipping the cache when another thread holds it.
+    """
+    def lock_skipping_cache_middleware(
+        make_request: Callable[[RPCEndpoint, Any], RPCResponse], web3: Web3
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        cache: Dict[Any, RPCResponse] = {}
+        lock = threading.Lock()
+
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            lock_acquired = lock.acquire(blocking=False)
+
+            try:
+                if lock_acquired and method in rpc_whitelist:
+                    cache_key = generate_cache_key((method, params))
+                    if cache_key not in cache:
+                        response = make_request(method, params)
+                        cache[cache_key] = response
+                        return response
+                    return cache[cache_key]
+                else:
+                    return make_request(method, params)
+            finally:
+                if lock_acquired:
+                    lock.release()
+        return middleware
+    return lock_skipping_cache_middleware
+
+
+GET_BALANCE = RPCEndpoint('eth_getBalance')
+
+CACHE_MIDDLEWARES: Dict[str, Callable[[], Middleware]] = {
+    'lock skipping': lambda: construct_lock_skipping_cache_middleware({GET_BALANCE}),
+    'one shard': lambda: construct_simple_cache_middleware(
+        cache_class=dict, rpc_whitelist={GET_BALANCE}, shard_count=1,
+    ),
+    'sharded': lambda: construct_simple_cache_middleware(
+        cache_class=dict, rpc_whitelist={GET_BALANCE}, shard_count=16,
+    ),
+}
+
+
+def run_threads(
+    cache_middleware: Middleware, threads: int, requests: int, keys: int, latency: float,
+) -> List[Any]:
+    provider_calls = itertools.count()
+
+    def get_balance(method: RPCEndpoint, params: Any) -> str:
+        next(provider_calls)
+        time.sleep(latency)
+        return '0x0'
+
+    w3 = Web3(provider=BaseProvider(), middlewares=[])
+    w3.middleware_onion.add(construct_result_generator_middleware({
+        GET_BALANCE: get_balance,
+    }))
+    w3.middleware_onion.add(cache_middleware)
+
+    def make_requests(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(requests):
+            w3.manager.request_blocking(GET_BALANCE, [hex(rng.randrange(keys)), 'latest'])
+
+    workers = [threading.Thread(target=make_requests, args=(seed,)) for seed in range(threads)]
+    started_at = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started_at
+
+    total = threads * requests
+    misses = next(provider_calls)
+    return [
+        '{0:.1f}'.format(100 * (total - misses) / total),
+        '{0:.0f}'.format(total / elapsed),
+    ]
+
+
+def benchmark_cache_concurrency(
+    threads: List[int], requests: int, keys: int, latency: float,
+) -> Iterator[List[Any]]:
+    for thread_count in threads:
+        for name, construct_middleware in CACHE_MIDDLEWARES.items():
+            yield [name, thread_count] + run_threads(
+                construct_middleware(), thread_count, requests, keys, latency,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requests', type=int, default=2000, help="requests per thread")
+    parser.add_argument('--keys', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.002)
+    args = parser.parse_args()
+
+    rows = list(benchmark_cache_concurrency(
+        args.threads, args.requests, args.keys, args.latency,
+    ))
+    print(format_table(['cache', 'threads', 'hit rate (%)', 'requests/s'], rows))
+
+
+if __name__ == '__main__':
+    main()
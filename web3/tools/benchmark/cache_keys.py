@@ -0,0 +1,144 @@
+"""
+Benchmarks the cost of cache keys against the size of the request params.
+
+Keys are generated for ``eth_call`` requests with call data of increasing
+length, and for ``eth_getLogs`` requests filtering on an increasing number of
+addresses, by ``generate_cache_key``, by ``generate_cache_digest``, and by
+the recursive md5 digests ``generate_cache_key`` used to make.  For each, the
+benchmark reports the time to make a key, and the time to make a key and
+look it up in a cache holding it, which is what a cache hit costs.
+
+Usage::
+
+    python -m web3.tools.benchmark.cache_keys --sizes 1 10 100 1000 --number 1000
+"""
+import argparse
+import collections
+import hashlib
+import random
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from eth_utils import (
+    is_boolean,
+    is_bytes,
+    is_dict,
+    is_list_like,
+    is_null,
+    is_number,
+    is_text,
+    to_bytes,
+)
+
+from web3._utils.caching import (
+    generate_cache_digest,
+    generate_cache_key,
+)
+from web3.tools.benchmark.formatting import (
+    random_hex,
+)
+from web3.tools.benchmark.utils import (
+    format_table,
+    measure,
+)
+
+
+def recursive_md5_cache_key(value: Any) -> str:
+    """
+    The md5 digest of every value, joined and hashed again for lists and
+    dicts, as ``generate_cache_key`` used to make.
+    """
+    if is_bytes(value):
+        return hashlib.md5(value).hexdigest()
+    elif is_text(value):
+        return recursive_md5_cache_key(to_bytes(text=value))
+    elif is_boolean(value) or is_null(value) or is_number(value):
+        return recursive_md5_cache_key(repr(value))
+    elif is_dict(value):
+        return recursive_md5_cache_key(tuple(
+            (key, value[key])
+            for key
+            in sorted(value.keys())
+        ))
+    elif is_list_like(value) or isinstance(value, collections.abc.Generator):
+        return recursive_md5_cache_key("".join(
+            recursive_md5_cache_key(item)
+            for item
+            in value
+        ))
+    else:
+        raise TypeError("Cannot generate cache key for value {0} of type {1}".format(
+            value,
+            type(value),
+        ))
+
+
+KEY_FUNCTIONS: List[Tuple[str, Callable[[Any], Any]]] = [
+    ('recursive md5', recursive_md5_cache_key),
+    ('digest', generate_cache_digest),
+    ('structural', generate_cache_key),
+]
+
+
+def build_call_request(rng: random.Random, size: int) -> Tuple[str, List[Any]]:
+    """
+    Returns an ``eth_call`` request with ``size`` words of call data.
+    """
+    return ('eth_call', [
+        {
+            'from': random_hex(rng, 20),
+            'to': random_hex(rng, 20),
+            'data': '0x' + random_hex(rng, 4)[2:] + random_hex(rng, 32 * size)[2:],
+        },
+        'latest',
+    ])
+
+
+def build_logs_request(rng: random.Random, size: int) -> Tuple[str, List[Any]]:
+    """
+    Returns an ``eth_getLogs`` request filtering on ``size`` addresses.
+    """
+    return ('eth_getLogs', [{
+        'address': [random_hex(rng, 20) for _ in range(size)],
+        'fromBlock': '0x895440',
+        'toBlock': '0x8954a4',
+        'topics': [random_hex(rng, 32), None, [random_hex(rng, 32), random_hex(rng, 32)]],
+    }])
+
+
+def benchmark_cache_keys(sizes: List[int], number: int, repeat: int) -> Iterator[List[Any]]:
+    rng = random.Random(0)
+    for build_request in (build_call_request, build_logs_request):
+        for size in sizes:
+            request = build_request(rng, size)
+            for name, key_function in KEY_FUNCTIONS:
+                cache = {key_function(request): {'result': '0x'}}
+                key_cost = measure(lambda: key_function(request), repeat, number)
+                hit_cost = measure(lambda: cache[key_function(request)], repeat, number)
+                yield [
+                    request[0],
+                    size,
+                    name,
+                    '{0:.2f}'.format(key_cost['median'] * 1000000),
+                    '{0:.2f}'.format(hit_cost['median'] * 1000000),
+                ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--number', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = list(benchmark_cache_keys(args.sizes, args.number, args.repeat))
+    print(format_table(['method', 'size', 'key', 'key (us)', 'hit (us)'], rows))
+
+
+if __name__ == '__main__':
+    main()
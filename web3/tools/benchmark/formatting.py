@@ -0,0 +1,228 @@
+"""
+Benchmarks formatting ``eth_getBlockByNumber`` results with full transactions.
+
+Each block is formatted by the pythonic block formatter followed by
+``AttributeDict.recursive``, as the pythonic and attrdict middlewares used to
+do in turn, and by the fused formatter which does both in a single pass.  The
+same blocks are then requested through the default middleware stack, with the
+fused and with the separate pythonic middleware, optionally with the
+``geth_poa_middleware`` added.
+
+Blocks are generated with the shape and size of mainnet blocks, or read from
+JSON files of recorded ``eth_getBlockByNumber`` results or responses.
+
+Usage::
+
+    python -m web3.tools.benchmark.formatting --transactions 50 200 --repeat 5
+    python -m web3.tools.benchmark.formatting --fixtures block_9000000.json
+"""
+import argparse
+import json
+import random
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from web3 import Web3
+from web3._utils.method_formatters import (
+    attrdict_block_formatter,
+    block_formatter,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.middleware import (
+    geth_poa_middleware,
+)
+from web3.middleware.pythonic import (
+    _pythonic_middleware,
+)
+from web3.providers import (
+    BaseProvider,
+)
+from web3.tools.benchmark.utils import (
+    format_table,
+    measure,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+GET_BLOCK_BY_NUMBER = RPCEndpoint('eth_getBlockByNumber')
+
+
+def random_hex(rng: random.Random, num_bytes: int) -> str:
+    return '0x' + bytes(rng.getrandbits(8) for _ in range(num_bytes)).hex()
+
+
+def random_quantity(rng: random.Random, max_value: int) -> str:
+    return hex(rng.randrange(max_value))
+
+
+def build_transaction(
+    rng: random.Random, block_hash: str, block_number: str, index: int
+) -> Dict[str, Any]:
+    # most mainnet transactions are transfers or short contract calls
+    input_size = rng.choice((0, 0, 36, 68, 68, 132, 260, 580))
+    return {
+        'blockHash': block_hash,
+        'blockNumber': block_number,
+        'from': random_hex(rng, 20),
+        'gas': random_quantity(rng, 500000),
+        'gasPrice': random_quantity(rng, 50 * 10 ** 9),
+        'hash': random_hex(rng, 32),
+        'input': random_hex(rng, input_size),
+        'nonce': random_quantity(rng, 100000),
+        'r': random_hex(rng, 32),
+        's': random_hex(rng, 32),
+        'to': random_hex(rng, 20),
+        'transactionIndex': hex(index),
+        'v': rng.choice(('0x25', '0x26', '0x1b', '0x1c')),
+        'value': random_quantity(rng, 10 ** 19),
+    }
+
+
+def build_block(transaction_count: int, seed: int=0) -> Dict[str, Any]:
+    """
+    Returns a raw ``eth_getBlockByNumber`` result with full transactions,
+    shaped like a mainnet block.
+    """
+    rng = random.Random(seed)
+    block_hash = random_hex(rng, 32)
+    block_number = hex(9000000 + seed)
+    return {
+        'difficulty': random_quantity(rng, 3 * 10 ** 15),
+        'extraData': random_hex(rng, 12),
+        'gasLimit': '0x98bc2b',
+        'gasUsed': random_quantity(rng, 10 ** 7),
+        'hash': block_hash,
+        'logsBloom': random_hex(rng, 256),
+        'miner': random_hex(rng, 20),
+        'mixHash': random_hex(rng, 32),
+        'nonce': random_hex(rng, 8),
+        'number': block_number,
+        'parentHash': random_hex(rng, 32),
+        'receiptsRoot': random_hex(rng, 32),
+        'sha3Uncles': random_hex(rng, 32),
+        'size': random_quantity(rng, 10 ** 5),
+        'stateRoot': random_hex(rng, 32),
+        'timestamp': '0x5e0be0ff',
+        'totalDifficulty': random_quantity(rng, 10 ** 22),
+        'transactions': [
+            build_transaction(rng, block_hash, block_number, index)
+            for index in range(transaction_count)
+        ],
+        'transactionsRoot': random_hex(rng, 32),
+        'uncles': [random_hex(rng, 32) for _ in range(rng.choice((0, 0, 1)))],
+    }
+
+
+def load_block(path: str) -> Dict[str, Any]:
+    with open(path) as fixture:
+        block = json.load(fixture)
+    # accept whole JSON-RPC responses as well as their results
+    return block.get('result', block)
+
+
+class BlockProvider(BaseProvider):
+    def __init__(self, block: Dict[str, Any]) -> None:
+        self.block = block
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return {'jsonrpc': '2.0', 'id': 0, 'result': self.block}
+
+
+def chained_formatter(block: Dict[str, Any]) -> Any:
+    return AttributeDict.recursive(block_formatter(block))
+
+
+def build_web3(block: Dict[str, Any], fused: bool, geth_poa: bool) -> Web3:
+    w3 = Web3(BlockProvider(block))
+    if not fused:
+        # type ignored b/c NamedElementOnion.replace annotates the new element as a name
+        w3.middleware_onion.replace('pythonic', _pythonic_middleware)  # type: ignore
+    if geth_poa:
+        w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+    return w3
+
+
+def benchmark_blocks(
+    blocks: Sequence[Tuple[str, Dict[str, Any]]], repeat: int, number: int, geth_poa: bool
+) -> Iterator[List[Any]]:
+    for name, block in blocks:
+        assert chained_formatter(block) == attrdict_block_formatter(block)
+        chained = measure(lambda: chained_formatter(block), repeat, number)
+        fused = measure(lambda: attrdict_block_formatter(block), repeat, number)
+        yield format_row(name, block, 'formatters', chained, fused)
+
+        chained_w3 = build_web3(block, fused=False, geth_poa=geth_poa)
+        fused_w3 = build_web3(block, fused=True, geth_poa=geth_poa)
+        chained = measure(
+            lambda: chained_w3.manager.request_blocking(GET_BLOCK_BY_NUMBER, ['latest', True]),
+            repeat,
+            number,
+        )
+        fused = measure(
+            lambda: fused_w3.manager.request_blocking(GET_BLOCK_BY_NUMBER, ['latest', True]),
+            repeat,
+            number,
+        )
+        yield format_row(name, block, 'middlewares', chained, fused)
+
+
+def format_row(
+    name: str,
+    block: Dict[str, Any],
+    path: str,
+    chained: Dict[str, float],
+    fused: Dict[str, float],
+) -> List[Any]:
+    return [
+        name,
+        len(block['transactions']),
+        path,
+        '{0:.2f}'.format(chained['median'] * 1000),
+        '{0:.2f}'.format(fused['median'] * 1000),
+        '{0:.2f}x'.format(chained['median'] / fused['median']),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--transactions', type=int, nargs='+', default=[50, 200, 500],
+        help='numbers of transactions in the generated blocks',
+    )
+    parser.add_argument(
+        '--fixtures', nargs='*', default=[],
+        help='JSON files of recorded blocks to format instead of generated ones',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=10, help='calls per repeat')
+    parser.add_argument(
+        '--geth-poa', action='store_true',
+        help='add the geth_poa_middleware to the middleware stacks',
+    )
+    args = parser.parse_args()
+
+    if args.fixtures:
+        blocks = [(path, load_block(path)) for path in args.fixtures]
+    else:
+        blocks = [
+            ('generated', build_block(count, seed))
+            for seed, count in enumerate(args.transactions)
+        ]
+    rows = list(benchmark_blocks(blocks, args.repeat, args.number, args.geth_poa))
+    print(format_table(
+        ['block', 'transactions', 'path', 'chained (ms)', 'fused (ms)', 'speedup'], rows,
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""
+Benchmarks reading large JSON-RPC responses over an IPC socket.
+
+A local Unix socket server answers every request with a synthetic
+``eth_getLogs`` style response of the requested size.  Each size is read with
+the streaming ``JSONFramer`` based ``IPCProvider`` at several receive sizes and
+with the previous implementation, which re-checked and re-decoded the whole
+response after every chunk.
+
+Usage::
+
+    python -m web3.tools.benchmark.ipc --sizes 1 4 16 --repeat 5
+"""
+import argparse
+import json
+from json import (
+    JSONDecodeError,
+)
+import os
+import socket
+import tempfile
+import threading
+from typing import (
+    Any,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from web3._utils.threads import (
+    Timeout,
+)
+from web3.providers.ipc import (
+    DEFAULT_RECV_SIZE,
+    IPCProvider,
+    has_valid_json_rpc_ending,
+)
+from web3.tools.benchmark.utils import (
+    format_table,
+    measure,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+MEGABYTE = 1024 * 1024
+GET_LOGS = RPCEndpoint('eth_getLogs')
+
+
+def build_payload(size: int) -> bytes:
+    """
+    Returns an encoded JSON-RPC response of roughly ``size`` bytes, made of
+    log entries like the ones returned by ``eth_getLogs``.
+    """
+    log_entry = {
+        'address': '0x' + 'ab' * 20,
+        'blockHash': '0x' + '12' * 32,
+        'blockNumber': '0x1b4',
+        'data': '0x' + '00' * 256,
+        'logIndex': '0x0',
+        'removed': False,
+        'topics': ['0x' + '34' * 32, '0x' + '56' * 32],
+        'transactionHash': '0x' + '78' * 32,
+        'transactionIndex': '0x0',
+    }
+    entry_size = len(json.dumps(log_entry)) + 2
+    result = [log_entry] * max(1, size // entry_size)
+    return json.dumps({'jsonrpc': '2.0', 'id': 0, 'result': result}).encode()
+
+
+class LegacyIPCProvider(IPCProvider):
+    """
+    Reads responses the way ``IPCProvider`` did before streaming framing, for
+    comparison.
+    """
+    def _make_raw_request(self, request_key: Any, request: bytes) -> Any:
+        with self._socket_pool.checkout() as persistant_socket, persistant_socket as sock:
+            sock.sendall(request)
+
+            raw_response = b""
+            with Timeout(self.timeout) as timeout:
+                while True:
+                    try:
+                        raw_response += sock.recv(4096)
+                    except socket.timeout:
+                        timeout.sleep(0)
+                        continue
+                    if raw_response == b"":
+                        timeout.sleep(0)
+                    elif has_valid_json_rpc_ending(raw_response):
+                        try:
+                            response = self.decode_rpc_response(raw_response)
+                        except JSONDecodeError:
+                            timeout.sleep(0)
+                            continue
+                        else:
+                            return response
+                    else:
+                        timeout.sleep(0)
+                        continue
+
+
+def serve_connection(connection: socket.socket, payload: bytes) -> None:
+    with connection:
+        while connection.recv(65536):
+            connection.sendall(payload)
+
+
+def serve_payload(server: socket.socket, payload: bytes) -> None:
+    while True:
+        try:
+            connection, _ = server.accept()
+        except OSError:
+            # the listening socket was closed
+            return
+        threading.Thread(
+            target=serve_connection, args=(connection, payload), daemon=True
+        ).start()
+
+
+class PayloadServer:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.ipc_path = os.path.join(self._temp_dir.name, 'benchmark.ipc')
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    def __enter__(self) -> "PayloadServer":
+        self._server.bind(self.ipc_path)
+        self._server.listen(4)
+        thread = threading.Thread(
+            target=serve_payload, args=(self._server, self.payload), daemon=True
+        )
+        thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.close()
+        self._temp_dir.cleanup()
+
+
+def benchmark_providers(
+    sizes: Sequence[int], recv_sizes: Sequence[int], repeat: int, legacy_limit: int
+) -> Iterator[List[Any]]:
+    for size in sizes:
+        payload = build_payload(size * MEGABYTE)
+        with PayloadServer(payload) as server:
+            providers: List[Tuple[str, IPCProvider]] = [
+                (
+                    'recv_size={0}'.format(recv_size),
+                    IPCProvider(server.ipc_path, recv_size=recv_size),
+                )
+                for recv_size in recv_sizes
+            ]
+            if size <= legacy_limit:
+                providers.append(('legacy', LegacyIPCProvider(server.ipc_path)))
+            for name, provider in providers:
+                # the first request also opens the connection
+                assert len(provider.make_request(GET_LOGS, [])['result']) > 0
+                timing = measure(lambda: provider.make_request(GET_LOGS, []), repeat=repeat)
+                yield [
+                    '{0:.1f}'.format(len(payload) / MEGABYTE),
+                    name,
+                    '{0:.4f}'.format(timing['min']),
+                    '{0:.4f}'.format(timing['median']),
+                    '{0:.1f}'.format(len(payload) / MEGABYTE / timing['min']),
+                ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1, 4, 16],
+        help='response sizes to read, in MB',
+    )
+    parser.add_argument(
+        '--recv-sizes', type=int, nargs='+', default=[4096, DEFAULT_RECV_SIZE],
+        help='IPCProvider receive sizes to compare',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--legacy-limit', type=int, default=4,
+        help='largest size, in MB, to also read with the previous implementation',
+    )
+    args = parser.parse_args()
+
+    rows = list(benchmark_providers(args.sizes, args.recv_sizes, args.repeat, args.legacy_limit))
+    print(format_table(['MB', 'reader', 'min (s)', 'median (s)', 'MB/s'], rows))
+
+
+if __name__ == '__main__':
+    main()
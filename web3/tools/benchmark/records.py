@@ -0,0 +1,140 @@
+"""
+Benchmarks the memory and speed of records against AttributeDicts.
+
+Logs and block headers are formatted by the pythonic
+formatters, then converted into AttributeDicts, as by the attrdict middleware,
+and into records, as by the record middleware.  For each representation the
+benchmark reports the memory held per result, and the time taken to convert
+the results, to read a field from each, and to hash them.
+
+Usage::
+
+    python -m web3.tools.benchmark.records --logs 100000 --repeat 5
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+)
+
+from web3._utils.method_formatters import (
+    block_formatter,
+    log_entry_formatter,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.records import (
+    BlockRecord,
+    LogRecord,
+)
+from web3.tools.benchmark.formatting import (
+    build_block,
+    random_hex,
+)
+from web3.tools.benchmark.utils import (
+    format_table,
+    measure,
+)
+
+
+def build_log(rng: random.Random, index: int) -> Dict[str, Any]:
+    """
+    Returns a formatted log of an ERC20 transfer, with its topics in a tuple
+    so that it can be hashed.
+    """
+    log = log_entry_formatter({
+        'address': random_hex(rng, 20),
+        'blockHash': random_hex(rng, 32),
+        'blockNumber': hex(9000000 + index // 100),
+        'data': random_hex(rng, 32),
+        'logIndex': hex(index % 100),
+        'removed': False,
+        'topics': [random_hex(rng, 32) for _ in range(3)],
+        'transactionHash': random_hex(rng, 32),
+        'transactionIndex': hex(index % 100),
+    })
+    return dict(log, topics=tuple(log['topics']))
+
+
+def measure_memory(convert: Callable[[Any], Any], values: Sequence[Any]) -> int:
+    """
+    Returns the bytes allocated by converting each of ``values``, and still
+    held once they are converted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        converted = [convert(value) for value in values]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del converted
+    return size
+
+
+def benchmark_representation(
+    name: str,
+    convert: Callable[[Any], Any],
+    values: Sequence[Any],
+    field: str,
+    repeat: int,
+) -> List[Any]:
+    converted = [convert(value) for value in values]
+    conversion = measure(lambda: [convert(value) for value in values], repeat)
+    access = measure(lambda: [getattr(value, field) for value in converted], repeat)
+    hashing = measure(lambda: [hash(value) for value in converted], repeat)
+    return [
+        name,
+        len(values),
+        measure_memory(convert, values) // len(values),
+        '{0:.2f}'.format(conversion['median'] * 1000),
+        '{0:.2f}'.format(access['median'] * 1000),
+        '{0:.2f}'.format(hashing['median'] * 1000),
+    ]
+
+
+def benchmark_records(logs: int, blocks: int, repeat: int) -> Iterator[List[Any]]:
+    rng = random.Random(0)
+    formatted_logs = [build_log(rng, index) for index in range(logs)]
+    yield benchmark_representation(
+        'AttributeDict logs', AttributeDict.recursive, formatted_logs, 'topics', repeat,
+    )
+    yield benchmark_representation('LogRecord logs', LogRecord, formatted_logs, 'topics', repeat)
+
+    formatted_blocks = [
+        # without transactions, which would make the blocks unhashable
+        dict(block_formatter(build_block(0, seed)), transactions=(), uncles=())
+        for seed in range(blocks)
+    ]
+    yield benchmark_representation(
+        'AttributeDict blocks', AttributeDict.recursive, formatted_blocks, 'hash', repeat,
+    )
+    yield benchmark_representation(
+        'BlockRecord blocks', BlockRecord, formatted_blocks, 'hash', repeat,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--logs', type=int, default=100000)
+    parser.add_argument('--blocks', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = list(benchmark_records(args.logs, args.blocks, args.repeat))
+    print(format_table(
+        ['representation', 'count', 'bytes each', 'convert (ms)', 'read (ms)', 'hash (ms)'],
+        rows,
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+import statistics
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Sequence,
+)
+
+
+def measure(fn: Callable[[], Any], repeat: int=5, number: int=1) -> Dict[str, float]:
+    """
+    Times ``number`` calls of ``fn``, ``repeat`` times over, and returns the
+    best and median time per call in seconds.
+    """
+    timings = [
+        total / number
+        for total in timeit.repeat(fn, repeat=repeat, number=number)
+    ]
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+    }
+
+
+def format_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    cells = [[str(header) for header in headers]] + [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(row[column]) for row in cells) for column in range(len(headers))]
+    lines = [
+        '  '.join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in cells
+    ]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
@@ -136,6 +136,9 @@ class FilterParams(TypedDict, total=False):
     topics: Sequence[Optional[Union[_Hash32, Sequence[_Hash32]]]]
 
 
+SubscriptionType = Literal["newHeads", "logs", "newPendingTransactions", "syncing"]
+
+
 class LogReceipt(TypedDict):
     address: ChecksumAddress
     blockHash: HexBytes